@@ -0,0 +1,61 @@
+# -*- encoding: utf-8 -*-
+"""
+Micro benchmark of repeated qb64 encodings of primitives recomputed on every
+access versus memoized on first access, plus event ingest rate of a Kevery.
+
+Usage:
+    python scripts/bench/encode.py --count 100000 --events 200
+
+"""
+import argparse
+import time
+
+from keri.app import habbing
+from keri.core import coring, eventing, parsing
+from keri.core.coring import MtrDex, Nexter
+
+
+def rate(fn, count):
+    """ Returns calls per second of fn() over count calls """
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark memoized primitive encodings")
+    parser.add_argument("--count", type=int, default=100000, help="number of encodings")
+    parser.add_argument("--events", type=int, default=200, help="number of rotations in ingested KEL")
+    args = parser.parse_args()
+
+    signers = coring.generateSigners(salt=b'0123456789abcdef', count=1)
+    serder = eventing.incept(keys=[signers[0].verfer.qb64],
+                             nxt=Nexter(keys=[signers[0].verfer.qb64]).qb64,
+                             code=MtrDex.Blake3_256)
+    prims = dict(verfer=coring.Verfer(qb64b=signers[0].verfer.qb64b),
+                 siger=coring.Siger(qb2=signers[0].sign(serder.raw, index=0).qb2),
+                 counter=coring.Counter(qb2=coring.Counter(code=coring.CtrDex.ControllerIdxSigs).qb2))
+
+    for name, prim in prims.items():
+        fresh = rate(lambda: prim._infil().decode("utf-8"), args.count)
+        memo = rate(lambda: prim.qb64, args.count)
+        print(f"{name:<8} qb64 fresh {fresh:12.0f}/sec  memo {memo:12.0f}/sec  x{memo / fresh:.1f}")
+
+    with habbing.openHby(name="bench", base="bench", temp=True) as hby:
+        hab = hby.makeHab(name="bench", isith="1", icount=1)
+        for _ in range(args.events):
+            hab.rotate()
+        msgs = bytearray(hab.replay())
+
+        with habbing.openHby(name="ingest", base="bench", temp=True) as ihby:
+            kvy = eventing.Kevery(db=ihby.db, lax=True, local=False)
+            start = time.perf_counter()
+            parsing.Parser(kvy=kvy).parse(ims=msgs)
+            elapsed = time.perf_counter() - start
+            assert kvy.kevers[hab.pre].sn == args.events
+            print(f"ingest   {(args.events + 1) / elapsed:12.0f} events/sec")
+
+
+if __name__ == "__main__":
+    main()
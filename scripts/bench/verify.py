@@ -0,0 +1,60 @@
+# -*- encoding: utf-8 -*-
+"""
+Benchmark of signature verifications per second inline versus on a Verexer
+parallel verification executor for an increasing number of workers.
+
+Usage:
+    python scripts/bench/verify.py --count 4096 --keys 16
+
+"""
+import argparse
+import os
+import time
+
+from keri.core import coring, eventing
+from keri.core.coring import MtrDex, Nexter
+
+
+def bench(verify, triples, repeat=3):
+    """ Returns best verifications per second of verify(triples) over repeat runs """
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = verify(triples)
+        elapsed = time.perf_counter() - start
+        assert all(results)
+        best = max(best, len(triples) / elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel signature verification")
+    parser.add_argument("--count", type=int, default=4096, help="number of signatures to verify")
+    parser.add_argument("--keys", type=int, default=16, help="number of controller keys of event")
+    parser.add_argument("--process", action="store_true", help="use process pool instead of threads")
+    args = parser.parse_args()
+
+    coring.Verfer.Cache = coring.Vercache(size=0)  # measure verification not memo
+
+    signers = coring.generateSigners(salt=b'0123456789abcdef', count=args.keys)
+    keys = [signer.verfer.qb64 for signer in signers]
+    serder = eventing.incept(keys=keys, sith="1", nxt=Nexter(keys=keys).qb64,
+                             code=MtrDex.Blake3_256)
+    sigers = [signer.sign(serder.raw, index=i) for i, signer in enumerate(signers)]
+    triples = [(signers[i % args.keys].verfer, sigers[i % args.keys].raw, serder.raw)
+               for i in range(args.count)]
+
+    inline = bench(lambda t: eventing.verifyAll(t), triples)
+    print(f"cores={os.cpu_count()} sigs={args.count} process={args.process}")
+    print(f"inline      {inline:10.0f} verifications/sec")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with eventing.Verexer(workers=workers, chunk=64, process=args.process) as vex:
+            rate = bench(vex.verify, triples)
+        print(f"workers={workers:<3} {rate:10.0f} verifications/sec  x{rate / inline:.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,9 @@ keri.app.agenting module
 
 """
 import random
+from collections import deque
 
-from hio.base import doing
-from hio.core import http
+from hio.base import doing, tyming
 from hio.core.tcp import clienting
 from hio.help import decking
 
@@ -24,29 +24,66 @@ logger = help.ogler.getLogger()
 class WitnessReceiptor(doing.DoDoer):
     """
     Sends messages to all current witnesses of given identifier (from hab) and waits
-    for receipts from each of those witnesses and propagates those receipts to each
-    of the other witnesses after receiving the complete set.
-
-    Removes all Doers and exits as Done once all witnesses have been sent the entire
-    receipt set.  Could be enhanced to have a `once` method that runs once and cleans up
-    and an `all` method that runs and waits for more messages to receipt.
+    for receipts from those witnesses. Each receipt is propagated to the other
+    witnesses as soon as it arrives.
+
+    Sets .complete as soon as the witness threshold, toad, of the identifier is
+    satisfied, or to False once it can no longer be satisfied, so one slow or dead
+    witness does not stall the controller. Callers wait for .complete to not be
+    None and must handle False as an unwitnessed event.
+
+    Delivery continues in the background after .complete is set, so callers must
+    not remove the receiptor once .complete is set but leave it running in their
+    DoDoer to keep delivering to the remaining witnesses. A witness that has
+    not receipted within .timeout seconds is sent the event again on a fresh
+    connection up to .retries times, and each receipt that arrives is still sent
+    to the other witnesses. Removes all Doers and exits as Done once every witness
+    has receipted or run out of retries. When given the parent DoDoer it was
+    extended into then also removes itself from the parent so long running
+    parents do not accumulate finished receiptors in their .doers.
+
+    Receipt arrival is noted in memory by the database, see Baser.watchWigs, so
+    waiting does not read the database every tock.
+
+    Class Attributes:
+        Timeout (float): default seconds to wait for receipt from each witness
+        Retries (int): default number of resends to each silent witness
+
+    Attributes:
+        timeout (float): seconds to wait for receipt from each witness
+        retries (int): number of resends to each silent witness
+        complete (bool | None): True means witness threshold satisfied,
+            False means threshold unreachable, None means not yet known
+        parent (DoDoer | None): DoDoer that runs this receiptor if any
 
     """
+    Timeout = 10.0
+    Retries = 3
 
-    def __init__(self, hab, msg=None, klas=None, **kwa):
+    def __init__(self, hab, msg=None, klas=None, timeout=None, retries=None,
+                 parent=None, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
-        gather all receipts and send them to all other witnesses
+        gather receipts and send each to all other witnesses
 
         Parameters:
             hab: Habitat of the identifier to populate witnesses
             msg: is the message to send to all witnesses.
                  Defaults to sending the latest KEL event if msg is None
+            klas: witnesser class used to talk to each witness
+            timeout (float): seconds to wait for receipt from each witness
+            retries (int): number of resends to each silent witness
+            parent (DoDoer): DoDoer this receiptor is extended into from which
+                it removes itself once done
 
         """
         self.hab = hab
         self.msg = msg
         self.klas = klas if klas is not None else HttpWitnesser
+        self.timeout = timeout if timeout is not None else self.Timeout
+        self.retries = retries if retries is not None else self.Retries
+        self.complete = None
+        self.parent = parent
         super(WitnessReceiptor, self).__init__(doers=[doing.doify(self.receiptDo)], **kwa)
 
     def receiptDo(self, tymth=None, tock=0.0, **opts):
@@ -68,53 +105,124 @@ class WitnessReceiptor(doing.DoDoer):
         _ = (yield self.tock)
         sn = self.hab.kever.sn
         wits = self.hab.kever.wits
+        toad = self.hab.kever.toad
 
         if len(wits) == 0:
+            self.complete = True
+            self.detach()
             return True
 
         msg = self.msg if self.msg is not None else self.hab.makeOwnEvent(sn=sn)
         ser = coring.Serder(raw=msg)
-
-        witers = []
-        for wit in wits:
-            witer = self.klas(hab=self.hab, wit=wit)
-            witers.append(witer)
-            witer.msgs.append(bytearray(msg))  # make a copy
-            self.extend([witer])
-
-            _ = (yield self.tock)
+        rserder = eventing.receipt(pre=ser.pre,
+                                   sn=ser.sn,  # msg may be earlier than latest event
+                                   said=ser.said)
 
         dgkey = dbing.dgKey(ser.preb, ser.saidb)
-        while True:
-            wigs = self.hab.db.getWigs(dgkey)
-            if len(wigs) == len(wits):
-                break
-            _ = yield self.tock
+        notes = self.hab.db.watchWigs(dgkey)  # watch before read
+        try:
+            wigers = dict()  # receipts so far keyed by witness index
+            for wig in self.hab.db.getWigs(dgkey):
+                wiger = coring.Siger(qb64b=bytes(wig))
+                wigers[wiger.index] = wiger
+
+            witers = dict()
+            tymers = dict()
+            tries = dict()
+            for idx, wit in enumerate(wits):
+                witers[wit] = self.witness(wit=wit, msg=msg, rserder=rserder,
+                                           wigers=[wiger for wiger in wigers.values()
+                                                   if wiger.index != idx])
+                tymers[wit] = tyming.Tymer(tymth=self.tymth, duration=self.timeout)
+                tries[wit] = 0
+                _ = (yield self.tock)
+
+            tymer = None  # bounds final delivery of queued receipts
+            while True:
+                fresh = []
+                for wig in notes:
+                    wiger = coring.Siger(qb64b=wig)
+                    if wiger.index < len(wits) and wiger.index not in wigers:
+                        wigers[wiger.index] = wiger
+                        fresh.append(wiger)
+                notes.clear()
+
+                if fresh:  # send each new receipt to all other witnesses now
+                    for idx, wit in enumerate(wits):
+                        others = [wiger for wiger in fresh if wiger.index != idx]
+                        if others:
+                            witers[wit].msgs.append(eventing.messagize(serder=rserder,
+                                                                       wigers=others))
+
+                silent = [wit for idx, wit in enumerate(wits) if idx not in wigers]
+                for wit in silent:
+                    if tries[wit] < self.retries and tymers[wit].expired:
+                        logger.info("WitnessReceiptor: no receipt from %s for %s, "
+                                    "resending", wit, ser.said)
+                        self.remove([witers[wit]])  # releases any stalled connection
+                        idx = wits.index(wit)
+                        witers[wit] = self.witness(wit=wit, msg=msg, rserder=rserder,
+                                                   wigers=[wiger for wiger in wigers.values()
+                                                           if wiger.index != idx])
+                        tymers[wit].restart()
+                        tries[wit] += 1
+
+                trying = [wit for wit in silent
+                          if tries[wit] < self.retries or not tymers[wit].expired]
+                if self.complete is None:
+                    if len(wigers) >= toad:
+                        self.complete = True
+                    elif len(wigers) + len(trying) < toad:
+                        logger.error("WitnessReceiptor: witness threshold %s unreachable "
+                                     "for %s with %s receipts", toad, ser.said, len(wigers))
+                        self.complete = False
+
+                if not trying:  # let receipted witnesses finish receiving their receipts
+                    if tymer is None:
+                        tymer = tyming.Tymer(tymth=self.tymth, duration=self.timeout)
+                    receipted = [witers[wits[idx]] for idx in wigers]
+                    if all(witer.idle for witer in receipted) or tymer.expired:
+                        break
 
-        # generate all rct msgs to send to all witnesses
-        wigers = [coring.Siger(qb64b=bytes(wig)) for wig in wigs]
-        rserder = eventing.receipt(pre=ser.pre,
-                                   sn=sn,
-                                   said=ser.said)
-        rctMsg = eventing.messagize(serder=rserder, wigers=wigers)
+                _ = (yield self.tock)
 
-        # this is a little brute forcey and can be improved by gathering receipts
-        # along the way and passing them out as we go and only sending the
-        # required ones here
-        for witer in witers:
-            witer.msgs.append(bytearray(rctMsg))
-            _ = (yield self.tock)
+            self.remove(list(witers.values()))
 
-        total = len(witers) * 2
-        count = 0
-        while count < total:
-            for witer in witers:
-                count += len(witer.sent)
-            _ = (yield self.tock)
+        finally:
+            self.hab.db.unwatchWigs(dgkey, notes)
 
-        self.remove(witers)
+        self.detach()
         return True
 
+    def detach(self):
+        """
+        Remove self from .parent if any so finished receiptor is not kept in
+        .parent.doers. Only called from .receiptDo whose own deed is running so
+        not in .parent.deeds and is not closed by the removal.
+        """
+        if self.parent is not None:
+            self.parent.remove([self])
+            self.parent = None
+
+    def witness(self, wit, msg, rserder, wigers):
+        """
+        Returns new witnesser for witness wit with msg and receipt of wigers
+        queued and runs it
+
+        Parameters:
+            wit (str): qb64 prefix of witness
+            msg (bytes): event message with attachments to receipt
+            rserder (Serder): receipt message of event
+            wigers (list): of witness indexed Siger receipts of event to propagate
+
+        """
+        witer = self.klas(hab=self.hab, wit=wit)
+        witer.msgs.append(bytearray(msg))  # make a copy
+        if wigers:
+            witer.msgs.append(eventing.messagize(serder=rserder, wigers=wigers))
+        self.extend([witer])
+        return witer
+
 
 class WitnessInquisitor(doing.DoDoer):
     """
@@ -163,7 +271,7 @@ class WitnessInquisitor(doing.DoDoer):
 
         witers = []
         for wit in wits:
-            witer = self.klas(hab=self.hab, wit=wit, lax=True, local=False)
+            witer = self.klas(hab=self.hab, wit=wit, held=True, lax=True, local=False)
             witers.append(witer)
 
         self.extend(witers)
@@ -214,6 +322,8 @@ class WitnessPublisher(doing.DoDoer):
             hab: Habitat of the identifier to populate witnesses
             msg: is the message to send to all witnesses.
                  Defaults to sending the latest KEL event if msg is None
+                 May be list of messages which are queued together so that
+                 witnessers may coalesce them into one request
 
         """
         self.hab = hab
@@ -236,11 +346,13 @@ class WitnessPublisher(doing.DoDoer):
         if len(self.wits) == 0:
             return True
 
+        msgs = self.msg if isinstance(self.msg, list) else [self.msg]
         witers = []
         for wit in self.wits:
             witer = self.klas(hab=self.hab, wit=wit)
             witers.append(witer)
-            witer.msgs.append(bytearray(self.msg))  # make a copy so everyone munges their own
+            for msg in msgs:
+                witer.msgs.append(bytearray(msg))  # make a copy so everyone munges their own
             self.extend([witer])
 
             _ = (yield self.tock)
@@ -261,13 +373,14 @@ class TCPWitnesser(doing.DoDoer):
 
     """
 
-    def __init__(self, hab, wit, msgs=None, sent=None, doers=None, **kwa):
+    def __init__(self, hab, wit, msgs=None, sent=None, doers=None, held=False, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
 
         Parameters:
             hab: Habitat of the identifier to populate witnesses
+            held (bool): ignored as TCP clients are not pooled, see HttpWitnesser
 
         """
         self.hab = hab
@@ -278,11 +391,19 @@ class TCPWitnesser(doing.DoDoer):
         doers = doers if doers is not None else []
         doers.extend([doing.doify(self.receiptDo)])
 
+        self.client = None
         self.kevery = eventing.Kevery(db=self.hab.db,
                                       **kwa)
 
         super(TCPWitnesser, self).__init__(doers=doers)
 
+    @property
+    def idle(self):
+        """
+        Returns True when all queued messages have been transmitted
+        """
+        return not self.msgs and self.client is not None and not self.client.txbs
+
     def receiptDo(self, tymth=None, tock=0.0):
         """
         Returns doifiable Doist compatible generator method (doer dog)
@@ -295,7 +416,7 @@ class TCPWitnesser(doing.DoDoer):
         _ = (yield self.tock)
 
         loc = obtaining.getwitnessbyprefix(self.wit)
-        client = clienting.Client(host=loc.ip4, port=loc.tcp)
+        self.client = client = clienting.Client(host=loc.ip4, port=loc.tcp)
         self.parser = parsing.Parser(ims=client.rxbs,
                                      framed=True,
                                      kvy=self.kevery)
@@ -344,21 +465,34 @@ class HttpWitnesser(doing.DoDoer):
     """
     Interacts with Witnesses on HTTP and SSE for sending events and receiving receipts
 
+    When batch is True consecutive queued KEL and TEL messages are coalesced into
+    one CESR stream request instead of one request per message. Each queued
+    msg may itself hold many messages with attachments. When the witness has no
+    CESR stream endpoint the batch is resent one request per message and the
+    endpoint is remembered in .hab.clienter.streamless so later batches skip it.
+
     """
 
-    def __init__(self, hab, wit, msgs=None, sent=None, doers=None, **kwa):
+    def __init__(self, hab, wit, msgs=None, sent=None, doers=None, batch=True,
+                 held=False, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
 
         Parameters:
             hab: Habitat of the identifier to populate witnesses
+            batch (bool): True means coalesce queued KEL and TEL messages into
+                one CESR stream request. False means one request per message
+            held (bool): True means long-lived witnesser with its own client not
+                counted against the per endpoint limit of .hab.clienter
 
         """
         self.hab = hab
         self.wit = wit
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = sent if sent is not None else decking.Deck()
+        self.batch = True if batch else False
+        self.streams = deque()  # batches of msgs awaiting stream response
         self.parser = None
         doers = doers if doers is not None else []
         doers.extend([doing.doify(self.msgDo), doing.doify(self.responseDo)])
@@ -369,13 +503,27 @@ class HttpWitnesser(doing.DoDoer):
 
         loc = obtaining.getwitnessbyprefix(self.wit)
 
-        self.client = http.clienting.Client(hostname=loc.ip4, port=loc.http)
-        clientDoer = http.clienting.ClientDoer(client=self.client)
-
-        doers.extend([clientDoer])
+        self.leaser = self.hab.clienter.lease(hostname=loc.ip4, port=loc.http, held=held)
+        doers.extend([self.leaser])
 
         super(HttpWitnesser, self).__init__(doers=doers, **kwa)
 
+    @property
+    def client(self):
+        """
+        Returns hio http Client leased from .hab.clienter or None when not
+        yet acquired
+        """
+        return self.leaser.client
+
+    @property
+    def idle(self):
+        """
+        Returns True when all queued messages have been sent and answered
+        """
+        return (not self.msgs and self.client is not None
+                and not self.client.requests and not self.client.waited)
+
     def msgDo(self, tymth=None, tock=0.0):
         """
         Returns doifiable Doist compatible generator method (doer dog)
@@ -388,11 +536,20 @@ class HttpWitnesser(doing.DoDoer):
         _ = (yield self.tock)
 
         while True:
-            while not self.msgs:
+            while not self.msgs or self.client is None:
                 yield self.tock
 
-            msg = self.msgs.popleft()
-            httping.createCESRRequest(msg, self.client)
+            msgs = []
+            batch = self.batch and self.leaser.key not in self.hab.clienter.streamless
+            while batch and self.msgs and httping.streamable(self.msgs[0]):
+                msgs.append(self.msgs.popleft())
+
+            if msgs:  # any number of messages in one stream request
+                self.streams.append(msgs)
+                httping.createCESRStreamRequest(msgs, self.client)
+            else:
+                httping.createCESRRequest(self.msgs.popleft(), self.client)
+
             while self.client.requests:
                 yield self.tock
 
@@ -408,13 +565,40 @@ class HttpWitnesser(doing.DoDoer):
         _ = (yield self.tock)
 
         while True:
-            while not self.client.responses:
+            while self.client is not None and self.client.responses:
                 rep = self.client.respond()
+                if rep.request["path"] == httping.CESR_STREAM_PATH and self.streams:
+                    msgs = self.streams.popleft()
+                    if rep.status in httping.CESR_STREAM_REJECTS:  # no stream endpoint
+                        logger.info("HttpWitnesser: %s rejected CESR stream with %s, "
+                                    "sending per message", self.wit, rep.status)
+                        self.hab.clienter.streamless.add(self.leaser.key)
+                        self.msgs.extendleft(reversed(msgs))  # resend in order
+                        continue
+
                 self.sent.append(rep)
                 yield
             yield
 
 
+def healthy(hab, wits):
+    """
+    Returns list of those wits whose http endpoints are healthy in the connection
+    pool of hab. Returns all wits when none is healthy so callers always have a choice.
+
+    Parameters:
+        hab (Hab): habitat whose .clienter tracks endpoint health
+        wits (list): qb64 prefixes of witnesses
+
+    """
+    oks = []
+    for wit in wits:
+        loc = obtaining.getwitnessbyprefix(wit)
+        if loc is not None and hab.clienter.healthy(hostname=loc.ip4, port=loc.http):
+            oks.append(wit)
+    return oks if oks else list(wits)
+
+
 class BackoffWitnessQuery(doing.DoDoer):
     """
     Queries selection of target witnesses randomly performing truncated exponential backoff
@@ -470,13 +654,14 @@ class BackoffWitnessQuery(doing.DoDoer):
                     if srdr is not None:
                         break
 
-            wit = random.choice(self.wits)
+            wit = random.choice(healthy(self.hab, self.wits))
             loc = obtaining.getwitnessbyprefix(wit)
 
-            client = http.clienting.Client(hostname=loc.ip4, port=loc.http)
-            clientDoer = http.clienting.ClientDoer(client=client)
-
+            clientDoer = self.hab.clienter.lease(hostname=loc.ip4, port=loc.http)
             self.extend([clientDoer])
+            while clientDoer.client is None:
+                yield self.tock
+            client = clientDoer.client
 
             msg = self.hab.query(self.pre, route="logs", query=dict())  # Query for remote pre Event
             httping.createCESRRequest(msg, client)
@@ -545,13 +730,14 @@ class BackoffWitnessTelQuery(doing.DoDoer):
                 if self.i is None or tever.vcState(self.i) is not None:
                     break
 
-            wit = random.choice(self.wits)
+            wit = random.choice(healthy(self.hab, self.wits))
             loc = obtaining.getwitnessbyprefix(wit)
 
-            client = http.clienting.Client(hostname=loc.ip4, port=loc.http)
-            clientDoer = http.clienting.ClientDoer(client=client)
-
+            clientDoer = self.hab.clienter.lease(hostname=loc.ip4, port=loc.http)
             self.extend([clientDoer])
+            while clientDoer.client is None:
+                yield self.tock
+            client = clientDoer.client
 
             msg = self.hab.query(self.i, route="tels", query=dict(ri=self.ri))  # Query for remote pre Event
 
@@ -58,6 +58,28 @@ parser.add_argument("-p", "--path",
                     action="store",
                     default=STATIC_DIR_PATH,
                     help="Location of the KIWI app bundle for this agent")
+parser.add_argument('--map-size',
+                    action='store',
+                    default=None,
+                    type=int,
+                    help="Initial LMDB map size in bytes of databases. Grows when full. Default is 10 MiB.")
+parser.add_argument('--max-readers',
+                    action='store',
+                    default=None,
+                    type=int,
+                    help="Maximum number of simultaneous LMDB read transactions. Default is 126.")
+parser.add_argument('--writemap',
+                    action='store_true',
+                    help="Use writeable LMDB memory map.")
+parser.add_argument('--map-async',
+                    action='store_true',
+                    help="Use asynchronous LMDB flushes with --writemap.")
+parser.add_argument('--no-sync',
+                    action='store_true',
+                    help="Do not flush LMDB to disk on each commit. Faster but last commits may be lost on crash.")
+parser.add_argument('--no-readahead',
+                    action='store_true',
+                    help="Disable OS read ahead on LMDB files.")
 
 
 def launch(args):
@@ -67,9 +89,18 @@ def launch(args):
     print("\n******* Starting Agent for {} listening: http/{}, tcp/{} "
           ".******\n\n".format(args.name, args.admin_http_port, args.tcp))
 
+    dbcfg = dict(mapSize=args.map_size,
+                 maxReaders=args.max_readers,
+                 writeMap=args.writemap,
+                 mapAsync=args.map_async,
+                 sync=not args.no_sync,
+                 metaSync=not args.no_sync,
+                 readAhead=not args.no_readahead)
+
     doers = runAgent(controller=args.controller, name=args.name, insecure=args.insecure,
                      tcp=int(args.tcp),
-                     adminHttpPort=int(args.admin_http_port), path=args.path)
+                     adminHttpPort=int(args.admin_http_port), path=args.path,
+                     dbcfg=dbcfg)
     try:
         tock = 0.03125
         doist = doing.Doist(limit=0.0, tock=tock, real=True)
@@ -81,19 +112,20 @@ def launch(args):
           ".******\n\n".format(args.name, args.admin_http_port, args.tcp))
 
 
-def runAgent(controller, name="agent", insecure=False, tcp=5621, adminHttpPort=5623, path=STATIC_DIR_PATH):
+def runAgent(controller, name="agent", insecure=False, tcp=5621, adminHttpPort=5623, path=STATIC_DIR_PATH,
+             dbcfg=None):
     """
     Setup and run one agent
     """
-
-    hab, doers = existing.setupHabitat(name=name)
+    dbcfg = dbcfg if dbcfg is not None else {}
+    hab, doers = existing.setupHabitat(name=name, dbcfg=dbcfg)
 
     # setup doers
     server = tcpServing.Server(host="", port=tcp)
     tcpServerDoer = tcpServing.ServerDoer(server=server)
     directant = directing.Directant(hab=hab, server=server)
 
-    reger = viring.Registry(name=hab.name, temp=False, db=hab.db)
+    reger = viring.Registry(name=hab.name, temp=False, db=hab.db, **dbcfg)
     verifier = verifying.Verifier(hab=hab, reger=reger)
     wallet = walleting.Wallet(reger=verifier.reger, name=name)
 
@@ -107,7 +139,7 @@ def runAgent(controller, name="agent", insecure=False, tcp=5621, adminHttpPort=5
     applyHandler = handling.ApplyHandler(hab=hab, verifier=verifier, name=name, issuerCues=issuerCues)
     proofHandler = handling.ProofHandler(proofs=proofs)
 
-    mbx = storing.Mailboxer(name=hab.name)
+    mbx = storing.Mailboxer(name=hab.name, **dbcfg)
     mih = grouping.MultisigInceptHandler(hab=hab, controller=controller, mbx=mbx)
     ish = grouping.MultisigIssueHandler(hab=hab, controller=controller, mbx=mbx)
     meh = grouping.MultisigEventHandler(hab=hab, verifier=verifier)
@@ -322,13 +354,14 @@ class AdminCueHandler(doing.DoDoer):
                     msg = self.hab.interact(data=[
                         dict(i=srdr.pre, s=srdr.ked["s"], d=srdr.said)
                     ])
-                    witRctDoer = agenting.WitnessReceiptor(hab=self.hab, msg=msg)
+                    witRctDoer = agenting.WitnessReceiptor(hab=self.hab, msg=msg, parent=self)
                     self.extend([witRctDoer])
 
-                    while not witRctDoer.done:
+                    while witRctDoer.complete is None:
                         yield self.tock
 
-                    self.remove([witRctDoer])
+                    if not witRctDoer.complete:
+                        print("Witness threshold not met for delegation approval of", srdr.pre)
                 if cue["kin"] == "delegatage":
                     delpre = cue["delpre"]
                     self.witq.query(pre=delpre)
@@ -357,12 +390,15 @@ class AdminCueHandler(doing.DoDoer):
                         self.hab.delegatedRotationAccepted()
                         evt = self.hab.makeOwnEvent(sn=self.hab.kever.sn)
                         witDoer = agenting.WitnessReceiptor(hab=self.hab, msg=bytearray(evt),
-                                                            klas=agenting.TCPWitnesser)
+                                                            klas=agenting.TCPWitnesser, parent=self)
                         self.extend([witDoer])
-                        while not witDoer.done:
+                        while witDoer.complete is None:
                             yield self.tock
 
-                        self.remove([witDoer])
+                        if not witDoer.complete:
+                            print("Witness threshold not met for delegated event", self.hab.kever.sn)
+                            continue
+
                         self.postman.send(recipient=self.hab.kever.delegator, topic="delegate", msg=bytearray(evt))
 
                         print("Successfully received delegation", "for", self.hab.kever.ilk, ":", self.hab.kever.sn)
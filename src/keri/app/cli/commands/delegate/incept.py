@@ -103,6 +103,8 @@ class DelegateInceptDoer(doing.DoDoer):
             yield self.tock
 
         rep = self.dcptr.cues.popleft()
+        if not rep["witnessed"]:
+            print(f'Witness threshold not met for delegated inception of {rep["pre"]}')
         print(f'Successfully delegated:')
         print(f'\tPrefix: {rep["pre"]}')
         print(f'\tDelegator: {rep["delegator"]}')
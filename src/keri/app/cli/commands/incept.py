@@ -107,6 +107,8 @@ class InceptDoer(doing.DoDoer):
         while not self.witDoer.done:
             _ = yield self.tock
 
+        if not self.witDoer.complete:
+            print(f'Witness threshold not met for event {self.hab.kever.sn}')
 
         print(f'Prefix  {self.hab.pre}')
         for idx, verfer in enumerate(self.hab.kever.verfers):
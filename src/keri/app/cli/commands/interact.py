@@ -117,6 +117,8 @@ class InteractDoer(doing.DoDoer):
         while not witDoer.done:
             _ = yield self.tock
 
+        if not witDoer.complete:
+            print(f'Witness threshold not met for event {self.hab.kever.sn}')
 
         print(f'Prefix  {self.hab.pre}')
         print(f'New Sequence No.  {self.hab.kever.sn}')
@@ -104,6 +104,8 @@ class GroupMultisigIncept(doing.DoDoer):
 
 
         print()
+        if not rep.get("witnessed", True):
+            print("Witness threshold not met for group inception.")
         print("Group Identifier Inception Complete:")
         displaying.printIdentifier(self.hab, rep["pre"])
 
@@ -128,16 +130,14 @@ class GroupMultisigIncept(doing.DoDoer):
                     if self.icpr.msgToSend is not None:
 
                         witRctDoer = agenting.WitnessReceiptor(hab=self.hab, msg=self.icpr.msgToSend,
-                                                               klas=agenting.TCPWitnesser)
+                                                               klas=agenting.TCPWitnesser, parent=self)
                         self.extend([witRctDoer])
 
-                        while not witRctDoer.done:
+                        while witRctDoer.complete is None:
                             _ = yield self.tock
 
-                        self.remove([witRctDoer])
-
                         serder = cue["serder"]
-                        self.icpr.cues.append(dict(pre=serder.pre))
+                        self.icpr.cues.append(dict(pre=serder.pre, witnessed=witRctDoer.complete))
                 elif cue["kin"] == "delegatage":
                     delpre = cue["delpre"]
                     self.witq.query(delpre)
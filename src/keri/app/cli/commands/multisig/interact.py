@@ -79,6 +79,8 @@ class GroupMultisigInteract(doing.DoDoer):
 
         rep = self.rotr.cues.popleft()
         print()
+        if not rep.get("witnessed", True):
+            print("Witness threshold not met for group event.")
         print("Group Identifier Interaction Complete:")
         displaying.printIdentifier(self.hab, rep["pre"])
 
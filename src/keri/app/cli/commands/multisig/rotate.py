@@ -87,6 +87,8 @@ class GroupMultisigRotate(doing.DoDoer):
 
         rep = self.rotr.cues.popleft()
         print()
+        if not rep.get("witnessed", True):
+            print("Witness threshold not met for group event.")
         print("Group Identifier Rotation Complete:")
         displaying.printIdentifier(self.hab, rep["pre"])
 
@@ -1,5 +1,6 @@
 import argparse
 import json
+import math
 
 from hio import help
 from hio.base import doing
@@ -25,6 +26,8 @@ parser.add_argument('--source', '-c', help='AC/DC Source links',
 parser.add_argument('--recipient', '-R', help='qb64 identifier prefix of the recipient of the credential',
                     default=None)
 parser.add_argument('--data', '-d', help='Credential data, \'@\' allowed', default=[], action="store", required=True)
+parser.add_argument('--batch', '-b', help='Credential data is a JSON array, issue one credential per element '
+                                          'anchored in bulk', action="store_true", default=False)
 
 
 def issueCredential(args):
@@ -41,6 +44,8 @@ def issueCredential(args):
     else:
         raise kering.ConfigurationError("data supplied must be value JSON to issue in a credential")
 
+    if args.batch and not (isinstance(data, list) and data):
+        raise kering.ConfigurationError("data supplied with --batch must be a non empty JSON array")
 
     issueDoer = CredentialIssuer(name=name, registryName=args.registry_name, schema=args.schema, source=args.source,
                                  recipient=args.recipient, data=data)
@@ -64,7 +69,7 @@ class CredentialIssuer(doing.DoDoer):
              schema:
              source:
              recipient:
-             data: (dict) credential data dict
+             data: (dict) credential data dict or (list) of credential data dicts to issue in bulk
         """
         self.name = name
         self.hab, doers = existing.setupHabitat(name=self.name)
@@ -102,28 +107,41 @@ class CredentialIssuer(doing.DoDoer):
 
         self.issr.msgs.append(self.msg)
 
-        creder = None
-        published = False
-        witnessed = False
+        data = self.msg["data"]
+        total = len(data) if isinstance(data, list) else 1
+        events = math.ceil(total / self.issr.issuer.BatchSize)  # anchoring key events
+
+        creders = []
+        published = 0
+        witnessed = 0
         finished = False
-        while not ((published and witnessed) or finished):
+        unwitnessed = False
+        while not ((published >= events and witnessed >= events) or finished or unwitnessed):
             while self.issr.cues:
                 cue = self.issr.cues.popleft()
                 if cue["kin"] == "saved":
-                    creder = cue["creder"]
+                    creders.append(cue["creder"])
 
                 if cue["kin"] == "finished":
                     finished = True
 
                 elif cue["kin"] == "published":
-                    published = True
+                    published += 1
 
                 elif cue["kin"] == "witnessed":
-                    witnessed = True
+                    witnessed += 1
+
+                elif cue["kin"] == "unwitnessed":
+                    unwitnessed = True
 
                 yield self.tock
             yield
 
+        if unwitnessed:
+            print("Witness threshold not met for issuance anchor, credentials not witnessed.")
+            self.remove(self.toRemove)
+            return
 
-        print(f"{creder.said} has been issued.")
+        for creder in creders:
+            print(f"{creder.said} has been issued.")
         self.remove(self.toRemove)
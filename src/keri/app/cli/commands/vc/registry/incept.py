@@ -72,15 +72,20 @@ class RegistryInceptor(doing.DoDoer):
         self.icpr.msgs.append(msg)
 
         regk = None
+        witnessed = True
         while not regk:
             while self.icpr.cues:
                 cue = self.icpr.cues.popleft()
-                if cue["kin"] == "finished":
+                if cue["kin"] in ("finished", "unwitnessed"):
                     regk = cue["regk"]
+                    witnessed = cue["kin"] == "finished"
                     break
                 yield self.tock
             yield self.tock
 
-        print("Regsitry:  {}({}) \n\tcreated for Identifier Prefix:  {}".format(self.registryName, regk, self.hab.pre))
+        if witnessed:
+            print("Regsitry:  {}({}) \n\tcreated for Identifier Prefix:  {}".format(self.registryName, regk, self.hab.pre))
+        else:
+            print(f"Witness threshold not met for anchor of registry {self.registryName}({regk})")
 
         self.remove(self.toRemove)
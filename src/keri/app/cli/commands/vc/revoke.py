@@ -4,6 +4,7 @@ keri.kli.commands module
 
 """
 import argparse
+import math
 
 from hio.base import doing
 from hio.help import decking
@@ -18,13 +19,14 @@ parser.set_defaults(handler=lambda args: revokeCredential(args))
 parser.add_argument('--name', '-n', help='Human readable reference', required=True)
 parser.add_argument('--registry-name', '-r', help='Human readable name for registry, defaults to name of Habitat',
                     default=None)
-parser.add_argument('--said', help='is SAID vc content qb64')
+parser.add_argument('--said', help='is SAID vc content qb64, repeat to revoke many credentials in bulk',
+                    action="append", required=True)
 
 
 def revokeCredential(args):
     name = args.name
 
-    revokeDoer = RevokeDoer(name=name, said=args.said, registryName=args.registry_name)
+    revokeDoer = RevokeDoer(name=name, saids=args.said, registryName=args.registry_name)
 
     doers = [revokeDoer]
     directing.runController(doers=doers, expire=0.0)
@@ -32,11 +34,11 @@ def revokeCredential(args):
 
 class RevokeDoer(doing.DoDoer):
 
-    def __init__(self, name, said, registryName, **kwa):
+    def __init__(self, name, saids, registryName, **kwa):
         self.cues = decking.Deck()
         self.registryName = registryName
         self.hab, doers = existing.setupHabitat(name=name)
-        self.said = said
+        self.saids = saids
 
         reger = viring.Registry(name=self.registryName, db=self.hab.db)
         self.issuer = Issuer(hab=self.hab, name=self.hab.name, reger=reger)
@@ -61,28 +63,46 @@ class RevokeDoer(doing.DoDoer):
         """
         yield self.tock
 
-        creder = self.issuer.reger.creds.get(keys=self.said)
-        if creder is None:
-            print(f"Invalid credential SAID {self.said}")
-            return
-
-        self.issuer.revoke(creder=creder)
-
-        published = False
-        witnessed = False
-        while not (published and witnessed):
+        creders = []
+        for said in self.saids:
+            creder = self.issuer.reger.creds.get(keys=said)
+            if creder is None:
+                print(f"Invalid credential SAID {said}")
+                return
+            creders.append(creder)
+
+        self.issuer.revokeMany(creders=creders)
+
+        events = math.ceil(len(creders) / self.issuer.BatchSize)  # anchoring key events
+        published = 0
+        witnessed = 0
+        statused = False
+        unwitnessed = False
+        while not ((published >= events and witnessed >= events and statused) or unwitnessed):
             while self.cues:
                 cue = self.cues.popleft()
                 if cue["kin"] == "witnessed":
-                    witnessed = True
+                    witnessed += 1
+
+                elif cue["kin"] == "unwitnessed":
+                    unwitnessed = True
 
                 elif cue["kin"] == "published":
-                    published = True
+                    published += 1
+
+                elif cue["kin"] == "statused":
+                    statused = True
 
                 yield self.tock
             yield
 
-        print(f"Revoked credential {creder.said}")
+        if unwitnessed:
+            print("Witness threshold not met for revocation anchor, revocations not witnessed.")
+            self.remove(self.toRemove)
+            return
+
+        for creder in creders:
+            print(f"Revoked credential {creder.said}")
 
         self.remove(self.toRemove)
 
@@ -122,14 +142,23 @@ class RevokeDoer(doing.DoDoer):
                     self.cues.append(dict(kin="published", regk=self.issuer.regk))
                 elif cueKin == "kevt":
                     kevt = cue["msg"]
-                    witDoer = agenting.WitnessReceiptor(hab=self.hab, msg=kevt)
+                    witDoer = agenting.WitnessReceiptor(hab=self.hab, msg=kevt, parent=self)
                     self.extend([witDoer])
 
-                    while not witDoer.done:
+                    while witDoer.complete is None:
                         yield self.tock
 
-                    self.remove([witDoer])
-                    self.cues.append(dict(kin="witnessed", regk=self.issuer.regk))
+                    kin = "witnessed" if witDoer.complete else "unwitnessed"
+                    self.cues.append(dict(kin=kin, regk=self.issuer.regk))
+                elif cueKin == "status":
+                    witSender = agenting.WitnessPublisher(hab=self.hab, msg=cue["msg"], wits=cue["baks"])
+                    self.extend([witSender])
+
+                    while not witSender.done:
+                        _ = yield self.tock
+
+                    self.remove([witSender])
+                    self.cues.append(dict(kin="statused", regk=self.issuer.regk))
 
                 yield self.tock
 
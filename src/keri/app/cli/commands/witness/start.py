@@ -32,6 +32,33 @@ parser.add_argument('-n', '--name',
                     action='store',
                     default="witness",
                     help="Name of controller. Default is witness.")
+parser.add_argument('--map-size',
+                    action='store',
+                    default=None,
+                    type=int,
+                    help="Initial LMDB map size in bytes of databases. Grows when full. Default is 10 MiB.")
+parser.add_argument('--max-readers',
+                    action='store',
+                    default=None,
+                    type=int,
+                    help="Maximum number of simultaneous LMDB read transactions. Default is 126.")
+parser.add_argument('--writemap',
+                    action='store_true',
+                    help="Use writeable LMDB memory map.")
+parser.add_argument('--map-async',
+                    action='store_true',
+                    help="Use asynchronous LMDB flushes with --writemap.")
+parser.add_argument('--no-sync',
+                    action='store_true',
+                    help="Do not flush LMDB to disk on each commit. Faster but last commits may be lost on crash.")
+parser.add_argument('--no-readahead',
+                    action='store_true',
+                    help="Disable OS read ahead on LMDB files.")
+parser.add_argument('--kever-capacity',
+                    action='store',
+                    default=None,
+                    type=int,
+                    help="Maximum number of key states cached in memory. Default is unbounded.")
 
 
 def launch(args):
@@ -43,21 +70,34 @@ def launch(args):
     logger.info("\n******* Starting Witness for %s listening: http/%s, tcp/%s "
                 ".******\n\n", args.name, args.http, args.tcp)
 
+    dbcfg = dict(mapSize=args.map_size,
+                 maxReaders=args.max_readers,
+                 writeMap=args.writemap,
+                 mapAsync=args.map_async,
+                 sync=not args.no_sync,
+                 metaSync=not args.no_sync,
+                 readAhead=not args.no_readahead)
+
     runWitness(name=args.name,
                tcp=int(args.tcp),
-               http=int(args.http))
+               http=int(args.http),
+               dbcfg=dbcfg,
+               keverCapacity=args.kever_capacity)
 
     logger.info("\n******* Ended Witness for %s listening: http/%s, tcp/%s"
                 ".******\n\n", args.name, args.http, args.tcp)
 
 
-def runWitness(name="witness", tcp=5631, http=5632, expire=0.0):
+def runWitness(name="witness", tcp=5631, http=5632, expire=0.0, dbcfg=None,
+               keverCapacity=None):
     """
     Setup and run one witness
     """
 
     doers = indirecting.setupWitness(name=name,
                                      tcpPort=tcp,
-                                     httpPort=http)
+                                     httpPort=http,
+                                     dbcfg=dbcfg,
+                                     keverCapacity=keverCapacity)
 
     directing.runController(doers=doers, expire=expire)
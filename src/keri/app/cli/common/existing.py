@@ -2,10 +2,11 @@ from keri.app import keeping, habbing
 from keri.db import basing
 
 
-def setupHabitat(name="test", **kwa):
-    ks = keeping.Keeper(name=name, temp=False)  # not opened by default, doer opens
+def setupHabitat(name="test", dbcfg=None, **kwa):
+    dbcfg = dbcfg if dbcfg is not None else {}  # LMDB environment settings
+    ks = keeping.Keeper(name=name, temp=False, **dbcfg)  # not opened by default, doer opens
     ksDoer = keeping.KeeperDoer(keeper=ks)  # doer do reopens if not opened and closes
-    db = basing.Baser(name=name, temp=False)  # not opened by default, doer opens
+    db = basing.Baser(name=name, temp=False, **dbcfg)  # not opened by default, doer opens
     dbDoer = basing.BaserDoer(baser=db)  # doer do reopens if not opened and closes
 
     # setup habitat
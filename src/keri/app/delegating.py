@@ -117,13 +117,17 @@ class InceptDoer(doing.DoDoer):
                 elif cue["kin"] == "psUnescrow":
                     self.delegatey.hab.delegationAccepted()
                     evt = self.delegatey.hab.makeOwnEvent(sn=0)
-                    witDoer = agenting.WitnessReceiptor(hab=self.delegatey.hab, msg=evt, klas=agenting.TCPWitnesser)
+                    witDoer = agenting.WitnessReceiptor(hab=self.delegatey.hab, msg=evt, klas=agenting.TCPWitnesser,
+                                                        parent=self)
                     self.extend([witDoer])
-                    while not witDoer.done:
+                    while witDoer.complete is None:
                         yield self.tock
 
-                    self.remove([witDoer])
-                    self.cues.append(dict(delegator=self.delegatey.hab.delpre, pre=self.delegatey.hab.pre))
+                    if not witDoer.complete:
+                        logger.error("Witness threshold not met for delegated inception of %s",
+                                     self.delegatey.hab.pre)
+                    self.cues.append(dict(delegator=self.delegatey.hab.delpre, pre=self.delegatey.hab.pre,
+                                          witnessed=witDoer.complete))
 
 
                 yield self.tock
@@ -21,6 +21,12 @@ class Postman(doing.DoDoer):
     delivers to sends them to one of the target recipient's witnesses for store and forward
     to the intended recipient
 
+    All events queued when a delivery pass starts share one witnesser, and so one
+    leased keep-alive connection, per witness. The `fwd` envelopes are not
+    CESR stream messages, see httping.Streamables, because witnesses only accept
+    them on their per message route. So each envelope is still sent in its own
+    request and is not coalesced with others into one request.
+
     """
 
     def __init__(self, hab, evts=None, klas=None, **kwa):
@@ -52,6 +58,7 @@ class Postman(doing.DoDoer):
             self.extend([self.witq])
 
         while True:
+            witers = dict()  # one witnesser per witness for all queued evts
             while self.evts:
                 evt = self.evts.popleft()
                 recp = evt["recipient"]
@@ -74,14 +81,16 @@ class Postman(doing.DoDoer):
                 kever = self.hab.kevers[recp]
                 wit = random.choice(kever.wits)
 
-                witer = self.klas(hab=self.hab, wit=wit)
-                witer.msgs.append(bytearray(ims))  # make a copy
-                self.extend([witer])
+                if wit not in witers:
+                    witers[wit] = self.klas(hab=self.hab, wit=wit)
+                    self.extend([witers[wit]])
+                witers[wit].msgs.append(bytearray(ims))  # make a copy
 
-                while not witer.sent:
+            for witer in witers.values():  # all queued envelopes sent and answered
+                while not witer.idle:
                     _ = (yield self.tock)
 
-                yield self.tock
+            self.remove(list(witers.values()))  # release leased clients
 
             yield self.tock
 
@@ -125,8 +134,8 @@ def forward(pre, serder, topic=None, version=coring.Version, kind=coring.Serials
                r=r,
                a=serder.ked,
                )
-    _, ked = coring.Saider.saidify(sad=ked)
+    _, ked, raw = coring.Saider.saidive(sad=ked)
 
 
-    return eventing.Serder(ked=ked)  # return serialized ked
+    return eventing.Serder(raw=raw, ked=ked)  # return serialized ked
 
@@ -48,6 +48,7 @@ class Groupy:
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
         self.hab = hab
         self.db = hab.db
+        self.tallies = dict()  # Talliers of partially signed escrowed evts by said
 
         self.kvy = eventing.Kevery(db=hab.db,
                                    lax=False,
@@ -126,9 +127,8 @@ class Groupy:
 
                     sigers = self.signAndPropagate(mssrdr, aids)
 
-            indices = [siger.index for siger in sigers]
             tholder = coring.Tholder(sith=sith)
-            if not tholder.satisfy(indices):  # We still don't have all the sigers, need to escrow
+            if not self.tally(mssrdr, tholder=tholder, sigers=sigers):  # We still don't have all the sigers, need to escrow
                 self.escrowPSE(msg, mssrdr)
                 raise kering.MissingSignatureError("Failure satisfying sith = {} on sigs for {}"
                                                    " for evt = {}.".format(tholder.sith,
@@ -217,8 +217,7 @@ class Groupy:
 
                 sigers = self.signAndPropagate(mssrdr, group.aids)
 
-            indices = [siger.index for siger in sigers]
-            if not mssrdr.tholder.satisfy(indices):  # If we still don't have all the sigers, need to escrow
+            if not self.tally(mssrdr, tholder=mssrdr.tholder, sigers=sigers):  # If we still don't have all the sigers, need to escrow
                 self.escrowPSE(msg, mssrdr)
                 raise kering.MissingSignatureError("Failure satisfying sith = {} on sigs for {}"
                                                    " for evt = {}.".format(mssrdr.tholder.sith,
@@ -270,8 +269,7 @@ class Groupy:
                                            data=data)
                 sigers = self.signAndPropagate(mssrdr, group.aids)
 
-            indices = [siger.index for siger in sigers]
-            if not gkev.tholder.satisfy(indices):  # If we still don't have all the sigers, need to escrow
+            if not self.tally(mssrdr, tholder=gkev.tholder, sigers=sigers):  # If we still don't have all the sigers, need to escrow
                 self.escrowPSE(msg, mssrdr)
                 raise kering.MissingSignatureError("Failure satisfying sith = {} on sigs for {}"
                                                    " for evt = {}.".format(gkev.tholder.sith,
@@ -286,6 +284,32 @@ class Groupy:
                 sn=mssrdr.ked["s"]
             ))
 
+    def tally(self, mssrdr, tholder, sigers):
+        """
+        Returns True if sigers satisfy tholder on event mssrdr, False otherwise.
+        Keeps the Tallier of a partially signed event in .tallies so each escrow
+        pass only adds the indices of newly attached signatures. A kept Tallier
+        is only reused when all its indices are among those of sigers.
+
+        Parameters:
+            mssrdr(Serder): the multisig KEL event for this request
+            tholder(Tholder): signing threshold of the event
+            sigers(list): list of Siger signatures on event
+
+        """
+        indices = [siger.index for siger in sigers]
+        tallier = self.tallies.get(mssrdr.said)
+        if (tallier is None or tallier.tholder.sith != tholder.sith or
+                not tallier.indices.issubset(indices)):
+            tallier = tholder.tally()
+
+        if tallier.extend(indices):
+            self.tallies.pop(mssrdr.said, None)
+            return True
+
+        self.tallies[mssrdr.said] = tallier
+        return False
+
     def signAndPropagate(self, mssrdr, aids):
         """
         Sign message and cue up message to send to participants of the group as identified by
@@ -399,6 +423,7 @@ class Groupy:
             except Exception as ex:  # log diagnostics errors etc
                 # error other than missing sigs so remove from PA escrow
                 self.db.gpse.rem(pre)
+                self.tallies.pop(dig, None)
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Groupy unescrowed: %s\n", ex.args[0])
                 else:
@@ -560,12 +585,15 @@ class MultiSigGroupDoer(doing.DoDoer):
                                           msg=bytearray(cue["evt"]))
                 elif cueKin == "witness":
                     msg = cue["msg"]
-                    witRctDoer = agenting.WitnessReceiptor(hab=self.hab, msg=msg, klas=agenting.HttpWitnesser)
+                    witRctDoer = agenting.WitnessReceiptor(hab=self.hab, msg=msg, klas=agenting.HttpWitnesser,
+                                                           parent=self)
                     self.extend([witRctDoer])
 
-                    while not witRctDoer.done:
+                    while witRctDoer.complete is None:
                         _ = yield self.tock
-                    self.remove([witRctDoer])
+
+                    if not witRctDoer.complete:
+                        logger.error("Witness threshold not met for group event of %s", self.hab.pre)
 
                 elif cueKin == "logEvent":
                     group = cue["group"]
@@ -587,13 +615,17 @@ class MultiSigGroupDoer(doing.DoDoer):
                         else:
 
                             msg = eventing.messagize(mssrdr, sigers=sigers)
-                            witRctDoer = agenting.WitnessReceiptor(hab=self.hab, msg=msg, klas=agenting.TCPWitnesser)
+                            witRctDoer = agenting.WitnessReceiptor(hab=self.hab, msg=msg,
+                                                                   klas=agenting.TCPWitnesser, parent=self)
                             self.extend([witRctDoer])
 
-                            while not witRctDoer.done:
+                            while witRctDoer.complete is None:
                                 _ = yield self.tock
 
-                            self.remove([witRctDoer])
+                            if not witRctDoer.complete:
+                                logger.error("Witness threshold not met for group event %s of %s",
+                                             mssrdr.said, mssrdr.pre)
+                            cue["witnessed"] = witRctDoer.complete
                             self.cues.append(cue)
 
                     else:  # We are not the first signer, so we wait for the sigs and processed receipts
@@ -22,7 +22,7 @@ from ..core import coring, eventing, parsing, routing
 from ..core.coring import Serder
 from ..db import dbing, basing
 from ..db.dbing import snKey, dgKey
-from . import keeping, configing, directing
+from . import keeping, configing, directing, httping
 
 logger = help.ogler.getLogger()
 
@@ -48,6 +48,9 @@ def openHby(*, name="test", base="", temp=True, salt=SALT, **kwa):
         ks (Keeper):  keystore lmdb subclass instance
         db (Baser): database lmdb subclass instance
         cf (Configer): config file instance
+        dbcfg (dict): optional LMDB environment settings such as mapSize,
+            mapGrow, writeMap, sync, metaSync, mapAsync, readAhead and
+            maxReaders for .ks and .db
         seed (str): qb64 private-signing key (seed) for the aeid from which
             the private decryption key may be derived. If aeid stored in
             database is not empty then seed may required to do any key
@@ -206,6 +209,7 @@ class Habery:
         rvy (routing.Revery): factory that processes reply 'rpy' messages
         kvy (eventing.Kevery): factory for local processing of local event msgs
         psr (parsing.Parser):  parses local messages for .kvy .rvy
+        clienter (httping.Clienter): pool of http clients shared by .habs
 
         habs (dict): Hab instances keyed by prefix.
             To look up Hab by name get prefix from db.habs .prefix field using
@@ -221,7 +225,8 @@ class Habery:
     """
 
     def __init__(self, *, name='test', base="", temp=False,
-                 ks=None, db=None, cf=None, clear=False, **kwa):
+                 ks=None, db=None, cf=None, clear=False, dbcfg=None,
+                 keverCapacity=None, **kwa):
         """
         Initialize instance.
 
@@ -242,6 +247,11 @@ class Habery:
                             reopening
                           False means do not remove directory upon close when
                             reopening
+            dbcfg (dict): optional LMDB environment settings such as mapSize,
+                mapGrow, writeMap, sync, metaSync, mapAsync, readAhead and
+                maxReaders passed to LMDBer init of .ks and .db when created here
+            keverCapacity (int | None): max number of Kevers held in memory by
+                .db when created here. None means unbounded
 
 
         Parameters: Passed through via kwa to setup for later init
@@ -275,16 +285,20 @@ class Habery:
         self.base = base
         self.temp = temp
 
+        dbcfg = dbcfg if dbcfg is not None else {}
         self.ks = ks if ks is not None else keeping.Keeper(name=self.name,
                                                            base=self.base,
                                                            temp=self.temp,
                                                            reopen=True,
-                                                           clear=clear)
+                                                           clear=clear,
+                                                           **dbcfg)
         self.db = db if db is not None else basing.Baser(name=self.name,
                                                          base=self.base,
                                                          temp=self.temp,
                                                          reopen=True,
-                                                         clear=clear)
+                                                         clear=clear,
+                                                         keverCapacity=keverCapacity,
+                                                         **dbcfg)
         self.cf = cf if cf is not None else configing.Configer(name=self.name,
                                                                base=self.base,
                                                                temp=self.temp,
@@ -297,6 +311,7 @@ class Habery:
         self.kvy = eventing.Kevery(db=self.db, lax=False, local=True, rvy=self.rvy)
         self.kvy.registerReplyRoutes(router=self.rtr)
         self.psr = parsing.Parser(framed=True, kvy=self.kvy, rvy=self.rvy)
+        self.clienter = httping.Clienter()  # pool of http clients shared by habs
         self.habs = {}  # empty .habs
 
         self.inited = False
@@ -395,7 +410,7 @@ class Habery:
             # create Hab instance and inject dependencies
             hab = Hab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
                       rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
-                      name=name, pre=pre, temp=self.temp)
+                      clienter=self.clienter, name=name, pre=pre, temp=self.temp)
 
             # Rules for acceptance
             #  if its delegated its accepted into its own local KEL even if the
@@ -434,7 +449,7 @@ class Habery:
         """
         hab = Hab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
                   rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
-                  name=name, temp=self.temp)
+                  clienter=self.clienter, name=name, temp=self.temp)
 
         hab.make(**kwa)
         self.habs[hab.pre] = hab
@@ -456,6 +471,8 @@ class Habery:
         if self.cf:
             self.cf.close(clear=self.cf.temp or clear)
 
+        self.clienter.close()
+
 
     @property
     def kevers(self):
@@ -584,6 +601,7 @@ class Hab:
         rvy (routing.Revery): factory that processes reply 'rpy' messages
         kvy (eventing.Kevery): factory for local processing of local event msgs
         psr (parsing.Parser):  parses local messages for .kvy .rvy
+        clienter (httping.Clienter): pool of http clients to witnesses etc
 
      Attributes:
         name (str): alias of controller
@@ -603,7 +621,7 @@ class Hab:
     """
 
     def __init__(self, ks, db, cf, mgr, rtr, rvy, kvy, psr, *,
-                 name='test', pre=None, temp=False):
+                 clienter=None, name='test', pre=None, temp=False):
         """
         Initialize instance.
 
@@ -616,6 +634,8 @@ class Hab:
             rvy (routing.Revery): factory that processes reply 'rpy' messages
             kvy (eventing.Kevery): factory for local processing of local event msgs
             psr (parsing.Parser):  parses local messages for .kvy .rvy
+            clienter (httping.Clienter): pool of http clients shared with
+                other habs. Defaults to own pool
 
         Parameters:
             name (str): alias name for local controller of habitat
@@ -634,6 +654,7 @@ class Hab:
         self.rvy = rvy  # injected
         self.kvy = kvy  # injected
         self.psr = psr  # injected
+        self.clienter = clienter if clienter is not None else httping.Clienter()
 
         self.name = name
         self.pre = pre  # wait to setup until after db is known to be opened
@@ -1645,6 +1666,7 @@ class Habitat:
         cf (configing.Configer): config file instance
         kvy (eventing.Kevery): instance for local processing of local msgs
         psr (parsing.Parser):  parses local messages for .kvy
+        clienter (httping.Clienter): pool of http clients to witnesses etc
         mgr (keeping.Manager): creates and rotates keys in key store
         pre (str): qb64 prefix of own local controller
         inited (bool): True means fully initialized wrt databases.
@@ -1724,6 +1746,7 @@ class Habitat:
         self.kvy = eventing.Kevery(db=self.db, lax=False, local=True, rvy=self.rvy)
         self.kvy.registerReplyRoutes(router=self.rtr)
         self.psr = parsing.Parser(framed=True, kvy=self.kvy, rvy=self.rvy)
+        self.clienter = httping.Clienter()  # pool of http clients
         self.mgr = None  # wait to setup until after ks is known to be opened
         self.pre = None  # wait to setup until after db is known to be opened
         self.delpre = None
@@ -4,9 +4,12 @@ keri.peer.httping module
 
 """
 import json
+from collections import deque
 from dataclasses import dataclass
 
 import falcon
+from hio.base import doing, tyming
+from hio.core import http
 from hio.help import Hict
 
 from keri import help
@@ -19,6 +22,10 @@ from keri.help.helping import nowIso8601
 logger = help.ogler.getLogger()
 
 CESR_CONTENT_TYPE = "application/cesr+json"
+CESR_STREAM_CONTENT_TYPE = "application/cesr"  # body of many messages with attachments
+CESR_STREAM_PATH = "/cesr"
+# statuses of endpoint without CESR stream route so fallback to one request per message
+CESR_STREAM_REJECTS = (404, 405, 501)
 CESR_ATTACHMENT_HEADER = "CESR-ATTACHMENT"
 CESR_DATE_HEADER = "CESR-DATE"
 CESR_RECIPIENT_HEADER = "CESR-RECIPIENT"
@@ -70,15 +77,37 @@ class CesrRequest:
     payload: dict
     modifiers: dict
     attachments: str
+    raw: bytes = b''  # body when passed through as serialized message else empty
 
 
-def parseCesrHttpRequest(req, prefix=None):
+def framed(body):
+    """
+    Returns True if body is exactly one JSON serialized KERI/ACDC message whose
+    version string size matches the body so it may be passed to a Parser as
+    is. Only sniffs the version string, does not deserialize the body.
+
+    Parameters:
+        body (bytes): HTTP request body
+    """
+    try:
+        ident, kind, version, size = coring.sniff(body)
+    except kering.KeriError:
+        return False
+
+    return kind == coring.Serials.json and size == len(body)
+
+
+def parseCesrHttpRequest(req, prefix=None, raw=False):
     """
     Parse Falcon HTTP request and create a CESR message from the body of the request and the two
     CESR HTTP headers (Date, Attachment).
 
     Parameters
         req (falcon.Request) http request object in CESR format:
+        prefix (str): optional prefix to remove from request path for resource
+        raw (bool): True means keep body in .raw without JSON decoding when
+            it is a framed message (see framed). .payload is then None.
+            Otherwise or when not framed the body is JSON decoded into .payload
 
     """
     if req.content_type != CESR_CONTENT_TYPE:
@@ -86,13 +115,18 @@ def parseCesrHttpRequest(req, prefix=None):
                                title="Content type error",
                                description="Unacceptable content type.")
 
-    try:
-        data = json.load(req.bounded_stream)
-    except ValueError:
-        raise falcon.HTTPError(falcon.HTTP_400,
-                               title="Malformed JSON",
-                               description="Could not decode the request body. The "
-                                           "JSON was incorrect.")
+    body = req.bounded_stream.read()
+    if raw and framed(body):
+        data = None
+    else:
+        try:
+            data = json.loads(body)
+        except ValueError:
+            raise falcon.HTTPError(falcon.HTTP_400,
+                                   title="Malformed JSON",
+                                   description="Could not decode the request body. The "
+                                               "JSON was incorrect.")
+        body = b''
 
     resource = req.path
     if prefix is not None:
@@ -117,7 +151,8 @@ def parseCesrHttpRequest(req, prefix=None):
         date=dt,
         payload=data,
         modifiers=req.params,
-        attachments=attachment)
+        attachments=attachment,
+        raw=body)
 
     return cr
 
@@ -152,7 +187,7 @@ def createCESRRequest(msg, client, date=None):
         body = serder.raw
     elif ilk in (Ilks.fwd,):
         resource = "/" + ilk + "/" + serder.ked['r']
-        body = json.dumps(serder.ked["a"]).encode("utf-8")
+        body = coring.dumps(serder.ked["a"])  # same bytes as forwarded message
     elif ilk in (Ilks.exn,):
         resource = "/" + ilk + serder.ked['r']
         body = json.dumps(serder.ked["a"]).encode("utf-8")
@@ -179,6 +214,332 @@ def createCESRRequest(msg, client, date=None):
     )
 
 
+# message types accepted by CESR stream endpoint as they are only parsed into
+# KEL or TEL. Queries, forwards and exchanges have their own endpoints
+Streamables = (Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt, Ilks.ksn, Ilks.rct,
+               Ilks.vcp, Ilks.vrt, Ilks.iss, Ilks.rev, Ilks.bis, Ilks.brv)
+
+
+def streamable(msg):
+    """
+    Returns True if leading message of msg may be sent in a CESR stream request
+    False otherwise
+
+    Parameters:
+       msg (bytes): KERI message with attachments
+    """
+    try:
+        serder = coring.Serder(raw=bytes(msg))
+        return serder.ked["t"] in Streamables
+    except (kering.KeriError, ValueError):
+        return False
+
+
+def createCESRStreamRequest(msgs, client):
+    """
+    Turns KERI messages with attachments into one CESR stream http request
+    against the provided hio http Client. The body is the concatenation of msgs
+    as is so any number of messages costs one request.
+
+    Parameters
+       msgs (Iterable): of KERI messages with attachments as bytes
+       client: hio http Client that will send the messages as a CESR stream request
+
+    """
+    body = bytearray()
+    for msg in msgs:
+        body.extend(msg)
+
+    headers = Hict([
+        ("Content-Type", CESR_STREAM_CONTENT_TYPE),
+        ("Content-Length", len(body)),
+    ])
+
+    client.request(
+        method="POST",
+        path=CESR_STREAM_PATH,
+        headers=headers,
+        body=bytes(body)
+    )
+
+
+class Clienter(tyming.Tymee):
+    """
+    Clienter is a pool of persistent (keep-alive) hio http Clients shared by the
+    witness, mailbox and forwarding doers of a Habery so that repeated requests
+    to the same endpoint reuse an open connection instead of a new one per request.
+
+    Clients are keyed by (hostname, port, scheme) and leased to one borrower at a
+    time so responses are never mixed between borrowers. A released client
+    returns to the pool when its connection is healthy and idle, otherwise it is
+    closed. Idle clients are closed once unused for .idle seconds.
+
+    The per endpoint limit, .size, is a soft cap. A borrower that has waited
+    .wait seconds for a client gets an overflow client that is closed on release
+    so bursts are bounded but no borrower stalls forever. Held leases, for
+    long-lived borrowers such as SSE mailbox pollers, get their own client that
+    is neither counted against the limit nor pooled.
+
+    Idle and wait times are measured in tyme of the injected tymth, which the
+    first LeaseDoer run by a Doist winds when not given, so the pool follows
+    simulated Doist time. Until wound .tyme stays 0.0 so nothing expires.
+
+    Class Attributes:
+        Size (int): default maximum of open clients per endpoint
+        Idle (float): default seconds an idle client stays open before eviction
+        Faults (int): default consecutive faults before endpoint is unhealthy
+        Wait (float): default seconds a borrower waits at the limit before overflow
+
+    Attributes:
+        size (int): maximum of open clients, leased or idle, per endpoint
+        idle (float): seconds an idle client stays open before eviction
+        wait (float): seconds a borrower waits at the limit before overflow
+        faults (int): consecutive faults before endpoint is unhealthy
+        idles (dict): of deques of (client, tyme) idle clients keyed by endpoint
+        leases (dict): of counts of leased clients keyed by endpoint
+        health (dict): of counts of consecutive faults keyed by endpoint
+        streamless (set): of endpoints that rejected CESR stream requests
+
+    """
+    Size = 4
+    Idle = 30.0
+    Faults = 3
+    Wait = 5.0
+
+    def __init__(self, size=None, idle=None, faults=None, wait=None, tymth=None):
+        """
+        Initialize instance
+
+        Parameters:
+            size (int): maximum of open clients per endpoint
+            idle (float): seconds an idle client stays open before eviction
+            faults (int): consecutive faults before endpoint is unhealthy
+            wait (float): seconds a borrower waits at the limit before overflow
+            tymth (function): injected function wrapper closure returned by
+                .tymen() of Tymist instance. Calling tymth() returns .tyme
+
+        """
+        super(Clienter, self).__init__(tymth=tymth)
+        self.size = size if size is not None else self.Size
+        self.wait = wait if wait is not None else self.Wait
+        self.idle = idle if idle is not None else self.Idle
+        self.faults = faults if faults is not None else self.Faults
+        self.idles = dict()
+        self.leases = dict()
+        self.health = dict()
+        self.streamless = set()
+
+    def lease(self, hostname, port, scheme="http", held=False):
+        """
+        Returns LeaseDoer that acquires a client for endpoint when run,
+        services it while leased and releases it back to this pool on exit.
+        Use in place of an hio ClientDoer
+
+        Parameters:
+            hostname (str): host name or ip address of endpoint
+            port (int): port of endpoint
+            scheme (str): http or https
+            held (bool): True means long-lived borrower that gets its own client
+                not counted against .size. False means pooled client
+
+        """
+        return LeaseDoer(clienter=self, key=(hostname, port, scheme), held=held)
+
+    @property
+    def tyme(self):
+        """
+        Returns tyme of injected tymth or 0.0 when not yet wound
+        """
+        return self._tymth() if self._tymth else 0.0
+
+    def acquire(self, key, held=False, force=False):
+        """
+        Returns open hio http Client for endpoint key leased to caller, reusing
+        an idle client when one is still connected. Returns None when .size
+        clients for key are already leased so caller must try again later
+        unless held or force.
+
+        Parameters:
+            key (tuple): (hostname, port, scheme) of endpoint
+            held (bool): True means new client not counted against .size
+            force (bool): True means overflow client when .size already leased
+
+        """
+        self.evict()
+        if held:
+            return self.open(key)
+
+        idles = self.idles.get(key)
+        while idles:
+            client, _ = idles.pop()  # most recently used is most likely still open
+            client.connector.serviceReceives()  # detect close by far side
+            if client.connector.cutoff or client.connector.rxbs:
+                client.close()
+                continue
+            self.leases[key] = self.leases.get(key, 0) + 1
+            return client
+
+        if self.leases.get(key, 0) >= self.size and not force:
+            return None
+
+        client = self.open(key)
+        self.leases[key] = self.leases.get(key, 0) + 1
+        return client
+
+    @staticmethod
+    def open(key):
+        """
+        Returns new opened hio http Client for endpoint key
+
+        Parameters:
+            key (tuple): (hostname, port, scheme) of endpoint
+
+        """
+        hostname, port, scheme = key
+        client = http.clienting.Client(hostname=hostname, port=port, scheme=scheme)
+        client.reopen()
+        return client
+
+    def release(self, key, client, held=False):
+        """
+        Return client leased for endpoint key to the pool or close it. Client
+        is kept open only when its connection is up and no request is in flight.
+        Updates health of endpoint from state of client connection.
+
+        Parameters:
+            key (tuple): (hostname, port, scheme) of endpoint
+            client (Client): hio http Client returned by .acquire
+            held (bool): True means client was acquired held so always closed
+
+        """
+        if not held:
+            self.leases[key] = max(self.leases.get(key, 0) - 1, 0)
+        connector = client.connector
+        broken = connector.cutoff or not connector.connected
+        pending = client.requests or client.waited
+
+        if broken and pending:  # never connected or dropped mid request
+            self.health[key] = self.health.get(key, 0) + 1
+        elif not broken:
+            self.health.pop(key, None)
+
+        idles = self.idles.setdefault(key, deque())
+        if (held or broken or pending or client.respondent.evented
+                or self.leases[key] + len(idles) >= self.size):
+            client.close()
+            return
+
+        client.responses.clear()
+        idles.append((client, self.tyme))
+
+    def healthy(self, hostname, port, scheme="http"):
+        """
+        Returns True if endpoint has fewer than .faults consecutive faults
+
+        Parameters:
+            hostname (str): host name or ip address of endpoint
+            port (int): port of endpoint
+            scheme (str): http or https
+
+        """
+        return self.health.get((hostname, port, scheme), 0) < self.faults
+
+    def evict(self):
+        """
+        Close idle clients unused for more than .idle seconds of .tyme
+        """
+        expire = self.tyme - self.idle
+        for key, idles in self.idles.items():
+            while idles and idles[0][1] <= expire:  # oldest on the left
+                client, _ = idles.popleft()
+                client.close()
+
+    def close(self):
+        """
+        Close all idle clients. Leased clients are closed on release
+        """
+        self.size = 0  # no more reuse
+        for idles in self.idles.values():
+            while idles:
+                client, _ = idles.popleft()
+                client.close()
+
+
+class LeaseDoer(doing.Doer):
+    """
+    LeaseDoer services an hio http Client leased from a Clienter. The client is
+    acquired on enter or on a later recur when the endpoint is at its limit of
+    open clients so .client is None until acquired. Once the lease has waited
+    .clienter.wait seconds of .clienter.tyme it takes an overflow client. On
+    exit the client is released back to the pool instead of closed.
+
+    See Doer for inherited attributes, properties, and methods.
+
+    Attributes:
+        clienter (Clienter): pool that leases the client
+        key (tuple): (hostname, port, scheme) of endpoint
+        held (bool): True means own client not counted against pool limit
+        client (Client | None): leased hio http Client once acquired
+        asked (float | None): .clienter.tyme of first attempt to acquire
+
+    """
+
+    def __init__(self, clienter, key, held=False, **kwa):
+        """
+        Initialize instance.
+
+        Parameters:
+            clienter (Clienter): pool that leases the client
+            key (tuple): (hostname, port, scheme) of endpoint
+            held (bool): True means own client not counted against pool limit
+
+        """
+        super(LeaseDoer, self).__init__(**kwa)
+        self.clienter = clienter
+        self.key = key
+        self.held = True if held else False
+        self.client = None
+        self.asked = None
+
+    def wind(self, tymth):
+        """
+        Inject new tymist.tymth as new ._tymth. Changes tymist.tyme base.
+        Updates winds .client .tymth and .clienter when not yet wound
+        """
+        super(LeaseDoer, self).wind(tymth)
+        if self.clienter.tymth is None:  # pool follows tyme of its Doist
+            self.clienter.wind(tymth)
+        if self.client:
+            self.client.wind(tymth)
+
+    def acquire(self):
+        """ Acquire client from .clienter if not yet acquired """
+        if self.client is None:
+            if self.asked is None:
+                self.asked = self.clienter.tyme
+            force = self.clienter.tyme - self.asked >= self.clienter.wait
+            self.client = self.clienter.acquire(self.key, held=self.held, force=force)
+            if self.client is not None and self.tymth:
+                self.client.wind(self.tymth)
+
+    def enter(self):
+        """"""
+        self.acquire()
+
+    def recur(self, tyme):
+        """"""
+        self.acquire()
+        if self.client is not None:
+            self.client.service()
+
+    def exit(self):
+        """"""
+        if self.client is not None:
+            self.clienter.release(self.key, self.client, held=self.held)
+            self.client = None
+            self.asked = None
+
+
 class InsecureSignatureComponent(object):
 
     def process_request(self, req, resp):
@@ -25,14 +25,24 @@ from ..vdr.eventing import Tevery
 logger = help.ogler.getLogger()
 
 
-def setupWitness(name="witness", hab=None, mbx=None, temp=False, tcpPort=5631, httpPort=5632):
+def setupWitness(name="witness", hab=None, mbx=None, temp=False, tcpPort=5631, httpPort=5632,
+                 dbcfg=None, keverCapacity=None):
     """
+    Setup witness doers
+
+    Parameters:
+        dbcfg (dict): optional LMDB environment settings such as mapSize and
+            sync for the witness databases. See dbing.LMDBer
+        keverCapacity (int | None): max number of Kevers held in memory.
+            None means unbounded. See basing.dbdict
     """
+    dbcfg = dbcfg if dbcfg is not None else {}
     doers = []
     # setup habitat
     if hab is None:
         # setup habery with resources
-        hby = habbing.Habery(name=name, base="wit", temp=True, free=True)
+        hby = habbing.Habery(name=name, base="wit", temp=True, free=True, dbcfg=dbcfg,
+                             keverCapacity=keverCapacity)
         hbyDoer = habbing.HaberyDoer(habery=hby)  # setup doer
         doers.extend([hbyDoer])
 
@@ -40,11 +50,11 @@ def setupWitness(name="witness", hab=None, mbx=None, temp=False, tcpPort=5631, h
         hab = hby.makeHab(name=name, transferable=False)
 
 
-    reger = viring.Registry(name=hab.name, db=hab.db, temp=False)
+    reger = viring.Registry(name=hab.name, db=hab.db, temp=False, **dbcfg)
     verfer = verifying.Verifier(hab=hab, reger=reger)
     app = falcon.App(cors_enable=True)
 
-    mbx = mbx if mbx is not None else storing.Mailboxer(name=name, temp=temp)
+    mbx = mbx if mbx is not None else storing.Mailboxer(name=name, temp=temp, **dbcfg)
 
     rep = storing.Respondant(hab=hab, mbx=mbx)
     httpHandler = HttpMessageHandler(hab=hab, app=app, rep=rep, verifier=verfer, mbx=mbx)
@@ -162,7 +172,8 @@ class Indirector(doing.DoDoer):
                                       lax=False,
                                       local=False,
                                       cloned=not self.direct,
-                                      direct=self.direct)
+                                      direct=self.direct,
+                                      sweep=eventing.Kevery.EscrowSweep)
         self.parser = parsing.Parser(ims=self.client.rxbs,
                                      framed=True,
                                      kvy=self.kevery)
@@ -367,7 +378,8 @@ class MailboxDirector(doing.DoDoer):
                                                                rvy=self.rvy,
                                                                lax=True,
                                                                local=False,
-                                                               direct=False)
+                                                               direct=False,
+                                                               sweep=eventing.Kevery.EscrowSweep)
         self.kvy.registerReplyRoutes(self.rtr)
 
         if self.verifier is not None:
@@ -575,9 +587,11 @@ class Poller(doing.DoDoer):
         """
         loc = obtaining.getwitnessbyprefix(self.witness)
 
-        client = http.clienting.Client(hostname=loc.ip4, port=loc.http)
-        clientDoer = http.clienting.ClientDoer(client=client)
+        clientDoer = self.hab.clienter.lease(hostname=loc.ip4, port=loc.http, held=True)
         self.extend([clientDoer])
+        while clientDoer.client is None:
+            yield self.tock
+        client = clientDoer.client
 
         witrec = self.hab.db.tops.get(self.witness)
         if witrec is None:
@@ -650,9 +664,11 @@ class GroupPoller(doing.DoDoer):
         """
         loc = obtaining.getwitnessbyprefix(self.witness)
 
-        client = http.clienting.Client(hostname=loc.ip4, port=loc.http)
-        clientDoer = http.clienting.ClientDoer(client=client)
+        clientDoer = self.hab.clienter.lease(hostname=loc.ip4, port=loc.http, held=True)
         self.extend([clientDoer])
+        while clientDoer.client is None:
+            yield self.tock
+        client = clientDoer.client
 
         tkey = "{}.{}".format(self.group.gid, self.witness)
         witrec = self.hab.db.tops.get(tkey)
@@ -719,12 +735,14 @@ class HttpMessageHandler(doing.DoDoer):
         self.app = app if app is not None else falcon.App(cors_enable=True)
 
         self.app.add_route("/kel", self)
+        self.app.add_route(httping.CESR_STREAM_PATH, self, suffix="cesr")
         self.app.add_route("/qry/logs", self, suffix="req")
         self.app.add_route("/qry/ksn", self, suffix="req")
 
         self.kevery = eventing.Kevery(db=self.hab.db,
                                       lax=False,
-                                      local=False)
+                                      local=False,
+                                      sweep=eventing.Kevery.EscrowSweep)
 
         doers = [doing.doify(self.msgDo), doing.doify(self.cueDo), doing.doify(self.escrowDo)]
 
@@ -767,9 +785,32 @@ class HttpMessageHandler(doing.DoDoer):
             rep.status = falcon.HTTP_200
             return
 
-        cr = httping.parseCesrHttpRequest(req=req)
+        cr = httping.parseCesrHttpRequest(req=req, raw=True)
         self.handle(cr, rep)
 
+    def on_post_cesr(self, req, rep):
+        """
+        Handles POST for CESR stream of many KEL or TEL messages each with its
+        attachments. Body is fed as is to the Parser.
+
+        Parameters:
+              req (Request) Falcon HTTP request
+              rep (Response) Falcon HTTP response
+
+        """
+        if req.method == "OPTIONS":
+            rep.status = falcon.HTTP_200
+            return
+
+        if req.content_type != httping.CESR_STREAM_CONTENT_TYPE:
+            raise falcon.HTTPError(falcon.HTTP_NOT_ACCEPTABLE,
+                                   title="Content type error",
+                                   description="Unacceptable content type.")
+
+        self.rxbs.extend(req.bounded_stream.read())
+
+        rep.status = falcon.HTTP_202  # This is the default status
+
     def on_post_req(self, req, rep):
         """
         Handles POST for `req` messages.
@@ -783,7 +824,7 @@ class HttpMessageHandler(doing.DoDoer):
             rep.status = falcon.HTTP_200
             return
 
-        cr = httping.parseCesrHttpRequest(req=req, prefix="/req/")
+        cr = httping.parseCesrHttpRequest(req=req, prefix="/req/", raw=True)
         self.handle(cr, rep)
 
     def on_post_exn(self, req, rep):
@@ -820,13 +861,10 @@ class HttpMessageHandler(doing.DoDoer):
             rep.status = falcon.HTTP_200
             return
 
-        cr = httping.parseCesrHttpRequest(req=req, prefix="/fwd/")
+        cr = httping.parseCesrHttpRequest(req=req, prefix="/fwd/", raw=True)
 
         # TODO: regenerate the fwd message and verify the SAID signature on it.
-        serder = eventing.Serder(ked=cr.payload, kind=eventing.Serials.json)
-
-        msg = bytearray(serder.raw)
-        msg.extend(cr.attachments.encode("utf-8"))
+        msg = self.message(cr)
 
         self.mbx.storeMsg(topic=cr.resource, msg=msg)
 
@@ -847,14 +885,28 @@ class HttpMessageHandler(doing.DoDoer):
 
         """
 
-        serder = eventing.Serder(ked=cr.payload, kind=eventing.Serials.json)
-        msg = bytearray(serder.raw)
-        msg.extend(cr.attachments.encode("utf-8"))
-
-        self.rxbs.extend(msg)
+        self.rxbs.extend(self.message(cr))
 
         rep.status = falcon.HTTP_202  # This is the default status
 
+    @staticmethod
+    def message(cr):
+        """
+        Returns bytearray of KERI message with attachments from CESR request cr.
+        The request body is used as is when passed through in cr.raw otherwise
+        the message is serialized from the decoded cr.payload.
+
+        Parameters:
+              cr (CesrRequest) Result of converting HTTP Request to a CESR message
+
+        """
+        if cr.raw:
+            msg = bytearray(cr.raw)
+        else:
+            msg = bytearray(eventing.Serder(ked=cr.payload, kind=eventing.Serials.json).raw)
+        msg.extend(cr.attachments.encode("utf-8"))
+        return msg
+
     def msgDo(self, tymth=None, tock=0.0, **opts):
         """
         Returns doifiable Doist compatibile generator method (doer dog) to process
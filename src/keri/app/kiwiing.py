@@ -238,7 +238,7 @@ class IdentifierEnd(doing.DoDoer):
 
             if self.hab.kever.delegator is None:
 
-                witDoer = agenting.WitnessReceiptor(hab=self.hab, msg=rot)
+                witDoer = agenting.WitnessReceiptor(hab=self.hab, msg=rot, parent=self)
                 self.extend(doers=[witDoer])
 
                 rep.status = falcon.HTTP_200
@@ -360,9 +360,37 @@ class CredentialsEnd:
                 type: string
              description:  type of credential to return, [issued|received]
              required: true
+           - in: query
+             name: schema
+             schema:
+                type: string
+             description:  only return credentials of schema SAID
+           - in: query
+             name: status
+             schema:
+                type: string
+             description:  only return credentials with status, [issued|revoked]
+           - in: query
+             name: limit
+             schema:
+                type: integer
+             description:  max number of credentials to return. When more remain the
+                           X-Cursor response header holds the cursor of the next page
+           - in: query
+             name: cursor
+             schema:
+                type: string
+             description:  X-Cursor of previous page to resume listing after
 
         """
-        typ = req.params("type")
+        typ = req.params.get("type")
+        limit = req.params.get("limit")
+        try:
+            limit = int(limit) if limit is not None else None
+        except ValueError:
+            rep.status = falcon.HTTP_400
+            rep.text = "invalid limit {}".format(limit)
+            return
 
         group = self.hab.group()
         if group is None:
@@ -370,18 +398,30 @@ class CredentialsEnd:
         else:
             pre = group.gid
 
-        creds = []
+        filters = dict(schema=req.params.get("schema"), status=req.params.get("status"))
         if typ == "issued":
             registry = req.params["registry"]
             issuer = self.getIssuer(registry)
-
-            saids = issuer.reger.issus.get(keys=pre)
-            creds = self.verifier.reger.cloneCreds(saids)
+            filters.update(issuer=pre, registry=issuer.regk)
 
         elif typ == "received":
-            saids = self.verifier.reger.subjs.get(keys=pre)
-            creds = self.verifier.reger.cloneCreds(saids)
-
+            filters.update(subject=pre)
+
+        saiders = []
+        nxt = None  # cursor of next page if any
+        if typ in ("issued", "received"):
+            last = None
+            for cursor, saider in self.verifier.reger.getCredsIter(cursor=req.params.get("cursor"), **filters):
+                if limit is not None and len(saiders) >= limit:
+                    nxt = last
+                    break
+                saiders.append(saider)
+                last = cursor
+
+        creds = self.verifier.reger.cloneCreds(saiders)
+
+        if nxt is not None:
+            rep.set_header("X-Cursor", nxt)
         rep.status = falcon.HTTP_200
         rep.content_type = "application/json"
         rep.data = json.dumps(creds).encode("utf-8")
@@ -1045,13 +1085,15 @@ class KiwiDoer(doing.DoDoer):
                         self.postman.send(recipient=sub["i"], topic="credential", msg=bytearray(tevt))
                 elif cueKin == "kevt":
                     kevt = cue["msg"]
-                    witDoer = agenting.WitnessReceiptor(hab=self.hab, msg=bytearray(kevt))
+                    witDoer = agenting.WitnessReceiptor(hab=self.hab, msg=bytearray(kevt), parent=self)
                     self.extend([witDoer])
 
-                    while not witDoer.done:
+                    while witDoer.complete is None:
                         yield self.tock
 
-                    self.remove([witDoer])
+                    if not witDoer.complete:
+                        logger.error("Witness threshold not met for credential anchor of %s",
+                                     self.hab.pre)
                 elif cueKin == "multisig":
                     msg = dict(
                         op=cue["op"],
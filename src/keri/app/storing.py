@@ -308,10 +308,11 @@ class Respondant(doing.DoDoer):
                     wit = random.choice(kever.wits)
                     loc = obtaining.getwitnessbyprefix(wit)
 
-                    client = http.clienting.Client(hostname=loc.ip4, port=loc.http)
-                    clientDoer = http.clienting.ClientDoer(client=client)
-
+                    clientDoer = self.hab.clienter.lease(hostname=loc.ip4, port=loc.http)
                     self.extend([clientDoer])
+                    while clientDoer.client is None:
+                        yield self.tock
+                    client = clientDoer.client
 
                     fwd = forwarding.forward(pre=recipient, serder=exn, topic=topic)
                     msg = bytearray(fwd.raw)
@@ -8,7 +8,6 @@ import json
 
 import falcon
 from hio.base import doing
-from hio.core.http import clienting
 from hio.help import decking
 
 from keri.app import keeping, obtaining, httping
@@ -159,9 +158,11 @@ class WatcherClientRotateDoer(doing.DoDoer):
                 headers = ending.signature([signage])
 
                 loc = obtaining.getwitnessbyprefix(watcher)
-                client = clienting.Client(hostname=loc.ip4, port=loc.http)
-                clientDoer = clienting.ClientDoer(client=client)
+                clientDoer = self.hab.clienter.lease(hostname=loc.ip4, port=loc.http)
                 self.extend([clientDoer])
+                while clientDoer.client is None:
+                    yield self.tock
+                client = clientDoer.client
 
                 client.request(method="POST", path="/rotate", headers=headers, body=raw)
                 while not client.responses:
@@ -5,13 +5,14 @@ keri.core.coring module
 """
 import re
 import json
+import threading
 from typing import Union
 
 from dataclasses import dataclass, astuple
-from collections import namedtuple, deque
+from collections import namedtuple, deque, OrderedDict
 from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
-from math import ceil
+from math import ceil, lcm
 from fractions import Fraction
 
 import cbor2 as cbor
@@ -97,6 +98,10 @@ VEREX = b'(?P<ident>[A-Z]{4})(?P<major>[0-9a-f])(?P<minor>[0-9a-f])(?P<kind>[A-Z
 Rever = re.compile(VEREX)  # compile is faster
 MINSNIFFSIZE = 12 + VERFULLSIZE  # min bytes in buffer to sniff else need more
 
+# top level field of JSON serialization with plain string value
+FIELDREX = b'"(?P<label>[^"\\\\]+)":"(?P<value>[^"\\\\]*)"[,}]'
+Refield = re.compile(FIELDREX)  # compile is faster
+
 
 def Deversify(vs):
     """
@@ -307,9 +312,12 @@ def sniff(raw):
     if len(raw) < MINSNIFFSIZE:
         raise ShortageError("Need more bytes.")
 
-    match = Rever.search(raw)  # Rever's regex takes bytes
+    # version string must start within first 12 bytes so only search that span
+    # not the whole stream that raw may be the front of
+    match = Rever.search(raw, 0, MINSNIFFSIZE)  # Rever's regex takes bytes
     if not match or match.start() > 12:
-        raise VersionError("Invalid version string in raw = {}".format(raw))
+        raise VersionError("Invalid version string in raw = {}"
+                           "".format(bytes(raw[:MINSNIFFSIZE])))
 
     ident, major, minor, kind, size = match.group("ident", "major", "minor", "kind", "size")
     version = Versionage(major=int(major, 16), minor=int(minor, 16))
@@ -649,6 +657,9 @@ class Matter:
             variable sized material else None.
         _size (int): value for .size property. Number of quadlets of variable
             sized material else None.
+        _qb64b (bytes): memoized .qb64b computed on first access else None
+        _qb64 (str): memoized .qb64 computed on first access else None
+        _qb2 (bytes): memoized .qb2 computed on first access else None
         _infil (types.MethodType): creates qb64b from .raw and .code
                                    (fully qualified Base64)
         _exfil (types.MethodType): extracts .code and .raw from qb64b
@@ -720,6 +731,11 @@ class Matter:
     # Bards table maps first code char. converted to binary sextext  to hard size,
     # hs. Used for ._bexfil.
     Bards = ({b64ToB2(c): hs for c, hs in Hards.items()})
+    # memoized encodings. Instances are immutable once created so each encoding
+    # is computed at most once, on first access, and then shared.
+    _qb64b = None
+    _qb64 = None
+    _qb2 = None
 
     def __init__(self, raw=None, code=MtrDex.Ed25519N, rize=None,
                  qb64b=None, qb64=None, qb2=None, strip=False):
@@ -900,8 +916,11 @@ class Matter:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Computed once on first access and memoized since immutable
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
     @property
     def qb64(self):
@@ -909,16 +928,22 @@ class Matter:
         Property qb64:
         Returns Fully Qualified Base64 Version
         Assumes self.raw and self.code are correctly populated
+        Computed once on first access and memoized since immutable
         """
-        return self.qb64b.decode("utf-8")
+        if self._qb64 is None:
+            self._qb64 = self.qb64b.decode("utf-8")
+        return self._qb64
 
     @property
     def qb2(self):
         """
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
+        Computed once on first access and memoized since immutable
         """
-        return self._binfil()
+        if self._qb2 is None:
+            self._qb2 = self._binfil()
+        return self._qb2
 
     @property
     def transferable(self):
@@ -1659,6 +1684,98 @@ class Pather(Texter):
         return self._resolve(cur, ptr)
 
 
+class Vercache:
+    """
+    Vercache is bounded least recently used (LRU) memo of successful signature
+    verifications keyed by (verifier code, verifier key, signature, digest of
+    serialization). Only successful verifications are cached so a hit means
+    the signature verified before and need not be verified again.
+    Thread safe so may be shared by the workers of a verification executor.
+
+    Attributes:
+        size (int): max number of entries. Zero means cache disabled
+        hits (int): count of lookups found in cache
+        misses (int): count of lookups not found in cache
+
+    Usage:
+        Verfer.Cache.hits, Verfer.Cache.misses  # stats of shared cache
+        Verfer.Cache = Vercache(size=0)  # disable caching
+
+    """
+    Size = 16384  # default max entries
+
+    def __init__(self, size=None):
+        """
+        Initialize instance
+
+        Parameters:
+            size (int): max number of entries. Default is .Size
+        """
+        self.size = size if size is not None else self.Size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(verfer, sig, ser):
+        """
+        Returns cache key for verification of signature sig on serialization
+        ser with verfer. Uses digest of ser so that large serializations are
+        not held by the cache.
+
+        Parameters:
+            verfer (Verfer): instance of verifier key
+            sig (bytes): signature
+            ser (bytes): serialization
+        """
+        return (verfer.code, verfer.raw, bytes(sig), blake3.blake3(ser).digest())
+
+    def get(self, key):
+        """
+        Returns True if key of successful verification is in cache False otherwise
+        Updates hit or miss count.
+
+        Parameters:
+            key (tuple): cache key from .key
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def add(self, key):
+        """
+        Add key of successful verification to cache evicting least recently
+        used entry when full.
+
+        Parameters:
+            key (tuple): cache key from .key
+        """
+        if self.size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = True
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all entries and reset hit and miss counts
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
 class Verfer(Matter):
     """
     Verfer is Matter subclass with method to verify signature of serialization
@@ -1666,6 +1783,10 @@ class Verfer(Matter):
 
     See Matter for inherited attributes and properties:
 
+    Class Attributes:
+        Cache (Vercache): shared memo of successful verifications consulted by
+            .verify. None means no caching
+
     Attributes:
 
     Properties:
@@ -1674,6 +1795,7 @@ class Verfer(Matter):
         verify: verifies signature
 
     """
+    Cache = Vercache()
 
     def __init__(self, **kwa):
         """
@@ -1687,17 +1809,32 @@ class Verfer(Matter):
         else:
             raise ValueError("Unsupported code = {} for verifier.".format(self.code))
 
-    def verify(self, sig, ser):
+    def verify(self, sig, ser, cached=True):
         """
         Returns True if bytes signature sig verifies on bytes serialization ser
         using .raw as verifier public key for ._verify cipher suite determined
         by .code
 
+        Consults .Cache of successful verifications first when enabled
+
         Parameters:
             sig is bytes signature
             ser is bytes serialization
+            cached (bool): True means consult and update .Cache
+                False means always verify
         """
-        return (self._verify(sig=sig, ser=ser, key=self.raw))
+        cache = self.Cache
+        if not cached or cache is None or cache.size <= 0:
+            return (self._verify(sig=sig, ser=ser, key=self.raw))
+
+        key = cache.key(self, sig, ser)
+        if cache.get(key):
+            return True
+
+        if self._verify(sig=sig, ser=ser, key=self.raw):
+            cache.add(key)
+            return True
+        return False
 
     @staticmethod
     def _ed25519(sig, ser, key):
@@ -3067,13 +3204,53 @@ class Saider(Matter):
                         otherwise default is Serials.json
             label (str): id field label from Ids in which to inject said
 
+        """
+        saider, sad, _ = clas.saidive(sad=sad, code=code, kind=kind,
+                                      label=label, **kwa)
+        return (saider, sad)
+
+    @classmethod
+    def saidive(clas, sad: dict, *,
+                code: str = MtrDex.Blake3_256,
+                kind: str = None,
+                label: str = Ids.d, **kwa):
+        """
+        Derives said from sad and injects it into copy of sad like .saidify
+        but also returns the serialization of the injected sad. The said is
+        patched over the dummy in the serialization used for the digest so
+        the sad is serialized only once.
+
+        Returns:
+            result (tuple): of the form (saider, sad, ser) where saider is
+                    Saider instance generated from sad using code, sad is copy
+                    of parameter sad but with its label id field filled
+                    in with generated said from saider and ser is serialization
+                    of sad as bytes
+
+        Parameters:
+            sad (dict): serializable dict
+            code (str): digest type code from DigDex
+            kind (str): serialization algorithm of sad, one of Serials
+                        used to override that given by 'v' field if any in sad
+                        otherwise default is Serials.json
+            label (str): id field label from Ids in which to inject said
+
         """
         if label not in sad:
             raise KeyError("Missing id field labeled={} in sad.".format(label))
-        raw, sad = clas._derive(sad=sad, code=code, kind=kind, label=label)
+        raw, sad, ser = clas._digest(sad=sad, code=code, kind=kind, label=label)
         saider = clas(raw=raw, code=code, kind=kind, label=label, **kwa)
         sad[label] = saider.qb64
-        return (saider, sad)
+
+        # patch said over dummy when dummy only occurs once in ser otherwise
+        # some other field holds dummy chars so serialize again
+        dummy = (clas.Dummy * Matter.Sizes[code].fs).encode("utf-8")
+        offset = ser.find(dummy)
+        if offset >= 0 and ser.find(dummy, offset + 1) < 0:
+            ser = b'%b%b%b' % (ser[:offset], saider.qb64b, ser[offset + len(dummy):])
+        else:
+            ser = clas._serialize(sad, kind=kind)
+        return (saider, sad, ser)
 
     @classmethod
     def _derive(clas, sad: dict, *,
@@ -3086,6 +3263,31 @@ class Saider(Matter):
         Returns:
             raw (bytes): raw said from sad with dummy filled label id field
 
+        Parameters:
+            sad (dict): self addressed data to be injected with dummy and serialized
+            code (str): digest type code from DigDex
+            kind (str): serialization algorithm of sad, one of Serials
+                        used to override that given by 'v' field if any in sad
+                        otherwise default is Serials.json
+            label (str): id field label from Ids in which to inject dummy
+        """
+        raw, sad, _ = clas._digest(sad=sad, code=code, kind=kind, label=label)
+        return raw, sad  # raw digest and sad
+
+    @classmethod
+    def _digest(clas, sad: dict, *,
+                code: str = MtrDex.Blake3_256,
+                kind: str = None,
+                label: str = Ids.d, ):
+        """
+        Derives raw said from sad with .Dummy filled sad[label] serializing
+        sad only once. When versioned the serialization from Sizeify already
+        has the correct size so it is digested as is.
+
+        Returns:
+            result (tuple): (raw, sad, ser) raw said, dummy filled sad and
+                serialization of dummy filled sad that was digested
+
         Parameters:
             sad (dict): self addressed data to be injected with dummy and serialized
             code (str): digest type code from DigDex
@@ -3101,20 +3303,20 @@ class Saider(Matter):
         # fill id field denoted by label with dummy chars to get size correct
         sad[label] = clas.Dummy * Matter.Sizes[code].fs
         if 'v' in sad:  # if versioned then need to set size in version string
-            raw, ident, kind, sad, version = Sizeify(ked=sad, kind=kind)
+            # ser has correct size and is serialized with kind given by
+            # new 'v' so is same as ._serialize(sad, kind=kind)
+            ser, ident, kind, sad, version = Sizeify(ked=sad, kind=kind)
+        else:
+            ser = clas._serialize(sad, kind=kind)
 
-        # string now has
-        # correct size
         klas, size, length = clas.Digests[code]
-        # sad as 'v' verision string then use its kind otherwise passed in kind
-        cpa = [clas._serialize(sad, kind=kind)]  # raw pos arg class
         ckwa = dict()  # class keyword args
         if size:
             ckwa.update(digest_size=size)  # optional digest_size
         dkwa = dict()  # digest keyword args
         if length:
             dkwa.update(length=length)
-        return klas(*cpa, **ckwa).digest(**dkwa), sad  # raw digest and sad
+        return klas(ser, **ckwa).digest(**dkwa), sad, ser  # raw digest, sad, ser
 
     def derive(self, sad, code=None, **kwa):
         """
@@ -3242,6 +3444,9 @@ class Indexer:
         ._index is int value for .index property
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
+        ._qb64b is bytes memoized .qb64b computed on first access else None
+        ._qb64 is str memoized .qb64 computed on first access else None
+        ._qb2 is bytes memoized .qb2 computed on first access else None
 
     """
     Codex = IdrDex
@@ -3262,6 +3467,11 @@ class Indexer:
     # Bards table maps to hard size, hs, of code from bytes holding sextets
     # converted from first code char. Used for ._bexfil.
     Bards = ({b64ToB2(c): hs for c, hs in Hards.items()})
+    # memoized encodings. Instances are immutable once created so each encoding
+    # is computed at most once, on first access, and then shared.
+    _qb64b = None
+    _qb64 = None
+    _qb2 = None
 
     def __init__(self, raw=None, code=IdrDex.Ed25519_Sig, index=0,
                  qb64b=None, qb64=None, qb2=None, strip=False):
@@ -3319,17 +3529,17 @@ class Indexer:
             self._raw = bytes(raw)  # crypto ops require bytes not bytearray
 
         elif qb64b is not None:
-            self._exfil(qb64b)
+            fs = self._exfil(qb64b)
             if strip:  # assumes bytearray
-                del qb64b[:len(self.qb64b)]  # may be variable length fs
+                del qb64b[:fs]  # may be variable length fs
 
         elif qb64 is not None:
             self._exfil(qb64)
 
         elif qb2 is not None:
-            self._bexfil(qb2)
+            bfs = self._bexfil(qb2)
             if strip:  # assumes bytearray
-                del qb2[:len(self.qb2)]  # may be variable length fs
+                del qb2[:bfs]  # may be variable length fs
 
         else:
             raise EmptyMaterialError("Improper initialization need either "
@@ -3374,8 +3584,11 @@ class Indexer:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Computed once on first access and memoized since immutable
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
     @property
     def qb64(self):
@@ -3383,16 +3596,22 @@ class Indexer:
         Property qb64:
         Returns Fully Qualified Base64 Version
         Assumes self.raw and self.code are correctly populated
+        Computed once on first access and memoized since immutable
         """
-        return self.qb64b.decode("utf-8")
+        if self._qb64 is None:
+            self._qb64 = self.qb64b.decode("utf-8")
+        return self._qb64
 
     @property
     def qb2(self):
         """
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
+        Computed once on first access and memoized since immutable
         """
-        return self._binfil()
+        if self._qb2 is None:
+            self._qb2 = self._binfil()
+        return self._qb2
 
     def _infil(self):
         """
@@ -3423,6 +3642,10 @@ class Indexer:
     def _exfil(self, qb64b):
         """
         Extracts self.code, self.index, and self.raw from qualified base64 bytes qb64b
+
+        Returns:
+            fs (int): full size in chars of extracted material so stream may
+                be stripped without re-encoding
         """
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material, Need more characters.")
@@ -3487,6 +3710,7 @@ class Indexer:
         self._code = hard
         self._index = index
         self._raw = raw
+        return fs
 
     def _binfil(self):
         """
@@ -3531,6 +3755,10 @@ class Indexer:
     def _bexfil(self, qb2):
         """
         Extracts self.code, self.index, and self.raw from qualified base2 bytes qb2
+
+        Returns:
+            bfs (int): full size in bytes of extracted material so stream may
+                be stripped without re-encoding
         """
         if not qb2:  # empty need more bytes
             raise ShortageError("Empty material, Need more bytes.")
@@ -3588,6 +3816,7 @@ class Indexer:
         self._code = hard
         self._index = index
         self._raw = raw
+        return bfs
 
 
 class Siger(Indexer):
@@ -3711,6 +3940,9 @@ class Counter:
         ._count is int value for .count property
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
+        ._qb64b is bytes memoized .qb64b computed on first access else None
+        ._qb64 is str memoized .qb64 computed on first access else None
+        ._qb2 is bytes memoized .qb2 computed on first access else None
 
     """
     Codex = CtrDex
@@ -3759,6 +3991,11 @@ class Counter:
     # Bards table maps to hard size, hs, of code from bytes holding sextets
     # converted from first two code char. Used for ._bexfil.
     Bards = ({b64ToB2(c): hs for c, hs in Hards.items()})
+    # memoized encodings. Instances are immutable once created so each encoding
+    # is computed at most once, on first access, and then shared.
+    _qb64b = None
+    _qb64 = None
+    _qb2 = None
 
     def __init__(self, code=None, count=1, qb64b=None, qb64=None,
                  qb2=None, strip=False):
@@ -3837,8 +4074,11 @@ class Counter:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Computed once on first access and memoized since immutable
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
     @property
     def qb64(self):
@@ -3846,16 +4086,22 @@ class Counter:
         Property qb64:
         Returns Fully Qualified Base64 Version
         Assumes self.raw and self.code are correctly populated
+        Computed once on first access and memoized since immutable
         """
-        return self.qb64b.decode("utf-8")
+        if self._qb64 is None:
+            self._qb64 = self.qb64b.decode("utf-8")
+        return self._qb64
 
     @property
     def qb2(self):
         """
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
+        Computed once on first access and memoized since immutable
         """
-        return self._binfil()
+        if self._qb2 is None:
+            self._qb2 = self._binfil()
+        return self._qb2
 
     def _infil(self):
         """
@@ -4030,9 +4276,15 @@ class Sadder:
           ._size is int of number of bytes in serialed event only
           ._code is default code for .diger
           ._diger is Diger instance of digest of .raw
+          ._cache is dict of derived properties memoized on first access
 
     Note:
         loads and jumps of json use str whereas cbor and msgpack use bytes
+        When created from raw only the version string is parsed up front.
+        The body is deserialized into .ked on first access and derived
+        properties are memoized since .raw is immutable. For JSON the
+        .pre, .sn and .said are read from the leading plain string fields
+        of .raw so do not deserialize the body.
 
     """
 
@@ -4046,6 +4298,8 @@ class Sadder:
           raw is bytes of serialized event plus any attached signatures
           ked is key event dict or None
             if None its deserialized from raw
+            if raw also provided then ked must be the deserialization of raw
+            such as from Saider.saidive and raw is not serialized again
           kind is serialization kind string value or None (see namedtuple coring.Serials)
             supported kinds are 'json', 'cbor', 'msgpack', 'binary'
             if kind is None then its extracted from ked or raw
@@ -4055,6 +4309,8 @@ class Sadder:
         self._code = code  # need default code for .saider
         if raw:  # deserialize raw using property setter
             self.raw = raw  # raw property setter does the deserialization
+            if ked:  # already deserialized so not need to loads .raw
+                self._ked = ked
         elif ked:  # serialize ked using property setter
             self._kind = kind
             self.ked = ked  # ked property setter does the serialization
@@ -4076,6 +4332,21 @@ class Sadder:
         Note:
           loads and jumps of json use str whereas cbor and msgpack use bytes
 
+        """
+        ident, kind, version, size = self._sniff(raw=raw)
+        ked = loads(raw=raw, size=size, kind=kind)
+
+        return ked, ident, kind, version, size
+
+    @staticmethod
+    def _sniff(raw):
+        """
+        Returns tuple (ident, kind, version, size) parsed from the version
+        string of serialized event raw without deserializing its body.
+
+        Parameters:
+          raw is bytes of serialized event
+
         """
         ident, kind, version, size = sniff(raw)
         if version != Version:
@@ -4084,9 +4355,7 @@ class Sadder:
         if len(raw) < size:
             raise ShortageError("Need more bytes.")
 
-        ked = loads(raw=raw, size=size, kind=kind)
-
-        return ked, ident, kind, version, size
+        return ident, kind, version, size
 
 
     def _exhale(self, ked, kind=None):
@@ -4127,12 +4396,13 @@ class Sadder:
 
     def _clone(self, sad):
         self._raw = sad.raw
-        self._ked = sad.ked
+        self._ked = sad._ked  # may not yet be deserialized
         self._ident = sad.ident
         self._kind = sad.kind
         self._size = sad.size
         self._version = sad.version
-        self._saider = sad.saider
+        self._saider = sad._saider
+        self._cache = {}
 
 
     @property
@@ -4142,21 +4412,55 @@ class Sadder:
 
     @raw.setter
     def raw(self, raw):
-        """ raw property setter """
-        ked, ident, kind, version, size = self._inhale(raw=raw)
+        """ raw property setter. Body deserialized lazily by .ked getter """
+        ident, kind, version, size = self._sniff(raw=raw)
         self._raw = bytes(raw[:size])  # crypto ops require bytes not bytearray
-        self._ked = ked
+        self._ked = None
         self._ident = ident
         self._kind = kind
         self._version = version
         self._size = size
-        self._saider = Saider(qb64=ked["d"], code=self._code)
+        self._saider = None
+        self._cache = {}
 
     @property
     def ked(self):
-        """ ked property getter"""
+        """ ked property getter. Deserializes .raw on first access """
+        if self._ked is None:
+            ked = loads(raw=self._raw, size=self._size, kind=self._kind)
+            for label, value in self._cache.get("fields", {}).items():
+                if ked.get(label) != value:  # later duplicate label overrode
+                    raise DeserializationError("Ambiguous field = {} in {}."
+                                               "".format(label, self._raw))
+            self._ked = ked
         return self._ked
 
+    def _field(self, label):
+        """
+        Returns str value of top level field label. When .ked is not yet
+        deserialized and .kind is JSON then reads value from leading run of
+        plain string fields of .raw, such as v, t, d, i and s, without
+        deserializing the body. Otherwise returns value from .ked
+
+        Parameters:
+            label (str): top level field label
+        """
+        if self._ked is None and self._kind == Serials.json:
+            if "fields" not in self._cache:
+                fields = dict()
+                pos = 1  # after opening brace
+                while (match := Refield.match(self._raw, pos, self._size)):
+                    key = match.group("label").decode("utf-8")
+                    if key in fields:  # duplicate so defer to .ked
+                        fields = dict()
+                        break
+                    fields[key] = match.group("value").decode("utf-8")
+                    pos = match.end()
+                self._cache["fields"] = fields
+            if label in self._cache["fields"]:
+                return self._cache["fields"][label]
+        return self.ked[label]
+
     @ked.setter
     def ked(self, ked):
         """ ked property setter  assumes ._kind """
@@ -4169,6 +4473,7 @@ class Sadder:
         self._size = size
         self._version = version
         self._saider = Saider(qb64=ked["d"], code=self._code)
+        self._cache = {}
 
     @property
     def kind(self):
@@ -4178,7 +4483,7 @@ class Sadder:
     @kind.setter
     def kind(self, kind):
         """ kind property setter Assumes ._ked """
-        raw, ident, kind, ked, version = self._exhale(ked=self._ked, kind=kind)
+        raw, ident, kind, ked, version = self._exhale(ked=self.ked, kind=kind)
         size = len(raw)
         self._raw = raw[:size]
         self._ident = ident
@@ -4187,6 +4492,7 @@ class Sadder:
         self._size = size
         self._version = version
         self._saider = Saider(qb64=ked["d"], code=self._code)
+        self._cache = {}
 
 
     @property
@@ -4219,6 +4525,8 @@ class Sadder:
         Returns Diger of digest of self.raw
         diger (digest material) property getter
         """
+        if self._saider is None:
+            self._saider = Saider(qb64=self._field("d"), code=self._code)
         return self._saider
 
     @property
@@ -4281,9 +4589,15 @@ class Serder(Sadder):
           ._size is int of number of bytes in serialed event only
           ._code is default code for .diger
           ._diger is Diger instance of digest of .raw
+          ._cache is dict of derived properties memoized on first access
 
     Note:
         loads and jumps of json use str whereas cbor and msgpack use bytes
+        When created from raw only the version string is parsed up front.
+        The body is deserialized into .ked on first access and derived
+        properties are memoized since .raw is immutable. For JSON the
+        .pre, .sn and .said are read from the leading plain string fields
+        of .raw so do not deserialize the body.
 
     """
 
@@ -4297,6 +4611,8 @@ class Serder(Sadder):
           raw is bytes of serialized event plus any attached signatures
           ked is key event dict or None
             if None its deserialized from raw
+            if raw also provided then ked must be the deserialization of raw
+            such as from Saider.saidive and raw is not serialized again
           sad (Sadder) is clonable base class
           kind is serialization kind string value or None (see namedtuple coring.Serials)
             supported kinds are 'json', 'cbor', 'msgpack', 'binary'
@@ -4317,12 +4633,14 @@ class Serder(Sadder):
         One for each key.
         verfers property getter
         """
-        if "k" in self.ked:  # establishment event
-            keys = self.ked["k"]
-        else:  # non-establishment event
-            keys = []
+        if "verfers" not in self._cache:
+            if "k" in self.ked:  # establishment event
+                keys = self.ked["k"]
+            else:  # non-establishment event
+                keys = []
+            self._cache["verfers"] = [Verfer(qb64=key) for key in keys]
 
-        return [Verfer(qb64=key) for key in keys]
+        return list(self._cache["verfers"])  # copy so caller may mutate list
 
     @property
     def werfers(self):
@@ -4331,12 +4649,14 @@ class Serder(Sadder):
         One for each backer (witness).
         werfers property getter
         """
-        if "b" in self.ked:  # inception establishment event
-            wits = self.ked["b"]
-        else:  # non-establishment event
-            wits = []
+        if "werfers" not in self._cache:
+            if "b" in self.ked:  # inception establishment event
+                wits = self.ked["b"]
+            else:  # non-establishment event
+                wits = []
+            self._cache["werfers"] = [Verfer(qb64=wit) for wit in wits]
 
-        return [Verfer(qb64=wit) for wit in wits]
+        return list(self._cache["werfers"])  # copy so caller may mutate list
 
     @property
     def tholder(self):
@@ -4344,7 +4664,10 @@ class Serder(Sadder):
         Returns Tholder instance as converted from .ked['kt'] or None if missing.
 
         """
-        return (Tholder(sith=self.ked["kt"]) if "kt" in self.ked else None)
+        if "tholder" not in self._cache:
+            self._cache["tholder"] = (Tholder(sith=self.ked["kt"])
+                                      if "kt" in self.ked else None)
+        return self._cache["tholder"]
 
     @property
     def sn(self):
@@ -4353,16 +4676,19 @@ class Serder(Sadder):
         Returns:
             sn (int): converts hex str .ked["s"] to non neg int
         """
-        sn = self.ked["s"]
+        if "sn" not in self._cache:
+            sn = self._field("s")
 
-        if len(sn) > 32:
-            raise ValueError("Invalid sn = {} too large.".format(sn))
+            if len(sn) > 32:
+                raise ValueError("Invalid sn = {} too large.".format(sn))
 
-        sn = int(sn, 16)
-        if sn < 0:
-            raise ValueError("Negative sn={}.".format(sn))
+            sn = int(sn, 16)
+            if sn < 0:
+                raise ValueError("Negative sn={}.".format(sn))
 
-        return (sn)
+            self._cache["sn"] = sn
+
+        return self._cache["sn"]
 
     @property
     def pre(self):
@@ -4370,7 +4696,7 @@ class Serder(Sadder):
         Returns str qb64  of .ked["i"] (identifier prefix)
         pre (identifier prefix) property getter
         """
-        return self.ked["i"]
+        return self._field("i")
 
     @property
     def preb(self):
@@ -4415,6 +4741,15 @@ class Tholder:
             '1/2,1/2,1/4,1/4,1/4&1,1'
         .weighted is Boolean True if fractional weighted threshold False if numeric
         .size is int of minimun size of keys list
+        .clauses is list of (weights, need) compiled clauses of weighted
+            threshold where weights is tuple of int weights scaled by the
+            common denominator need of the clause. Empty when numeric
+        .keyed is tuple of (clause offset, int weight) of each key index when
+            weighted. Empty when numeric
+
+    Methods:
+        .satisfy returns True if indices satisfy threshold
+        .tally returns Tallier accumulator to check satisfaction incrementally
 
     Hidden:
         ._sith is original signing threshold
@@ -4422,6 +4757,8 @@ class Tholder:
         ._limen is extracted string for the next commitment to threshold
         ._weighted is Boolean, True if fractional weighted threshold False if numeric
         ._size is int minimum size of of keys list
+        ._clauses is compiled clauses of weighted threshold
+        ._keyed is compiled (clause offset, weight) of each key index
         ._satisfy is method reference of threshold specified verification method
         ._satisfy_numeric is numeric threshold verification method
         ._satisfy_weighted is fractional weighted threshold verification method
@@ -4470,6 +4807,8 @@ class Tholder:
             self._size = self._thold  # used to verify that keys list size is at least size
             self._weighted = False
             self._satisfy = self._satisfy_numeric
+            self._clauses = []
+            self._keyed = ()
             self._sith = "{:x}".format(sith)  # store in event form as str
             self._limen = self._sith  # just use hex string
 
@@ -4500,6 +4839,17 @@ class Tholder:
             self._size = sum(len(clause) for clause in thold)
             self._satisfy = self._satisfy_weighted
 
+            # compile each clause to int weights over its common denominator
+            # so satisfaction is exact integer sums instead of Fraction math
+            self._clauses = []
+            keyed = []
+            for c, clause in enumerate(thold):
+                need = lcm(*[w.denominator for w in clause])
+                weights = tuple(w.numerator * (need // w.denominator) for w in clause)
+                self._clauses.append((weights, need))
+                keyed.extend((c, w) for w in weights)
+            self._keyed = tuple(keyed)
+
             # extract limen from sith by joining ratio str elements of each
             # clause with "," and joining clauses with "&"
             # [["1/2", "1/2", "1/4", "1/4", "1/4"], ["1", "1"]] becomes
@@ -4531,6 +4881,30 @@ class Tholder:
         """ limen property getter """
         return self._limen
 
+    @property
+    def clauses(self):
+        """ clauses property getter """
+        return self._clauses
+
+    @property
+    def keyed(self):
+        """ keyed property getter """
+        return self._keyed
+
+    def tally(self, indices=None, keys=None):
+        """
+        Returns Tallier accumulator of this threshold preloaded with indices
+
+        Parameters:
+            indices is optional list of indices (offsets into key list) of
+                verified signatures
+            keys is optional list of qb64 keys into which indices are offsets
+        """
+        tallier = Tallier(tholder=self, keys=keys)
+        if indices:
+            tallier.extend(indices)
+        return tallier
+
     def satisfy(self, indices):
         """
         Returns True if indices list of verified signature key indices satisfies
@@ -4570,25 +4944,88 @@ class Tholder:
             if not indices:  # empty indices
                 return False
 
-            # remove duplicates with set, sort low to high
-            indices = sorted(set(indices))
-            sats = [False] * self.size  # default all satifactions to False
-            for idx in indices:
-                sats[idx] = True  # set verified signature index to True
-
-            wio = 0  # weight index offset
-            for clause in self.thold:
-                cw = 0  # init clause weight
-                for w in clause:
-                    if sats[wio]:  # verified signature so weight applies
-                        cw += w
-                    wio += 1
-                if cw < 1:  # each clause must sum to at least 1
-                    return False
-
-            return True  # all clauses including final one cw >= 1
+            return self.tally(indices).satisfied  # each clause sums to >= 1
 
         except Exception as ex:
             return False
 
         return False
+
+
+class Tallier:
+    """
+    Tallier is mutable satisfaction accumulator of a Tholder. Indices of
+    verified signatures are added one at a time and each add updates the
+    satisfaction in O(1) using the integer weights compiled by the Tholder.
+    Duplicate indices are ignored.
+
+    Attributes:
+        tholder (Tholder): threshold being tallied
+        keys (list | None): qb64 keys into which indices are offsets when known
+        indices (set): unique indices added so far
+
+    Properties:
+        satisfied (bool): True if indices added so far satisfy threshold
+
+    Usage:
+        tallier = tholder.tally()
+        for siger in sigers:
+            if tallier.add(siger.index):
+                break  # satisfied
+
+    """
+
+    def __init__(self, tholder, keys=None):
+        """
+        Initialize instance
+
+        Parameters:
+            tholder (Tholder): threshold to tally
+            keys (list): optional qb64 keys into which indices are offsets
+        """
+        self.tholder = tholder
+        self.keys = keys
+        self.indices = set()
+        self._sums = [0] * len(tholder.clauses)  # weight sum of each clause
+        self._unmet = len(tholder.clauses)  # count of clauses not yet met
+        self._invalid = False  # True once index beyond weighted keys added
+
+    @property
+    def satisfied(self):
+        """ satisfied property getter """
+        if self.tholder.weighted:
+            return not self._invalid and self._unmet == 0 and bool(self.indices)
+        return self.tholder.thold > 0 and len(self.indices) >= self.tholder.thold
+
+    def add(self, index):
+        """
+        Returns True if threshold satisfied after adding index False otherwise
+
+        Parameters:
+            index (int): offset into key list of verified signature
+        """
+        if index in self.indices:
+            return self.satisfied
+        self.indices.add(index)
+        if self.tholder.weighted:
+            if not 0 <= index < self.tholder.size:
+                self._invalid = True
+                return False
+            c, w = self.tholder.keyed[index]
+            need = self.tholder.clauses[c][1]
+            if self._sums[c] < need <= self._sums[c] + w:
+                self._unmet -= 1
+            self._sums[c] += w
+        return self.satisfied
+
+    def extend(self, indices):
+        """
+        Returns True if threshold satisfied after adding each of indices False
+        otherwise
+
+        Parameters:
+            indices (Iterable): of offsets into key list of verified signatures
+        """
+        for index in indices:
+            self.add(index)
+        return self.satisfied
@@ -3,10 +3,14 @@
 keri.core.eventing module
 
 """
+import copy
 import datetime
 import json
 import logging
+import os
+import time
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from dataclasses import dataclass, astuple
 from urllib.parse import urlsplit
 
@@ -456,7 +460,137 @@ def validateSN(sn, inceptive=None):
     return sn
 
 
-def verifySigs(serder, sigers, verfers):
+def verifyChunk(chunk):
+    """
+    Returns list of bool results of verifying each (verfer, sig, ser) triple
+    in chunk where verfer is Verfer instance or its qb64b, sig is raw signature
+    bytes and ser is signed serialization bytes. Does not consult Verfer.Cache
+    because caller already has.
+    Module level so that it may be pickled to worker processes.
+
+    Parameters:
+        chunk (list): of (verfer, sig, ser) triples
+    """
+    results = []
+    for verfer, sig, ser in chunk:
+        if not isinstance(verfer, Verfer):
+            verfer = Verfer(qb64b=verfer)
+        results.append(verfer.verify(sig, ser, cached=False))
+    return results
+
+
+def verifyAll(triples, vex=None):
+    """
+    Returns list of bool results of verifying each (verfer, sig, ser) triple
+    in order. Verifies on vex, Verexer instance, when provided and there is
+    more than one signature to verify otherwise verifies inline.
+
+    Parameters:
+        triples (list): of (verfer, sig, ser) triples
+        vex (Verexer): optional signature verification executor
+    """
+    if vex is not None and len(triples) > 1:
+        return vex.verify(triples)
+    return [verfer.verify(sig, ser) for verfer, sig, ser in triples]
+
+
+class Verexer:
+    """
+    Verexer (verification executor) verifies batches of signatures in parallel
+    on a pool of workers. Ed25519 verification in libsodium is called via
+    ctypes which releases the GIL so a thread pool scales with cores. A process
+    pool may be used instead when the GIL is not released.
+
+    Opt in per Kevery by passing vex=Verexer() to Kevery. Signatures of one
+    event are split into chunks of at most .chunk so that a multisig event or
+    a burst of receipts is verified across .workers concurrently.
+
+    Attributes:
+        workers (int): number of workers in pool
+        chunk (int): max number of signatures submitted per worker task
+        process (bool): True means process pool, False means thread pool
+        executor (Executor): pool executing verification chunks
+
+    Usage:
+        with Verexer(workers=4) as vex:
+            kvy = Kevery(db=db, vex=vex)
+
+    """
+    Chunk = 8  # default max signatures per submitted task
+
+    def __init__(self, workers=None, chunk=None, process=False):
+        """
+        Initialize instance
+
+        Parameters:
+            workers (int): number of workers. Default is os.cpu_count()
+            chunk (int): max signatures per task. Default is .Chunk
+            process (bool): True means use process pool else thread pool
+        """
+        self.workers = workers if workers else (os.cpu_count() or 1)
+        self.chunk = chunk if chunk else self.Chunk
+        self.process = True if process else False
+        klas = ProcessPoolExecutor if self.process else ThreadPoolExecutor
+        self.executor = klas(max_workers=self.workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def verify(self, triples):
+        """
+        Returns list of bool results of verifying each (verfer, sig, ser)
+        triple in triples in order. Consults Verfer.Cache first so that only
+        signatures not already verified are submitted to the workers.
+
+        Parameters:
+            triples (list): of (verfer, sig, ser) triples
+        """
+        triples = list(triples)
+        results = [False] * len(triples)
+
+        # consult shared cache first so only misses are submitted to workers
+        cache = Verfer.Cache
+        if cache is not None and cache.size > 0:
+            keys = [cache.key(verfer, sig, ser) for verfer, sig, ser in triples]
+            for i, key in enumerate(keys):
+                results[i] = cache.get(key)
+        else:
+            keys = None
+
+        misses = [i for i, verified in enumerate(results) if not verified]
+        if not misses:
+            return results
+
+        if self.process:  # Verfer is not sent across process boundary
+            pending = [(triples[i][0].qb64b, bytes(triples[i][1]), bytes(triples[i][2]))
+                       for i in misses]
+        else:
+            pending = [triples[i] for i in misses]
+
+        size = min(self.chunk, ceil(len(pending) / self.workers))
+        futures = [self.executor.submit(verifyChunk, pending[i:i + size])
+                   for i in range(0, len(pending), size)]
+        verifieds = []
+        for future in futures:
+            verifieds.extend(future.result())
+
+        for i, verified in zip(misses, verifieds):
+            results[i] = verified
+            if verified and keys is not None:
+                cache.add(keys[i])
+        return results
+
+    def close(self):
+        """
+        Shutdown executor and wait for pending verifications to finish
+        """
+        self.executor.shutdown(wait=True)
+
+
+def verifySigs(serder, sigers, verfers, vex=None):
     """
     Returns tuple of (vsigers, vindices) where:
         vsigers is list  of unique verified sigers with assigned verfer
@@ -471,6 +605,7 @@ def verifySigs(serder, sigers, verfers):
         serder is Serder of signed event
         sigers is list of indexed Siger instances (signatures)
         verfers is list of Verfer instance (public keys)
+        vex (Verexer): optional executor to verify sigers in parallel
 
     """
     if sigers is None:
@@ -492,15 +627,17 @@ def verifySigs(serder, sigers, verfers):
     # create lists of unique verified signatures and indices
     vindices = []
     vsigers = []
-    for siger in usigers:
-        if siger.verfer.verify(siger.raw, serder.raw):
+    results = verifyAll([(siger.verfer, siger.raw, serder.raw) for siger in usigers],
+                        vex=vex)
+    for siger, verified in zip(usigers, results):
+        if verified:
             vindices.append(siger.index)
             vsigers.append(siger)
 
     return (vsigers, vindices)
 
 
-def validateSigs(serder, sigers, verfers, tholder):
+def validateSigs(serder, sigers, verfers, tholder, vex=None, tallier=None):
     """
     Validates signatures given by sigers using keys given by verfers on msg
     given by serder subject to threshold given by tholder. Returns subset of
@@ -519,6 +656,9 @@ def validateSigs(serder, sigers, verfers, tholder):
             Index is offset into verfers list each providing verification key
         verfers (Iterable): Verfer instances of keys
         tholder (Tholder): instance of signing threshold (sith)
+        vex (Verexer): optional executor to verify sigers in parallel
+        tallier (Tallier): optional tally of tholder from earlier validation of
+            serder to extend with verified indices instead of tallying afresh
 
         seqner is Seqner instance of delegating event sequence number.
             If this event is not delegated then seqner is ignored
@@ -533,7 +673,8 @@ def validateSigs(serder, sigers, verfers, tholder):
                                         [verfer.qb64 for verfer in verfers]))
 
     # get unique verified sigers and indices lists from sigers list
-    sigers, indices = verifySigs(serder=serder, sigers=sigers, verfers=verfers)
+    sigers, indices = verifySigs(serder=serder, sigers=sigers, verfers=verfers,
+                                 vex=vex)
     # sigers  now have .verfer assigned
 
     # check if satisfies threshold for fully signed
@@ -541,7 +682,9 @@ def validateSigs(serder, sigers, verfers, tholder):
         raise ValidationError("No verified signatures for message={}."
                               "".format(serder.ked))
 
-    valid = tholder.satisfy(indices)
+    if tallier is None:
+        tallier = tholder.tally()
+    valid = tallier.extend(indices)
 
     return (sigers, valid)
 
@@ -672,12 +815,13 @@ def incept(keys,
         prefixer = Prefixer(ked=ked, code=code)  # Derive AID from ked and code
 
     ked["i"] = prefixer.qb64  # update pre element in ked with pre qb64
+    raw = b''  # serialize ked below unless saidive already serialized it
     if prefixer.digestive:
         ked["d"] = prefixer.qb64
     else:
-        _, ked = coring.Saider.saidify(sad=ked)
+        _, ked, raw = coring.Saider.saidive(sad=ked)
 
-    return Serder(ked=ked)  # return serialized ked
+    return Serder(raw=raw, ked=ked)  # return serialized ked
 
 
 def delcept(keys,
@@ -771,12 +915,13 @@ def delcept(keys,
                          " digestive".format(prefixer.code))
 
     ked["i"] = prefixer.qb64  # update pre element in ked with pre qb64
+    raw = b''  # serialize ked below unless saidive already serialized it
     if prefixer.digestive:
         ked["d"] = prefixer.qb64
     else:
-        _, ked = coring.Saider.saidify(sad=ked)
+        _, ked, raw = coring.Saider.saidive(sad=ked)
 
-    return Serder(ked=ked)  # return serialized ked
+    return Serder(raw=raw, ked=ked)  # return serialized ked
 
 
 def rotate(pre,
@@ -888,9 +1033,9 @@ def rotate(pre,
                ba=adds,  # list of qb64 may be empty
                a=data,  # list of seals
                )
-    _, ked = coring.Saider.saidify(sad=ked)
+    _, ked, raw = coring.Saider.saidive(sad=ked)
 
-    return Serder(ked=ked)  # return serialized ked
+    return Serder(raw=raw, ked=ked)  # return serialized ked
 
 
 def deltate(pre,
@@ -998,9 +1143,9 @@ def deltate(pre,
                ba=adds,  # list of qb64 may be empty
                a=data,  # list of seals ordered mappings may be empty
                )
-    _, ked = coring.Saider.saidify(sad=ked)
+    _, ked, raw = coring.Saider.saidive(sad=ked)
 
-    return Serder(ked=ked)  # return serialized ked
+    return Serder(raw=raw, ked=ked)  # return serialized ked
 
 
 def interact(pre,
@@ -1038,9 +1183,9 @@ def interact(pre,
                p=dig,  # qb64 digest of prior event
                a=data,  # list of seals
                )
-    _, ked = coring.Saider.saidify(sad=ked)
+    _, ked, raw = coring.Saider.saidive(sad=ked)
 
-    return Serder(ked=ked)  # return serialized ked
+    return Serder(raw=raw, ked=ked)  # return serialized ked
 
 
 def receipt(pre,
@@ -1273,9 +1418,9 @@ def query(route="",
                rr=replyRoute,
                q=query,
                )
-    _, ked = coring.Saider.saidify(sad=ked)
+    _, ked, raw = coring.Saider.saidive(sad=ked)
 
-    return Serder(ked=ked)  # return serialized ked
+    return Serder(raw=raw, ked=ked)  # return serialized ked
 
 
 def reply(route="",
@@ -1326,14 +1471,9 @@ def reply(route="",
                a=data if data else {},  # attributes
                )
 
-    _, sad = coring.Saider.saidify(sad=sad, kind=kind, label=label)
+    _, sad, raw = coring.Saider.saidive(sad=sad, kind=kind, label=label)
 
-    saider = coring.Saider(qb64=sad[label])
-    if not saider.verify(sad=sad, kind=kind, label=label, prefixed=True):
-        raise ValidationError("Invalid said = {} for reply msg={}."
-                              "".format(saider.qb64, sad))
-
-    return Serder(ked=sad)  # return serialized Self-Addressed Data (SAD)
+    return Serder(raw=raw, ked=sad)  # return serialized Self-Addressed Data (SAD)
 
 
 def expose(route="",
@@ -1381,9 +1521,9 @@ def expose(route="",
                a=data if data else {},  # attributes
                )
 
-    _, sad = coring.Saider.saidify(sad=sad)
+    _, sad, raw = coring.Saider.saidive(sad=sad)
 
-    return Serder(ked=sad)  # return serialized Self-Addressed Data (SAD)
+    return Serder(raw=raw, ked=sad)  # return serialized Self-Addressed Data (SAD)
 
 
 def messagize(serder, *, sigers=None, seal=None, wigers=None, cigars=None,
@@ -1551,6 +1691,11 @@ class Kever:
         .local is Boolean (from kevery when provided)
             True means only process msgs for own events if .prefixes is not empty
             False means only process msgs for not own events if .prefixes is not empty
+        .vex is reference to Kevery.vex Verexer when provided to verify
+            signatures in parallel. None means verify inline
+        .tallies is reference to Kevery.tallies dict when provided of Talliers of
+            verified signature indices of partially signed escrowed events
+            keyed by event SAID. None means tally afresh each time
         .version is version of current event state
         .prefixer is prefixer instance for current event state
         .sn is sequence number int
@@ -1583,7 +1728,7 @@ class Kever:
     def __init__(self, *, state=None, serder=None, sigers=None, wigers=None,
                  db=None, estOnly=None, seqner=None, saider=None, firner=None, dater=None,
                  cues=None, prefixes=None, local=False,
-                 check=False):
+                 check=False, vex=None, tallies=None):
         """
         Create incepting kever and state from inception serder
         Verify incepting serder against sigers raises ValidationError if not
@@ -1622,6 +1767,10 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            vex (Verexer): reference to Kevery.vex signature verification
+                executor when provided. None means verify inline
+            tallies (dict): reference to Kevery.tallies of Talliers of
+                partially signed escrowed events when provided
         """
         if not (state or (serder and sigers)):
             raise ValueError("Missing required arguments. Need state or serder"
@@ -1633,6 +1782,8 @@ class Kever:
         self.cues = cues
         self.prefixes = prefixes if prefixes is not None else db.prefixes
         self.local = True if local else False
+        self.vex = vex
+        self.tallies = tallies
 
         if state:  # preload from state
             self.reload(state)
@@ -1679,13 +1830,19 @@ class Kever:
         wits = serder.ked["b"]
         # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
         # all validated above so may add to KEL and FEL logs as first seen
-        fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
-                                first=True if not check else False, seqner=seqner, saider=saider,
-                                firner=firner, dater=dater)
-        if fn is not None:  # first is non-idempotent for fn check mode fn is None
-            self.fn = fn
-            self.dater = Dater(dts=dts)
-            self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+        def accept():  # logs and key state commit at once so never disagree
+            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
+                                    first=True if not check else False, seqner=seqner, saider=saider,
+                                    firner=firner, dater=dater)
+            staged = dict()
+            if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                staged.update(fn=fn, dater=Dater(dts=dts))
+                self.db.states.pin(keys=self.prefixer.qb64,
+                                   val=self.stage(**staged).state())
+            return staged
+
+        # assign only once committed so aborted transaction leaves no state
+        vars(self).update(self.db.atomic(accept))
 
     @property
     def kevers(self):
@@ -1908,31 +2065,34 @@ class Kever:
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
-                                    first=True if not check else False, seqner=seqner, saider=saider,
-                                    firner=firner, dater=dater)
-
-            # nxt and signatures verify so update state
-            self.sn = sn
-            self.serder = serder  # need whole serder for digest agility compare
-            self.ilk = ilk
-            self.tholder = tholder
-            self.verfers = serder.verfers
-            # update .nexter
+            # nxt and signatures verify so new state
             nxt = ked["n"]
-            self.nexter = Nexter(qb64=nxt) if nxt else None  # check for empty
-
-            self.toad = toad
-            self.wits = wits
-            self.cuts = cuts
-            self.adds = adds
-
-            # last establishment event location need this to recognize recovery events
-            self.lastEst = LastEstLoc(s=self.sn, d=self.serder.saider.qb64)
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fn = fn
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            update = dict(sn=sn,
+                          serder=serder,  # need whole serder for digest agility compare
+                          ilk=ilk,
+                          tholder=tholder,
+                          verfers=serder.verfers,
+                          nexter=Nexter(qb64=nxt) if nxt else None,  # check for empty
+                          toad=toad,
+                          wits=wits,
+                          cuts=cuts,
+                          adds=adds,
+                          # last establishment event location need this to recognize recovery events
+                          lastEst=LastEstLoc(s=sn, d=serder.saider.qb64))
+
+            def accept():  # logs and key state commit at once so never disagree
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
+                                        first=True if not check else False, seqner=seqner, saider=saider,
+                                        firner=firner, dater=dater)
+                staged = dict(update)
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    staged.update(fn=fn, dater=Dater(dts=dts))
+                    self.db.states.pin(keys=self.prefixer.qb64,
+                                       val=self.stage(**staged).state())
+                return staged
+
+            # assign only once committed so aborted transaction leaves no state
+            vars(self).update(self.db.atomic(accept))
 
 
         elif ilk == Ilks.ixn:  # subsequent interaction event
@@ -1969,17 +2129,20 @@ class Kever:
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    first=True if not check else False)  # First seen accepted
+            def accept():  # logs and key state commit at once so never disagree
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                        first=True if not check else False)  # First seen accepted
 
-            # update state
-            self.sn = sn
-            self.serder = serder  # need for digest agility includes .serder.diger
-            self.ilk = ilk
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fn = fn
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+                # new state, serder needed for digest agility includes .serder.diger
+                staged = dict(sn=sn, serder=serder, ilk=ilk)
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    staged.update(fn=fn, dater=Dater(dts=dts))
+                    self.db.states.pin(keys=self.prefixer.qb64,
+                                       val=self.stage(**staged).state())
+                return staged
+
+            # assign only once committed so aborted transaction leaves no state
+            vars(self).update(self.db.atomic(accept))
 
         else:  # unsupported event ilk so discard
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
@@ -2159,13 +2322,15 @@ class Kever:
                                             serder.ked))
 
         # get unique verified sigers and indices lists from sigers list
-        sigers, indices = verifySigs(serder=serder, sigers=sigers, verfers=verfers)
+        sigers, indices = verifySigs(serder=serder, sigers=sigers, verfers=verfers,
+                                     vex=self.vex)
         # sigers  now have .verfer assigned
 
         werfers = [Verfer(qb64=wit) for wit in wits]
 
         # get unique verified wigers and windices lists from wigers list
-        wigers, windices = verifySigs(serder=serder, sigers=wigers, verfers=werfers)
+        wigers, windices = verifySigs(serder=serder, sigers=wigers, verfers=werfers,
+                                      vex=self.vex)
         # each wiger now has werfer of corresponding wit
 
         # check if fully signed
@@ -2173,7 +2338,11 @@ class Kever:
             raise ValidationError("No verified signatures for evt = {}."
                                   "".format(serder.ked))
 
-        if not tholder.satisfy(indices):  # at least one but not enough
+        tallier = self.tally(serder=serder, verfers=verfers, tholder=tholder,
+                             indices=indices)
+        if not tallier.extend(indices):  # at least one but not enough
+            if self.tallies is not None:  # keep tally for next escrow pass
+                self.tallies[serder.said] = tallier
             self.escrowPSEvent(serder=serder, sigers=sigers, wigers=wigers)
             if seqner and saider:
                 self.escrowPACouple(serder=serder, seqner=seqner, saider=saider)
@@ -2207,6 +2376,28 @@ class Kever:
                                                                                                  serder.ked))
         return (sigers, delegator, wigers)
 
+    def tally(self, serder, verfers, tholder, indices):
+        """
+        Returns Tallier of verified signature indices on event serder. Reuses
+        the Tallier kept in .tallies from an earlier escrow pass of serder when
+        it tallied the same keys and threshold and all its indices are among
+        the verified indices now presented so each pass only adds the indices
+        of newly attached signatures. Otherwise returns fresh Tallier.
+
+        Parameters:
+            serder (Serder): instance of event
+            verfers (list): of Verfer instances of signing keys of event
+            tholder (Tholder): signing threshold of event
+            indices (list): of int offsets of verified signatures presented
+        """
+        tallier = self.tallies.get(serder.said) if self.tallies is not None else None
+        keys = [verfer.qb64 for verfer in verfers]
+        if (tallier is None or tallier.keys != keys or
+                tallier.tholder.sith != tholder.sith or
+                not tallier.indices.issubset(indices)):
+            tallier = tholder.tally(keys=keys)
+        return tallier
+
     def validateDelegation(self, serder, sigers, wigers=None, seqner=None, saider=None):
         """
         Returns delegator's qb64 identifier prefix if seal instance of
@@ -2339,22 +2530,39 @@ class Kever:
                 If cloned mode then dater maybe provided (not None)
                 When dater provided then use dater for first seen datetime
         """
-        fn = None
         dgkey = dgKey(serder.preb, serder.saidb)
         dtsb = helping.nowIso8601().encode("utf-8")
-        self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if wits:
-            self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
-        self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
-        if first:  # append event dig to first seen database in order
-            if seqner and saider:  # authorized delegated or issued event
-                couple = seqner.qb64b + saider.qb64b
-                self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
-            fn = self.db.appendFe(serder.preb, serder.saidb)
+        if first and dater:  # cloned replay use original's dts from dater
+            fdtsb = dater.dtsb
+        else:
+            fdtsb = dtsb
+
+        def log():  # all logs commit at once, rerun if map grown
+            fn = None
+            self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if wits:
+                self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
+            self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
+            if first:  # append event dig to first seen database in order
+                if seqner and saider:  # authorized delegated or issued event
+                    couple = seqner.qb64b + saider.qb64b
+                    self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
+                fn = self.db.appendFe(serder.preb, serder.saidb)
+                self.db.setDts(dgkey, fdtsb)  # first seen so set dts to now
+                self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
+            self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+            if serder.est:  # index so authoritative est event lookup is a seek
+                self.db.setEst(snKey(serder.preb, serder.sn), serder.saidb)
+            self.db.indexAnchors(serder)  # index so anchor lookup is a key read
+            return fn
+
+        fn = self.db.atomic(log)
+        if first:
+            dtsb = fdtsb
             if firner and fn != firner.sn:  # cloned replay but replay fn not match
                 if self.cues is not None:
                     self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
@@ -2362,13 +2570,8 @@ class Kever:
                 logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
                             "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
                             serder.preb, fn, firner.sn, serder.pretty())
-            if dater:  # cloned replay use original's dts from dater
-                dtsb = dater.dtsb
-            self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
-            self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
             logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
                         serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
-        self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
         logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
                     serder.preb, serder.pretty())
         return (fn, dtsb.decode("utf-8"))  # (fn int, dts str) if first else (None, dts str)
@@ -2384,12 +2587,15 @@ class Kever:
             wigers is optional list of Siger instance of indexed witness sigs
         """
         dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addPse(snKey(serder.preb, serder.sn), serder.saidb)
+        def log():  # commit all escrow logs at once, rerun if map grown
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.db.putEvt(dgkey, serder.raw)
+            self.db.addPse(snKey(serder.preb, serder.sn), serder.saidb)
+
+        self.db.atomic(log)
         logger.info("Kever state: Escrowed partially signed or delegated "
                     "event = %s\n", serder.ked)
 
@@ -2427,18 +2633,34 @@ class Kever:
             saider is Diger instance of digest of delegator/issuer
         """
         dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-        self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if seqner and saider:
-            couple = seqner.qb64b + saider.qb64b
-            self.db.putPde(dgkey, couple)
+        def log():  # commit all escrow logs at once, rerun if map grown
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
+            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if seqner and saider:
+                couple = seqner.qb64b + saider.qb64b
+                self.db.putPde(dgkey, couple)
+
+            self.db.putEvt(dgkey, serder.raw)
+            return self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb)
 
-        self.db.putEvt(dgkey, serder.raw)
+        result = self.db.atomic(log)
         logger.info("Kever state: Escrowed partially witnessed "
                     "event = %s\n", serder.ked)
-        return self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb)
+        return result
+
+    def stage(self, **kwa):
+        """
+        Returns shallow copy of self with attributes replaced by kwa so that
+        the key state of an event may be saved before self is updated
+
+        Parameters:
+            kwa (dict): attribute names and values of new key state
+        """
+        kever = copy.copy(self)
+        vars(kever).update(kwa)
+        return kever
 
     def state(self, kind=Serials.json):
         """
@@ -2513,6 +2735,19 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+        vex (Verexer): signature verification executor shared with kevers to
+                verify signatures in parallel. None means verify inline
+        tallies (dict): of Talliers shared with kevers of the verified signature
+                indices of partially signed escrowed events keyed by event SAID
+                so each escrow pass only tallies newly attached signatures.
+                Repeat verifications are served by Verfer.Cache
+        sweep (float | None): seconds between full sweeps of all escrows.
+                None means process every escrowed item on every call to
+                .processEscrows. Otherwise only the escrowed items of prefixes
+                woken by new events, receipts or dependencies are processed
+                between sweeps.
+        swept (float | None): monotonic time of last full escrow sweep
+        escrowing (bool): True means currently processing escrows
 
 
     Properties:
@@ -2530,9 +2765,11 @@ class Kevery:
     TimeoutURE = 3600  # seconds to timeout unverified receipt escrows
     TimeoutVRE = 3600  # seconds to timeout unverified transferable receipt escrows
     TimeoutKSN = 3600  # seconds to timeout key state notice message escrows
+    EscrowSweep = 60.0  # seconds between full escrow sweeps when event driven
 
     def __init__(self, *, evts=None, cues=None, db=None, rvy=None,
-                 lax=True, local=False, cloned=False, direct=True, check=False):
+                 lax=True, local=False, cloned=False, direct=True, check=False,
+                 vex=None, sweep=None):
         """
         Initialize instance:
 
@@ -2555,6 +2792,12 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            vex (Verexer): opt in signature verification executor to verify
+                signatures in parallel. None means verify inline
+            sweep (float | None): seconds between full escrow sweeps. None
+                means poll every escrowed item on every .processEscrows call.
+                Otherwise event driven so between sweeps only process escrowed
+                items of woken prefixes. See .EscrowSweep
         """
         self.evts = evts if evts is not None else decking.Deck()  # subclass of deque
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
@@ -2567,6 +2810,11 @@ class Kevery:
         self.cloned = True if cloned else False  # process as cloned
         self.direct = True if direct else False  # process as direct mode
         self.check = True if check else False  # process as check mode
+        self.vex = vex  # optional parallel signature verification executor
+        self.tallies = dict()  # Talliers of partially signed escrowed evts by said
+        self.sweep = sweep  # None means poll all escrows every pass
+        self.swept = None  # time of last full escrow sweep
+        self.escrowing = False  # True while processing escrows
 
     @property
     def kevers(self):
@@ -2582,6 +2830,83 @@ class Kevery:
         """
         return self.db.prefixes
 
+    def wake(self, pre):
+        """
+        Mark escrowed items of identifier prefix pre and of any prefixes
+        waiting on the KEL of pre for processing on next escrow pass.
+
+        Parameters:
+            pre (str | bytes): qb64 identifier prefix
+        """
+        if not isinstance(pre, str):
+            pre = bytes(pre).decode("utf-8")
+        self.db.wakes.add(pre)
+        self.db.wakes.update(self.db.waits.pop(pre, dict()).values())
+
+    def wait(self, dep, pre, item):
+        """
+        Register that escrowed item with key item of identifier prefix pre is
+        waiting on the KEL of identifier prefix dep so that accepting an event
+        of dep wakes pre.
+
+        Parameters:
+            dep (str | bytes): qb64 identifier prefix waited on
+            pre (str | bytes): qb64 identifier prefix of escrowed item
+            item (Hashable): unique key of escrowed item such as its said
+        """
+        if not isinstance(dep, str):
+            dep = bytes(dep).decode("utf-8")
+        if not isinstance(pre, str):
+            pre = bytes(pre).decode("utf-8")
+        self.db.waits.setdefault(dep, dict())[item] = pre
+        self.db.waited.setdefault(item, oset()).add(dep)
+
+    def unwait(self, item):
+        """
+        Unregister escrowed item with key item from all identifier prefixes
+        it waits on. Called when the item is removed from its escrow whether
+        accepted, stale or invalid so .db.waits does not grow without bound.
+
+        Parameters:
+            item (Hashable): unique key of escrowed item given to .wait
+        """
+        for dep in self.db.waited.pop(item, ()):
+            items = self.db.waits.get(dep)
+            if items is not None:  # not yet woken
+                items.pop(item, None)
+                if not items:
+                    del self.db.waits[dep]
+
+    @staticmethod
+    def _escrowTop(pre=None):
+        """
+        Returns escrow key prefix bytes of snKey keys of identifier prefix pre
+        Returns empty bytes for all keys when pre is None
+
+        Parameters:
+            pre (str | bytes | None): qb64 identifier prefix
+        """
+        if not pre:
+            return b''
+        if isinstance(pre, str):
+            pre = pre.encode("utf-8")
+        return bytes(pre) + b'.'
+
+    @staticmethod
+    def _escrowItems(items, top):
+        """
+        Returns generator of escrow items from items whose keys start with top.
+        Stops at first key not starting with top since keys are ordered.
+
+        Parameters:
+            items (Iterator): of escrow (key, val) items
+            top (bytes): escrow key prefix. Empty means all keys
+        """
+        for ekey, val in items:
+            if top and not bytes(ekey).startswith(top):
+                return
+            yield (ekey, val)
+
     def fetchWitnessState(self, pre, sn):
         """ Returns the list of witness for the identifier prefix at the sequence number
 
@@ -2655,6 +2980,8 @@ class Kevery:
                                   "".format(serder.pre, ked))
         pre = serder.pre
         ked = serder.ked
+        if not self.escrowing:  # new arrival may unblock escrowed items of pre
+            self.wake(pre)
         sn = serder.sn
         ilk = ked["t"]
         said = serder.said
@@ -2686,8 +3013,12 @@ class Kevery:
                               cues=self.cues,
                               prefixes=self.prefixes,
                               local=self.local,
-                              check=self.check)
+                              check=self.check,
+                              vex=self.vex,
+                              tallies=self.tallies)
                 self.kevers[pre] = kever  # not exception so add to kevers
+                self.tallies.pop(said, None)  # accepted so no longer escrowed
+                self.wake(pre)  # accepted so wake escrows waiting on pre
 
                 if self.direct or self.lax or pre not in self.prefixes:  # not own event when owned
                     # create cue for receipt   direct mode for now
@@ -2713,15 +3044,18 @@ class Kevery:
                     # get unique verified lists of sigers and indices from sigers
                     sigers, indices = verifySigs(serder=serder,
                                                  sigers=sigers,
-                                                 verfers=eserder.verfers)
+                                                 verfers=eserder.verfers,
+                                                 vex=self.vex)
 
                     wigers, windices = verifySigs(serder=serder,
                                                   sigers=wigers,
-                                                  verfers=eserder.werfers)
+                                                  verfers=eserder.werfers,
+                                                  vex=self.vex)
 
                     if sigers or wigers:  # at least one verified sig or wig so log evt
                         # not first seen inception so ignore return
                         kever.logEvent(serder, sigers=sigers, wigers=wigers)  # idempotent update db logs
+                        self.wake(pre)
 
                 else:  # escrow likely duplicitous event
                     self.escrowLDEvent(serder=serder, sigers=sigers)
@@ -2730,6 +3064,8 @@ class Kevery:
             else:  # rot, drt, or ixn, so sn matters
                 kever = self.kevers[pre]  # get existing kever for pre
                 kever.cues = self.cues
+                kever.vex = self.vex
+                kever.tallies = self.tallies
                 sno = kever.sn + 1  # proper sn of new inorder event
 
                 if not serder.saider.verify(sad=serder.ked):
@@ -2751,6 +3087,8 @@ class Kevery:
                                  firner=firner if self.cloned else None,
                                  dater=dater if self.cloned else None,
                                  check=self.check)
+                    self.tallies.pop(said, None)  # accepted so no longer escrowed
+                    self.wake(pre)  # accepted so wake escrows waiting on pre
 
                     if self.direct or self.lax or pre not in self.prefixes:  # not own event when owned
                         # create cue for receipt   direct mode for now
@@ -2770,17 +3108,20 @@ class Kevery:
                         # get unique verified lists of sigers and indices from sigers
                         sigers, indices = verifySigs(serder=serder,
                                                      sigers=sigers,
-                                                     verfers=eserder.verfers)
+                                                     verfers=eserder.verfers,
+                                                     vex=self.vex)
 
                         wits = [wit.qb64 for wit in self.fetchWitnessState(pre, sn)]
                         werfers = [Verfer(qb64=wit) for wit in wits]
                         wigers, windices = verifySigs(serder=serder,
                                                       sigers=wigers,
-                                                      verfers=werfers)
+                                                      verfers=werfers,
+                                                      vex=self.vex)
 
                         if sigers or wigers:  # at least one verified sig or wig so log evt
                             # not first seen update so ignore return
                             kever.logEvent(serder, sigers=sigers, wigers=wigers)  # idempotent update db logs
+                        self.wake(pre)
 
                     else:  # escrow likely duplicitous event
                         self.escrowLDEvent(serder=serder, sigers=sigers)
@@ -2807,6 +3148,8 @@ class Kevery:
         # fetch  pre dig to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # receipts may unblock escrowed items of pre
+            self.wake(pre)
 
         sn = serder.sn
 
@@ -2876,6 +3219,8 @@ class Kevery:
         # fetch  pre dig to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # receipts may unblock escrowed items of pre
+            self.wake(pre)
         sn = serder.sn
 
         # Only accept receipt if for last seen version of event at sn
@@ -2942,6 +3287,8 @@ class Kevery:
         # fetch  pre dig to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # receipts may unblock escrowed items of pre
+            self.wake(pre)
         sn = serder.sn
 
         # Only accept receipt if event is latest event at sn. Means its been
@@ -2964,6 +3311,7 @@ class Kevery:
                                   "".format(ked["s"]))
 
         # process each couple to verify sig and write to db
+        vcigars = []  # couples to verify
         for cigar in cigars:
             if cigar.verfer.transferable:  # skip transferable verfers
                 continue  # skip invalid couplets
@@ -2977,8 +3325,13 @@ class Kevery:
                     logger.info("Kevery process: skipped own receipt attachment"
                                 " on nonlocal event receipt=\n%s\n", serder.pretty())
                     continue  # skip own receipt attachment on non-local event
+            vcigars.append(cigar)
 
-            if cigar.verfer.verify(cigar.raw, serder.raw):
+        # verify all couples as one batch
+        results = verifyAll([(cigar.verfer, cigar.raw, serder.raw) for cigar in vcigars],
+                            vex=self.vex)
+        for cigar, verified in zip(vcigars, results):
+            if verified:
                 wits = self.fetchWitnessState(pre, sn)
                 rpre = cigar.verfer.qb64  # prefix of receiptor
                 if rpre in wits:  # its a witness receipt
@@ -3010,6 +3363,8 @@ class Kevery:
         # fetch  pre, dig,seal to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # receipts may unblock escrowed items of pre
+            self.wake(pre)
         sn = serder.sn
 
         # Only accept receipt if for last seen version of event at sn
@@ -3098,6 +3453,8 @@ class Kevery:
         # fetch  pre, dig,seal to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # receipts may unblock escrowed items of pre
+            self.wake(pre)
         sn = serder.sn
 
         if firner:  # retrieve last event by fn ordinal
@@ -3106,81 +3463,100 @@ class Kevery:
             # Only accept receipt if for last seen version of receipted event at sn
             ldig = self.db.getKeLast(key=snKey(pre=pre, sn=sn))  # retrieve dig of last event at sn.
 
-        for sprefixer, sseqner, saider, siger in trqs:  # iterate over each trq
-            if not self.lax and sprefixer.qb64 in self.prefixes:  # own trans receipt quadruple (chit)
-                if pre in self.prefixes:  # skip own trans receipts of own events
-                    raise ValidationError("Own pre={} replay attached transferable "
-                                          "receipt quadruple of own event {}."
-                                          "".format(self.prefixes, serder.pretty()))
-                if not self.local:  # skip own trans receipt quadruples of nonlocal events
-                    raise ValidationError("Own pre={} seal in replay attached "
-                                          "transferable receipt quadruples of nonlocal"
-                                          " event {}.".format(self.prefixes, serder.pretty()))
-
-            if ldig is not None and sprefixer.qb64 in self.kevers:
-                # both receipted event and receipter in database so retreive
-                if isinstance(ldig, memoryview):
-                    ldig = bytes(ldig).decode("utf-8")
-
-                if not serder.compare(said=ldig):  # mismatch events problem with replay
-                    raise ValidationError("Mismatch replay event at sn = {} with db."
-                                          "".format(ked["s"]))
-
-                # retrieve dig of last event at sn of receipter.
-                sdig = self.db.getKeLast(key=snKey(pre=sprefixer.qb64b,
-                                                   sn=sseqner.sn))
-                if sdig is None:
-                    # receipter's est event not yet in receipter's KEL
-                    # receipter's seal event not in receipter's KEL
-                    self.escrowTRQuadruple(serder, sprefixer, sseqner, saider, siger)
-                    raise UnverifiedTransferableReceiptError("Unverified receipt: "
-                                                             "missing establishment event of transferable "
-                                                             "validator receipt quadruple for event={}."
-                                                             "".format(ked))
+        # Resolve verfer of each trq in order up to first fault. Defer the fault
+        # until the trqs before it are verified and logged so that they may be
+        # verified together as one batch with the same effect as in sequence.
+        vtrqs = []  # trqs with resolved verfers to verify
+        escrow = None  # deferred trq to escrow if any
+        fault = None  # deferred exception if any
+        try:
+            for sprefixer, sseqner, saider, siger in trqs:  # iterate over each trq
+                if not self.lax and sprefixer.qb64 in self.prefixes:  # own trans receipt quadruple (chit)
+                    if pre in self.prefixes:  # skip own trans receipts of own events
+                        raise ValidationError("Own pre={} replay attached transferable "
+                                              "receipt quadruple of own event {}."
+                                              "".format(self.prefixes, serder.pretty()))
+                    if not self.local:  # skip own trans receipt quadruples of nonlocal events
+                        raise ValidationError("Own pre={} seal in replay attached "
+                                              "transferable receipt quadruples of nonlocal"
+                                              " event {}.".format(self.prefixes, serder.pretty()))
+
+                if ldig is not None and sprefixer.qb64 in self.kevers:
+                    # both receipted event and receipter in database so retreive
+                    if isinstance(ldig, memoryview):
+                        ldig = bytes(ldig).decode("utf-8")
+
+                    if not serder.compare(said=ldig):  # mismatch events problem with replay
+                        raise ValidationError("Mismatch replay event at sn = {} with db."
+                                              "".format(ked["s"]))
 
-                # retrieve last event itself of receipter
-                sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
-                # assumes db ensures that sraw must not be none because sdig was in KE
-                sserder = Serder(raw=bytes(sraw))
-                if not sserder.compare(said=saider.qb64):  # seal dig not match event
-                    raise ValidationError("Bad trans receipt quadruple at sn = {}"
-                                          " for rct = {}."
-                                          "".format(sseqner.sn, sserder.ked))
-
-                # verify sigs and if so write quadruple to database
-                sverfers = sserder.verfers
-                if not sverfers:
-                    raise ValidationError("Invalid trans receipt quad est. event"
-                                          " dig = {} for receipt from pre ={}, "
-                                          "no keys."
-                                          "".format(saider.qb64, sprefixer.qb64))
+                    # retrieve dig of last event at sn of receipter.
+                    sdig = self.db.getKeLast(key=snKey(pre=sprefixer.qb64b,
+                                                       sn=sseqner.sn))
+                    if sdig is None:
+                        # receipter's est event not yet in receipter's KEL
+                        # receipter's seal event not in receipter's KEL
+                        escrow = (sprefixer, sseqner, saider, siger)
+                        raise UnverifiedTransferableReceiptError("Unverified receipt: "
+                                                                 "missing establishment event of transferable "
+                                                                 "validator receipt quadruple for event={}."
+                                                                 "".format(ked))
 
-                if siger.index >= len(sverfers):
-                    raise ValidationError("Index = {} to large for keys."
-                                          "".format(siger.index))
+                    # retrieve last event itself of receipter
+                    sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
+                    # assumes db ensures that sraw must not be none because sdig was in KE
+                    sserder = Serder(raw=bytes(sraw))
+                    if not sserder.compare(said=saider.qb64):  # seal dig not match event
+                        raise ValidationError("Bad trans receipt quadruple at sn = {}"
+                                              " for rct = {}."
+                                              "".format(sseqner.sn, sserder.ked))
 
-                siger.verfer = sverfers[siger.index]  # assign verfer
-                if not siger.verfer.verify(siger.raw, serder.raw):  # verify sig
-                    logger.info("Kevery unescrow error: Bad trans receipt sig."
-                                "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+                    # verify sigs and if so write quadruple to database
+                    sverfers = sserder.verfers
+                    if not sverfers:
+                        raise ValidationError("Invalid trans receipt quad est. event"
+                                              " dig = {} for receipt from pre ={}, "
+                                              "no keys."
+                                              "".format(saider.qb64, sprefixer.qb64))
+
+                    if siger.index >= len(sverfers):
+                        raise ValidationError("Index = {} to large for keys."
+                                              "".format(siger.index))
 
-                    raise ValidationError("Bad escrowed trans receipt sig at "
-                                          "pre={} sn={:x} receipter={}."
-                                          "".format(pre, sn, sprefixer.qb64))
+                    siger.verfer = sverfers[siger.index]  # assign verfer
+                    vtrqs.append((sprefixer, sseqner, saider, siger))
 
-                # good sig so write receipt quadruple to database
+                else:  # escrow  either receiptor or receipted event not yet in database
+                    escrow = (sprefixer, sseqner, saider, siger)
+                    raise UnverifiedTransferableReceiptError("Unverified receipt: "
+                                                             "missing associated event for transferable "
+                                                             "validator receipt quadruple for event={}."
+                                                             "".format(ked))
+        except ValidationError as ex:
+            fault = ex
 
-                # Set up quadruple
-                quadruple = sprefixer.qb64b + sseqner.qb64b + saider.qb64b + siger.qb64b
-                self.db.addVrc(key=dgKey(pre, serder.said), val=quadruple)
+        # verify sigs as one batch and if so write quadruples to database
+        results = verifyAll([(siger.verfer, siger.raw, serder.raw)
+                             for _, _, _, siger in vtrqs], vex=self.vex)
+        for (sprefixer, sseqner, saider, siger), verified in zip(vtrqs, results):
+            if not verified:  # verify sig
+                logger.info("Kevery unescrow error: Bad trans receipt sig."
+                            "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
 
+                raise ValidationError("Bad escrowed trans receipt sig at "
+                                      "pre={} sn={:x} receipter={}."
+                                      "".format(pre, sn, sprefixer.qb64))
 
-            else:  # escrow  either receiptor or receipted event not yet in database
-                self.escrowTRQuadruple(serder, sprefixer, sseqner, saider, siger)
-                raise UnverifiedTransferableReceiptError("Unverified receipt: "
-                                                         "missing associated event for transferable "
-                                                         "validator receipt quadruple for event={}."
-                                                         "".format(ked))
+            # good sig so write receipt quadruple to database
+
+            # Set up quadruple
+            quadruple = sprefixer.qb64b + sseqner.qb64b + saider.qb64b + siger.qb64b
+            self.db.addVrc(key=dgKey(pre, serder.said), val=quadruple)
+
+        if escrow is not None:
+            self.escrowTRQuadruple(serder, *escrow)
+        if fault is not None:
+            raise fault
 
     def removeStaleReplyEndRole(self, saider):
         """
@@ -3591,6 +3967,8 @@ class Kevery:
                 diger is digest of trans endorser's est evt for keys for sigs
                 siger is indexed sig from trans endorser's key from est evt
         """
+        if not self.escrowing:  # new arrival may be processed from escrow
+            self.wake(pre)
         keys = (saider.qb64,)
         self.db.kdts.put(keys=keys, val=dater)  # first one idempotent
         self.db.ksns.put(keys=keys, val=serder)  # first one idempotent
@@ -3632,7 +4010,7 @@ class Kevery:
             self.db.ksns.rem(keys=keys)
             self.db.kdts.rem(keys=keys)
 
-    def processEscrowKeyState(self):
+    def processEscrowKeyState(self, pre=None):
         """
         Process escrows for reply messages. Escrows are keyed by reply pre
         and val is reply said
@@ -3640,8 +4018,13 @@ class Kevery:
         triple (prefixer, seqner, diger)
         quadruple (prefixer, seqner, diger, siger)
 
+        Parameters:
+            pre (str | None): qb64 identifier prefix of escrowed key states to
+                process. None means process all escrowed key states.
+
         """
-        for (pre, aid, ion), saider in self.db.knes.getIoItemIter():
+        keys = (pre, "") if pre else b""
+        for (pre, aid, ion), saider in self.db.knes.getIoItemIter(keys=keys):
             try:
                 tsgs = fetchTsgs(db=self.db.ksgs, saider=saider)
 
@@ -3675,6 +4058,8 @@ class Kevery:
 
                 except kering.OutOfOrderKeyStateError as ex:
                     # still waiting on missing prior event to validate
+                    for prefixer, _, _, _ in tsgs:  # or on KEL of signer
+                        self.wait(dep=prefixer.qb64, pre=pre, item=saider.qb64)
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrow attempt failed: %s\n", ex.args[0])
                     else:
@@ -3683,6 +4068,7 @@ class Kevery:
                 except Exception as ex:  # other error so remove from reply escrow
                     self.db.knes.remIokey(iokeys=(pre, aid, ion))  # remove escrow
                     self.removeKeyState(saider)
+                    self.unwait(item=saider.qb64)
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrowed due to error: %s\n", ex.args[0])
                     else:
@@ -3690,12 +4076,14 @@ class Kevery:
 
                 else:  # unescrow succeded
                     self.db.knes.remIokey(iokeys=(pre, aid, ion))  # remove escrow only
+                    self.unwait(item=saider.qb64)
                     logger.info("Kevery unescrow succeeded for key state=\n%s\n",
                                 serder.pretty())
 
             except Exception as ex:  # log diagnostics errors etc
                 self.db.knes.remIokey(iokeys=(pre, aid, ion))  # remove escrow
                 self.removeKeyState(saider)
+                self.unwait(item=saider.qb64)
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Kevery unescrowed due to error: %s\n", ex.args[0])
                 else:
@@ -3755,7 +4143,18 @@ class Kevery:
         Parameters:
             pre is qb64 of identifier prefix for KEL
             sn is int sequence number of event in KEL of pre
+
+        Uses .db.ests index of establishment events so lookup does not walk
+        back the KEL. Falls back to walking back when not indexed.
         """
+        if not self.db.getKeLast(key=snKey(pre, sn)):
+            return None  # no event at sn accepted in KEL
+
+        if (found := self.db.getEstLast(pre, sn)) is not None:
+            _, dig = found
+            raw = self.db.getEvt(key=dgKey(pre=pre, dig=bytes(dig)))
+            if raw:
+                return Serder(raw=bytes(raw))
 
         found = False
         while not found:
@@ -3788,15 +4187,18 @@ class Kevery:
             wigers (list): of witness signatures
         """
         dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addOoe(snKey(serder.preb, serder.sn), serder.saidb)
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if seqner and saider:
-            couple = seqner.qb64b + saider.qb64b
-            self.db.putPde(dgkey, couple)  # idempotent
+        def log():  # commit all escrow logs at once, rerun if map grown
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            self.db.addOoe(snKey(serder.preb, serder.sn), serder.saidb)
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if seqner and saider:
+                couple = seqner.qb64b + saider.qb64b
+                self.db.putPde(dgkey, couple)  # idempotent
+
+        self.db.atomic(log)
         # log escrowed
         logger.info("Kevery process: escrowed out of order event=\n%s\n",
                     json.dumps(serder.ked, indent=1))
@@ -3810,10 +4212,13 @@ class Kevery:
             sigers is list of Siger instance for  event
         """
         dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
+        def log():  # commit all escrow logs at once, rerun if map grown
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
+
+        self.db.atomic(log)
         # log duplicitous
         logger.info("Kevery process: escrowed likely duplicitous event=\n%s\n",
                     json.dumps(serder.ked, indent=1))
@@ -4009,19 +4414,41 @@ class Kevery:
         """
         Iterate throush escrows and process any that may now be finalized
 
+        When .sweep is None process every escrowed item on each call.
+        Otherwise event driven so only process the escrowed items of prefixes
+        woken since last call by new events, receipts, or acceptance of events
+        they wait on. Every .sweep seconds do a full sweep of all escrows that
+        also removes stale escrowed items and catches any missed wakes.
+
         Parameters:
         """
 
         try:
-            self.processEscrowOutOfOrders()
-            self.processEscrowUnverWitness()
-            self.processEscrowUnverNonTrans()
-            self.processEscrowUnverTrans()
-            self.processEscrowPartialWigs()
-            self.processEscrowPartialSigs()
-            self.processEscrowDuplicitous()
-            self.processEscrowKeyState()
+            now = time.monotonic()
+            if (self.sweep is None or self.swept is None or
+                    (now - self.swept) >= self.sweep):  # full sweep
+                self.swept = now
+                self.db.wakes.clear()
+                pres = [None]  # None means all prefixes
+            else:
+                pres = list(self.db.wakes)
+                self.db.wakes.clear()
 
+            if pres:
+                self.escrowing = True
+                try:
+                    for processor in (self.processEscrowOutOfOrders,
+                                      self.processEscrowUnverWitness,
+                                      self.processEscrowUnverNonTrans,
+                                      self.processEscrowUnverTrans,
+                                      self.processEscrowPartialWigs,
+                                      self.processEscrowPartialSigs,
+                                      self.processEscrowDuplicitous,
+                                      self.processEscrowKeyState):
+                        for pre in pres:
+                            processor(pre=pre)
+                finally:
+                    self.escrowing = False
 
         except Exception as ex:  # log diagnostics errors etc
             if logger.isEnabledFor(logging.DEBUG):
@@ -4029,7 +4456,7 @@ class Kevery:
             else:
                 logger.error("Kevery escrow process error: %s\n", ex.args[0])
 
-    def processEscrowOutOfOrders(self):
+    def processEscrowOutOfOrders(self, pre=None):
         """
         Process events escrowed by Kever that are recieved out-of-order.
         An event is out of order if its prior event has not been accepted into its KEL.
@@ -4065,11 +4492,16 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix of escrowed items to
+                process. None means process all escrowed items.
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
+        top = self._escrowTop(pre)  # empty means all escrowed items
+        key = ekey = top  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, edig in self.db.getOoeItemsNextIter(key=key):
+            for ekey, edig in self._escrowItems(self.db.getOoeItemsNextIter(key=key), top):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     # check date if expired then remove escrow.
@@ -4165,7 +4597,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowPartialSigs(self):
+    def processEscrowPartialSigs(self, pre=None):
         """
         Process events escrowed by Kever that were only partially fulfilled,
         either due to missing signatures or missing dependent events like a
@@ -4198,11 +4630,16 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix of escrowed items to
+                process. None means process all escrowed items.
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
+        top = self._escrowTop(pre)  # empty means all escrowed items
+        key = ekey = top  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, edig in self.db.getPseItemsNextIter(key=key):
+            for ekey, edig in self._escrowItems(self.db.getPseItemsNextIter(key=key), top):
                 eserder = None
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
@@ -4290,6 +4727,12 @@ class Kevery:
 
                 except (MissingSignatureError, MissingDelegationError) as ex:
                     # still waiting on missing sigs or missing seal to validate
+                    if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
+                        if eserder.pre in self.kevers:
+                            delpre = self.kevers[eserder.pre].delegator
+                        else:
+                            delpre = eserder.ked["di"]
+                        self.wait(dep=delpre, pre=eserder.pre, item=bytes(edig))  # wake on delegator
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
                     else:
@@ -4298,6 +4741,8 @@ class Kevery:
                 except Exception as ex:  # log diagnostics errors etc
                     # error other than waiting on sigs or seal so remove from escrow
                     self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
+                    self.unwait(item=bytes(edig))
+                    self.tallies.pop(bytes(edig).decode("utf-8"), None)  # even when stale
 
                     if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
                         self.cues.append(dict(kin="psUnescrow", serder=eserder))
@@ -4313,6 +4758,7 @@ class Kevery:
                     # valid event escrow.
                     self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
                     self.db.delPde(dgkey)  # remove escrow if any
+                    self.unwait(item=bytes(edig))
 
                     if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
                         self.cues.append(dict(kin="psUnescrow", serder=eserder))
@@ -4324,7 +4770,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowPartialWigs(self):
+    def processEscrowPartialWigs(self, pre=None):
         """
         Process events escrowed by Kever that were only partially fulfilled
         due to missing signatures from witnesses. Events only make into this
@@ -4359,11 +4805,16 @@ class Kevery:
                         Get and Attach Witness Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix of escrowed items to
+                process. None means process all escrowed items.
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
+        top = self._escrowTop(pre)  # empty means all escrowed items
+        key = ekey = top  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, edig in self.db.getPweItemsNextIter(key=key):
+            for ekey, edig in self._escrowItems(self.db.getPweItemsNextIter(key=key), top):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     # check date if expired then remove escrow.
@@ -4479,7 +4930,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowUnverWitness(self):
+    def processEscrowUnverWitness(self, pre=None):
         """
         Process escrowed unverified event receipts from witness receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -4526,12 +4977,17 @@ class Kevery:
                         compare dig so same event
                         verify wigs via wigers
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix of escrowed items to
+                process. None means process all escrowed items.
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
+        top = self._escrowTop(pre)  # empty means all escrowed items
+        key = ekey = top  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, ecouple in self.db.getUweItemsNextIter(key=key):
+            for ekey, ecouple in self._escrowItems(self.db.getUweItemsNextIter(key=key), top):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
                     #  get escrowed receipt's rdiger of receipted event and
@@ -4602,7 +5058,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowUnverNonTrans(self):
+    def processEscrowUnverNonTrans(self, pre=None):
         """
         Process escrowed unverified event receipts from nontrans receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -4647,12 +5103,17 @@ class Kevery:
                         compare dig so same event
                         verify sigs via cigars
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix of escrowed items to
+                process. None means process all escrowed items.
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
+        top = self._escrowTop(pre)  # empty means all escrowed items
+        key = ekey = top  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, etriplet in self.db.getUreItemsNextIter(key=key):
+            for ekey, etriplet in self._escrowItems(self.db.getUreItemsNextIter(key=key), top):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     rsaider, sprefixer, cigar = deReceiptTriple(etriplet)
@@ -4883,7 +5344,7 @@ class Kevery:
 
         return found
 
-    def processEscrowUnverTrans(self):
+    def processEscrowUnverTrans(self, pre=None):
         """
         Process event receipts from transferable identifiers (validators)
         escrowed by Kever that are unverified.
@@ -4926,12 +5387,17 @@ class Kevery:
                         compare dig so same event
                         verify sigs via sigers
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix of escrowed items to
+                process. None means process all escrowed items.
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
+        top = self._escrowTop(pre)  # empty means all escrowed items
+        key = ekey = top  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, equinlet in self.db.getVreItemsNextIter(key=key):
+            for ekey, equinlet in self._escrowItems(self.db.getVreItemsNextIter(key=key), top):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     esaider, sprefixer, sseqner, ssaider, siger = deTransReceiptQuintuple(equinlet)
@@ -5040,6 +5506,7 @@ class Kevery:
                 except UnverifiedTransferableReceiptError as ex:
                     # still waiting on missing prior event to validate
                     # only happens if we process above
+                    self.wait(dep=sprefixer.qb64, pre=pre, item=bytes(equinlet))  # wake on receipter
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
                         logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
                     else:
@@ -5048,6 +5515,7 @@ class Kevery:
                 except Exception as ex:  # log diagnostics errors etc
                     # error other than out of order so remove from OO escrow
                     self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
+                    self.unwait(item=bytes(equinlet))
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
                         logger.exception("Kevery unescrowed: %s\n", ex.args[0])
                     else:
@@ -5058,13 +5526,14 @@ class Kevery:
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
                     self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
+                    self.unwait(item=bytes(equinlet))
                     logger.info("Kevery unescrow succeeded for event = %s\n", serder.ked)
 
             if ekey == key:  # still same so no escrows found on last while iteration
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowDuplicitous(self):
+    def processEscrowDuplicitous(self, pre=None):
         """
         Process events escrowed by Kever that are likely duplicitous.
         An event is likely duplicitous if a different version of event already
@@ -5099,10 +5568,15 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pre (str | None): qb64 identifier prefix of escrowed items to
+                process. None means process all escrowed items.
         """
-        key = ekey = b''  # both start same. when not same means escrows found
+        top = self._escrowTop(pre)  # empty means all escrowed items
+        key = ekey = top  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, edig in self.db.getLdeItemsNextIter(key=key):
+            for ekey, edig in self._escrowItems(self.db.getLdeItemsNextIter(key=key), top):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     # check date if expired then remove escrow.
@@ -7,7 +7,7 @@ message stream parsing support
 
 import logging
 from collections import namedtuple
-from dataclasses import dataclass, astuple
+from dataclasses import dataclass, astuple, field
 
 from .. import kering
 from .. import help
@@ -64,6 +64,42 @@ Coldage = namedtuple("Coldage", 'msg txt bny')  # stream cold start status
 Colds = Coldage(msg='msg', txt='txt', bny='bny')
 
 
+@dataclass
+class Attachments:
+    """
+    Attachments holds the lists of primitives extracted from the attachment
+    groups of one message.
+
+    Attributes:
+        sigers (list): Siger instances of attached indexed controller signatures
+        wigers (list): Siger instances of attached indexed witness signatures
+        cigars (list): Cigar instances of nontrans receipt couples
+        trqs (list): transferable receipt quadruples each
+            (prefixer, seqner, saider, siger)
+        tsgs (list): transferable indexed sig groups each (i,s,d) triple plus
+            list of sigs
+        ssgs (list): signer seal sig groups each identifier prefix plus list
+            of sigs
+        frcs (list): first seen replay couples each (seqner, dater)
+        sscs (list): source seal couples each (seqner, saider) of
+            delegating/issuing event
+        sadsigs (list): SAD path sig groups from transferable identifiers each
+            (path, i, s, d) quad plus list of sigs
+        sadcigs (list): SAD path sig groups from non-trans identifiers each
+            path plus list of non-trans sigs
+    """
+    sigers: list = field(default_factory=list)
+    wigers: list = field(default_factory=list)
+    cigars: list = field(default_factory=list)
+    trqs: list = field(default_factory=list)
+    tsgs: list = field(default_factory=list)
+    ssgs: list = field(default_factory=list)
+    frcs: list = field(default_factory=list)
+    sscs: list = field(default_factory=list)
+    sadsigs: list = field(default_factory=list)
+    sadcigs: list = field(default_factory=list)
+
+
 
 class Parser:
     """
@@ -78,19 +114,35 @@ class Parser:
 
     Only supports current version VERSION
 
+    The incoming message stream is consumed in place by deleting each extracted
+    message and primitive from the front of the bytearray. CPython bytearray
+    front deletion only advances the start of the buffer, amortized O(1), so
+    parse time is linear in stream size without a separate cursor. A cursor
+    held as a memoryview would instead pin the bytearray so that servers could
+    not extend it while it is being parsed.
+
     Has the following public attributes and properties:
 
     Attributes:
         ims (bytearray): incoming message stream
         framed (bool): True means stream is packet framed
-        pipeline (bool): True means use pipeline processor to process
-                whenever stream includes pipelined count codes.
+        pipeline (bool): True means extract and verify messages in batches
+                of up to .depth before dispatching them in order
         kvy (Kevery): route KEL message types to this instance
         tvy (Tevery): route TEL message types to this instance
+        depth (int): max number of messages extracted per batch in pipeline mode
+
+    Pipeline mode extracts up to .depth messages that are already in the stream
+    before dispatching any of them. The controller signatures of the whole batch
+    are then verified together on the Verexer of the Kevery, when it has one,
+    so that the verifications of many small events run in parallel and land in
+    Verfer.Cache before each message is dispatched in stream order.
 
     """
+    Depth = 64  # default max messages extracted per pipelined batch
 
-    def __init__(self, ims=None, framed=True, pipeline=False, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
+    def __init__(self, ims=None, framed=True, pipeline=False, kvy=None, tvy=None, exc=None, rvy=None, vry=None,
+                 depth=None):
         """
         Initialize instance:
 
@@ -105,6 +157,7 @@ class Parser:
             exc (Exchanger): route EXN message types to this instance
             rvy (Revery): reply (RPY) message handler
             vry (Verfifier): credential verifier with wallet storage
+            depth (int): max number of messages per batch in pipeline mode
         """
         self.ims = ims if ims is not None else bytearray()
         self.framed = True if framed else False  # extract until end-of-stream
@@ -114,6 +167,7 @@ class Parser:
         self.exc = exc
         self.rvy = rvy
         self.vry = vry
+        self.depth = depth if depth else self.Depth
 
     @staticmethod
     def sniff(ims):
@@ -434,16 +488,17 @@ class Parser:
         exc = exc if exc is not None else self.exc
         rvy = rvy if rvy is not None else self.rvy
 
+        parsator = self.pipeParsator if pipeline else self.msgParsator
         while ims:  # only process until ims empty
             try:
-                done = yield from self.msgParsator(ims=ims,
-                                                   framed=framed,
-                                                   pipeline=pipeline,
-                                                   kvy=kvy,
-                                                   tvy=tvy,
-                                                   exc=exc,
-                                                   rvy=rvy,
-                                                   vry=vry)
+                done = yield from parsator(ims=ims,
+                                           framed=framed,
+                                           pipeline=pipeline,
+                                           kvy=kvy,
+                                           tvy=tvy,
+                                           exc=exc,
+                                           rvy=rvy,
+                                           vry=vry)
 
             except kering.SizedGroupError as ex:  # error inside sized group
                 print(ex)
@@ -596,15 +651,16 @@ class Parser:
         rvy = rvy if rvy is not None else self.rvy
 
 
+        parsator = self.pipeParsator if pipeline else self.msgParsator
         while True:  # continuous stream processing never stop
             try:
-                done = yield from self.msgParsator(ims=ims,
-                                                   framed=framed,
-                                                   pipeline=pipeline,
-                                                   kvy=kvy,
-                                                   tvy=tvy,
-                                                   exc=exc,
-                                                   rvy=rvy)
+                done = yield from parsator(ims=ims,
+                                           framed=framed,
+                                           pipeline=pipeline,
+                                           kvy=kvy,
+                                           tvy=tvy,
+                                           exc=exc,
+                                           rvy=rvy)
 
             except kering.SizedGroupError as ex:  # error inside sized group
                 # processOneIter already flushed group so do not flush stream
@@ -632,6 +688,314 @@ class Parser:
         return True  # should never return
 
 
+    def pipeParsator(self, ims=None, framed=True, pipeline=True, kvy=None, tvy=None, exc=None, rvy=None,
+                     vry=None):
+        """
+        Returns generator that extracts a batch of up to .depth messages with
+        attachments from incoming message stream, ims, then verifies and
+        dispatches the batch in stream order. Dispatches what is already
+        extracted before it yields to wait for more bytes so a slow stream
+        never holds back messages already received. Returns True once the
+        batch is dispatched.
+
+        Parameters:
+            ims (bytearray) of serialized incoming message stream.
+            framed (bool) True means ims contains only one frame of msg plus
+                counted attachments instead of stream with multiple messages
+            pipeline (bool) True means extract each size framed attachment
+                group in one pass
+            kvy (Kevery) route KERI KEL message types to this instance
+            tvy (Tevery) route TEL message types to this instance
+            exc (Exchanger) route EXN message types to this instance
+            rvy (Revery): reply (RPY) message handler
+            vry (Verifier) ACDC credential processor
+        """
+        if ims is None:
+            ims = self.ims
+
+        batch = []
+        try:
+            while True:
+                extractor = self._msgExtractor(ims=ims, framed=framed, pipeline=pipeline)
+                while True:
+                    try:
+                        next(extractor)
+                    except StopIteration as ex:
+                        batch.append(ex.value)
+                        break
+                    # rest of msg not yet received so dispatch batch in hand
+                    self._dispatchBatch(batch, kvy=kvy, tvy=tvy, exc=exc, rvy=rvy, vry=vry)
+                    yield
+
+                if len(batch) >= self.depth or not ims:
+                    break
+
+        finally:  # extraction error still dispatches messages extracted before it
+            self._dispatchBatch(batch, kvy=kvy, tvy=tvy, exc=exc, rvy=rvy, vry=vry)
+
+        return True
+
+    def _dispatchBatch(self, batch, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
+        """
+        Verifies the controller signatures of batch of extracted messages together
+        then dispatches each in order and empties batch. An error dispatching one
+        message is logged so does not drop the rest of the batch.
+
+        Parameters:
+            batch (list): of (sadder, atc) extracted message and Attachments pairs
+            kvy (Kevery) route KERI KEL message types to this instance
+            tvy (Tevery) route TEL message types to this instance
+            exc (Exchanger) route EXN message types to this instance
+            rvy (Revery): reply (RPY) message handler
+            vry (Verifier) ACDC credential processor
+        """
+        self._verifyBatch(batch, kvy=kvy)
+        for sadder, atc in batch:
+            try:
+                self.dispatch(sadder, atc, kvy=kvy, tvy=tvy, exc=exc, rvy=rvy, vry=vry)
+            except (kering.ValidationError, Exception) as ex:  # non Extraction Error
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Parser msg non-extraction error: %s\n", ex)
+                else:
+                    logger.error("Parser msg non-extraction error: %s\n", ex)
+        del batch[:]
+
+    @staticmethod
+    def _verifyBatch(batch, kvy=None):
+        """
+        Verifies in one submission to the Verexer, kvy.vex, the controller
+        signatures of all the key events in batch whose signing keys are known
+        from the event itself or the accepted key state. Successful results are
+        kept in Verfer.Cache where event validation finds them at dispatch, so
+        this is a no-op without a Verexer or with the cache disabled. Signatures
+        on keys that change within the batch simply miss the cache and are
+        verified at dispatch as usual.
+
+        Parameters:
+            batch (list): of (sadder, atc) extracted message and Attachments pairs
+            kvy (Kevery): KEL processor with optional Verexer .vex and .kevers
+        """
+        vex = getattr(kvy, "vex", None)
+        if vex is None or Verfer.Cache is None or Verfer.Cache.size <= 0 or len(batch) < 2:
+            return
+
+        triples = []
+        for sadder, atc in batch:
+            if sadder.ident != Idents.keri or not atc.sigers:
+                continue
+            ked = sadder.ked
+            try:
+                ilk = ked["t"]
+                if ilk in (Ilks.icp, Ilks.dip, Ilks.rot, Ilks.drt):  # signed by own keys
+                    verfers = [Verfer(qb64=key) for key in ked["k"]]
+                elif ilk == Ilks.ixn and ked["i"] in kvy.kevers:  # signed by current keys
+                    verfers = kvy.kevers[ked["i"]].verfers
+                else:
+                    continue
+            except Exception:  # malformed event is rejected at dispatch
+                continue
+            triples.extend((verfers[siger.index], siger.raw, sadder.raw)
+                           for siger in atc.sigers if siger.index < len(verfers))
+
+        if len(triples) > 1:
+            vex.verify(triples)
+
+    def _attachParsator(self, ctr, ims, cold=Colds.txt, pipelined=False, atc=None):
+        """
+        Returns generator to extract the group of attachments counted by ctr
+        from ims and append the extracted primitives to the matching lists of atc.
+        Yields when not enough bytes in ims unless pipelined in which case the
+        full group is already in ims so raises ShortageError instead.
+
+        Parameters:
+            ctr (Counter): already extracted counter of attachment group
+            ims (bytearray): stream positioned just after counter
+            cold (str): stream state txt or bny
+            pipelined (bool): True means ims is complete pipelined group frame
+            atc (Attachments): holder of extracted attachment lists
+        """
+        atc = atc if atc is not None else Attachments()
+        if ctr.code == CtrDex.ControllerIdxSigs:
+            for i in range(ctr.count): # extract each attached signature
+                siger = yield from self._extractor(ims=ims,
+                                                   klas=Siger,
+                                                   cold=cold,
+                                                   abort=pipelined)
+                atc.sigers.append(siger)
+
+        elif ctr.code == CtrDex.WitnessIdxSigs:
+            for i in range(ctr.count): # extract each attached signature
+                wiger = yield from self._extractor(ims=ims,
+                                                   klas=Siger,
+                                                   cold=cold,
+                                                   abort=pipelined)
+                atc.wigers.append(wiger)
+
+        elif ctr.code == CtrDex.NonTransReceiptCouples:
+            # extract attached rct couplets into list of sigvers
+            # verfer property of cigar is the identifier prefix
+            # cigar itself has the attached signature
+            for cigar in self._nonTransReceiptCouples(ctr=ctr, ims=ims, cold=cold, pipelined=pipelined):
+                atc.cigars.append(cigar)
+
+        elif ctr.code == CtrDex.TransReceiptQuadruples:
+            # extract attaced trans receipt vrc quadruple
+            # spre+ssnu+sdig+sig
+            # spre is pre of signer of vrc
+            # ssnu is sn of signer's est evt when signed
+            # sdig is dig of signer's est event when signed
+            # sig is indexed signature of signer on this event msg
+            for i in range(ctr.count):  # extract each attached quadruple
+                prefixer = yield from self._extractor(ims,
+                                                      klas=Prefixer,
+                                                      cold=cold,
+                                                      abort=pipelined)
+                seqner = yield from self._extractor(ims,
+                                                    klas=Seqner,
+                                                    cold=cold,
+                                                    abort=pipelined)
+                saider = yield from self._extractor(ims,
+                                                    klas=Saider,
+                                                    cold=cold,
+                                                    abort=pipelined)
+                siger = yield from self._extractor(ims=ims,
+                                                   klas=Siger,
+                                                   cold=cold,
+                                                   abort=pipelined)
+                atc.trqs.append((prefixer, seqner, saider, siger))
+
+        elif ctr.code == CtrDex.TransIdxSigGroups:
+            # extract attaced trans indexed sig groups each made of
+            # triple pre+snu+dig plus indexed sig group
+            # pre is pre of signer (endorser) of msg
+            # snu is sn of signer's est evt when signed
+            # dig is dig of signer's est event when signed
+            # followed by counter for ControllerIdxSigs with attached
+            # indexed sigs from trans signer (endorser).
+            for (prefixer, seqner, saider, isigers) in self._transIdxSigGroups(ctr, ims, cold=cold,
+                                                                               pipelined=pipelined):
+                atc.tsgs.append((prefixer, seqner, saider, isigers))
+
+        elif ctr.code == CtrDex.TransLastIdxSigGroups:
+            # extract attaced signer seal indexed sig groups each made of
+            # identifier pre plus indexed sig group
+            # pre is pre of signer (endorser) of msg
+            # followed by counter for ControllerIdxSigs with attached
+            # indexed sigs from trans signer (endorser).
+            for i in range(ctr.count): # extract each attached groups
+                prefixer = yield from  self._extractor(ims,
+                                                       klas=Prefixer,
+                                                       cold=cold,
+                                                       abort=pipelined)
+                ictr = ctr = yield from self._extractor(ims=ims,
+                                                        klas=Counter,
+                                                        cold=cold,
+                                                        abort=pipelined)
+                if ctr.code != CtrDex.ControllerIdxSigs:
+                    raise kering.UnexpectedCountCodeError("Wrong "
+                        "count code={}.Expected code={}."
+                        "".format(ictr.code, CtrDex.ControllerIdxSigs))
+                isigers = []
+                for i in range(ictr.count): # extract each attached signature
+                    isiger = yield from self._extractor(ims=ims,
+                                                        klas=Siger,
+                                                        cold=cold,
+                                                        abort=pipelined)
+                    isigers.append(isiger)
+                atc.ssgs.append((prefixer, isigers))
+
+        elif ctr.code == CtrDex.FirstSeenReplayCouples:
+            # extract attached first seen replay couples
+            # snu+dtm
+            # snu is fn (first seen ordinal) of event
+            # dtm is dt of event
+            for i in range(ctr.count): # extract each attached quadruple
+                firner = yield from  self._extractor(ims,
+                                                     klas=Seqner,
+                                                     cold=cold,
+                                                     abort=pipelined)
+                dater = yield from  self._extractor(ims,
+                                                    klas=Dater,
+                                                    cold=cold,
+                                                    abort=pipelined)
+                atc.frcs.append((firner, dater))
+
+        elif ctr.code == CtrDex.SealSourceCouples:
+            # extract attached first seen replay couples
+            # snu+dig
+            # snu is sequence number  of event
+            # dig is digest of event
+            for i in range(ctr.count):  # extract each attached quadruple
+                seqner = yield from self._extractor(ims,
+                                                    klas=Seqner,
+                                                    cold=cold,
+                                                    abort=pipelined)
+                saider = yield from self._extractor(ims,
+                                                    klas=Saider,
+                                                    cold=cold,
+                                                    abort=pipelined)
+                atc.sscs.append((seqner, saider))
+
+        elif ctr.code == CtrDex.SadPathSigGroup:
+            path = yield from self._extractor(ims,
+                                              klas=Pather,
+                                              cold=cold,
+                                              abort=pipelined)
+            for i in range(ctr.count):
+                ictr = yield from self._extractor(ims=ims,
+                                                  klas=Counter,
+                                                  cold=cold,
+                                                  abort=pipelined)
+                for code, sigs in self._sadPathSigGroup(ctr=ictr,
+                                                        ims=ims,
+                                                        root=path,
+                                                        cold=cold,
+                                                        pipelined=pipelined):
+                    if code == CtrDex.TransIdxSigGroups:
+                        atc.sadsigs.append(sigs)
+                    else:
+                        atc.sadcigs.append(sigs)
+
+        elif ctr.code == CtrDex.SadPathSig:
+            for code, sigs in self._sadPathSigGroup(ctr=ctr,
+                                                    ims=ims,
+                                                    cold=cold,
+                                                    pipelined=pipelined):
+                if code == CtrDex.TransIdxSigGroups:
+                    atc.sadsigs.append(sigs)
+                else:
+                    atc.sadcigs.append(sigs)
+
+        else:
+            raise kering.UnexpectedCountCodeError("Unsupported count"
+                                                  " code={}.".format(ctr.code))
+
+        return atc
+
+
+    def _pipelineParse(self, ims, cold=Colds.txt, atc=None):
+        """
+        Extracts all the attachment groups from a fully received pipelined
+        (size framed) attachment group, ims, in one pass. Because the whole
+        frame is already in hand no extraction ever suspends.
+
+        Returns:
+            atc (Attachments): holder of extracted attachment lists
+
+        Parameters:
+            ims (bytearray): complete pipelined attachment group frame
+                stripped of its AttachedMaterialQuadlets counter
+            cold (str): stream state txt or bny of frame
+            atc (Attachments): holder of extracted attachment lists
+        """
+        atc = atc if atc is not None else Attachments()
+        while ims:  # each counted group in frame until frame exhausted
+            ctr = self.extract(ims, klas=Counter, cold=cold)
+            for _ in self._attachParsator(ctr=ctr, ims=ims, cold=cold,
+                                          pipelined=True, atc=atc):
+                raise kering.ShortageError("Truncated pipelined group.")
+        return atc
+
     def msgParsator(self, ims=None, framed=True, pipeline=False, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
         """
         Returns generator that upon each iteration extracts and parses msg
@@ -680,6 +1044,25 @@ class Parser:
         if ims is None:
             ims = self.ims
 
+        sadder, atc = yield from self._msgExtractor(ims=ims, framed=framed, pipeline=pipeline)
+        return self.dispatch(sadder, atc, kvy=kvy, tvy=tvy, exc=exc, rvy=rvy, vry=vry)
+
+    def _msgExtractor(self, ims, framed=True, pipeline=False):
+        """
+        Returns generator that extracts one msg with its attached crypto material
+        from incoming message stream, ims, without dispatching it.
+        Yields when not enough bytes in ims to finish one msg plus attachments.
+
+        Returns:
+            tuple: (sadder, atc) of extracted Sadder message and its Attachments
+
+        Parameters:
+            ims (bytearray): serialized incoming message stream
+            framed (bool): True means ims contains only one frame of msg plus
+                counted attachments instead of stream with multiple messages
+            pipeline (bool): True means extract each size framed attachment
+                group in one pass
+        """
         while not ims:
             yield
 
@@ -698,23 +1081,7 @@ class Parser:
                 del ims[:sadder.size]  # strip off event from front of ims
                 break
 
-        sigers = []  # list of Siger instances of attached indexed controller signatures
-        wigers = []  # list of Siger instance of attached indexed witness signatures
-        cigars = []  # List of cigars to hold nontrans rct couplets
-        # List of tuples from extracted transferable receipt (vrc) quadruples
-        trqs = []  # each converted quadruple is (prefixer, seqner, diger, siger)
-        # List of tuples from extracted transferable indexed sig groups
-        tsgs = []  # each converted group is tuple of (i,s,d) triple plus list of sigs
-        # List of tuples from extracted signer seals sig groups
-        ssgs = []  # each converted group is the identifier prefix plus list of sigs
-        # List of tuples from extracted first seen replay couples
-        frcs = []  # each converted couple is (seqner, dater)
-        # List of tuples from extracted source seal couples (delegator or issuer)
-        sscs = []  # each converted couple is (seqner, diger) for delegating/issuing event
-        # List of tuples from extracted SAD path sig groups from transferable identifiers
-        sadsigs = []  # each converted group is tuple of (path, i, s, d) quad plus list of sigs
-        # List of tuples from extracted SAD path sig groups from non-trans identifiers
-        sadcigs = []  # each converted group is path plus list of non-trans sigs
+        atc = Attachments()  # lists of extracted attachments
         pipelined = False  # all attachments in one big pipeline counted group
         # extract and deserialize attachments
         try:  # catch errors here to flush only counted part of stream
@@ -735,171 +1102,22 @@ class Parser:
                     del ims[:pags]  # strip off from ims
                     ims = pims  # now just process substream as one counted frame
 
-                    if pipeline:
-                        pass  # pass extracted ims to pipeline processor
-                        return
-
-                    ctr = yield from self._extractor(ims=ims,
-                                                     klas=Counter,
-                                                     cold=cold,
-                                                     abort=pipelined)
-
-                # iteratively process attachment counters (all non pipelined)
-                while True:  # do while already extracted first counter is ctr
-                    if ctr.code == CtrDex.ControllerIdxSigs:
-                        for i in range(ctr.count): # extract each attached signature
-                            siger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            sigers.append(siger)
-
-                    elif ctr.code == CtrDex.WitnessIdxSigs:
-                        for i in range(ctr.count): # extract each attached signature
-                            wiger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            wigers.append(wiger)
-
-                    elif ctr.code == CtrDex.NonTransReceiptCouples:
-                        # extract attached rct couplets into list of sigvers
-                        # verfer property of cigar is the identifier prefix
-                        # cigar itself has the attached signature
-                        for cigar in self._nonTransReceiptCouples(ctr=ctr, ims=ims, cold=cold, pipelined=pipelined):
-                            cigars.append(cigar)
-
-                    elif ctr.code == CtrDex.TransReceiptQuadruples:
-                        # extract attaced trans receipt vrc quadruple
-                        # spre+ssnu+sdig+sig
-                        # spre is pre of signer of vrc
-                        # ssnu is sn of signer's est evt when signed
-                        # sdig is dig of signer's est event when signed
-                        # sig is indexed signature of signer on this event msg
-                        for i in range(ctr.count):  # extract each attached quadruple
-                            prefixer = yield from self._extractor(ims,
-                                                                  klas=Prefixer,
-                                                                  cold=cold,
-                                                                  abort=pipelined)
-                            seqner = yield from self._extractor(ims,
-                                                                klas=Seqner,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            saider = yield from self._extractor(ims,
-                                                                klas=Saider,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            siger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            trqs.append((prefixer, seqner, saider, siger))
-
-                    elif ctr.code == CtrDex.TransIdxSigGroups:
-                        # extract attaced trans indexed sig groups each made of
-                        # triple pre+snu+dig plus indexed sig group
-                        # pre is pre of signer (endorser) of msg
-                        # snu is sn of signer's est evt when signed
-                        # dig is dig of signer's est event when signed
-                        # followed by counter for ControllerIdxSigs with attached
-                        # indexed sigs from trans signer (endorser).
-                        for (prefixer, seqner, saider, isigers) in self._transIdxSigGroups(ctr, ims, cold=cold,
-                                                                                           pipelined=pipelined):
-                            tsgs.append((prefixer, seqner, saider, isigers))
-
-                    elif ctr.code == CtrDex.TransLastIdxSigGroups:
-                        # extract attaced signer seal indexed sig groups each made of
-                        # identifier pre plus indexed sig group
-                        # pre is pre of signer (endorser) of msg
-                        # followed by counter for ControllerIdxSigs with attached
-                        # indexed sigs from trans signer (endorser).
-                        for i in range(ctr.count): # extract each attached groups
-                            prefixer = yield from  self._extractor(ims,
-                                                                   klas=Prefixer,
-                                                                   cold=cold,
-                                                                   abort=pipelined)
-                            ictr = ctr = yield from self._extractor(ims=ims,
-                                                                    klas=Counter,
-                                                                    cold=cold,
-                                                                    abort=pipelined)
-                            if ctr.code != CtrDex.ControllerIdxSigs:
-                                raise kering.UnexpectedCountCodeError("Wrong "
-                                    "count code={}.Expected code={}."
-                                    "".format(ictr.code, CtrDex.ControllerIdxSigs))
-                            isigers = []
-                            for i in range(ictr.count): # extract each attached signature
-                                isiger = yield from self._extractor(ims=ims,
-                                                                    klas=Siger,
-                                                                    cold=cold,
-                                                                    abort=pipelined)
-                                isigers.append(isiger)
-                            ssgs.append((prefixer, isigers))
-
-                    elif ctr.code == CtrDex.FirstSeenReplayCouples:
-                        # extract attached first seen replay couples
-                        # snu+dtm
-                        # snu is fn (first seen ordinal) of event
-                        # dtm is dt of event
-                        for i in range(ctr.count): # extract each attached quadruple
-                            firner = yield from  self._extractor(ims,
-                                                                 klas=Seqner,
-                                                                 cold=cold,
-                                                                 abort=pipelined)
-                            dater = yield from  self._extractor(ims,
-                                                                klas=Dater,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            frcs.append((firner, dater))
-
-                    elif ctr.code == CtrDex.SealSourceCouples:
-                        # extract attached first seen replay couples
-                        # snu+dig
-                        # snu is sequence number  of event
-                        # dig is digest of event
-                        for i in range(ctr.count):  # extract each attached quadruple
-                            seqner = yield from self._extractor(ims,
-                                                                klas=Seqner,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            saider = yield from self._extractor(ims,
-                                                                klas=Saider,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            sscs.append((seqner, saider))
-
-                    elif ctr.code == CtrDex.SadPathSigGroup:
-                        path = yield from self._extractor(ims,
-                                                          klas=Pather,
-                                                          cold=cold,
-                                                          abort=pipelined)
-                        for i in range(ctr.count):
-                            ictr = yield from self._extractor(ims=ims,
-                                                              klas=Counter,
-                                                              cold=cold,
-                                                              abort=pipelined)
-                            for code, sigs in self._sadPathSigGroup(ctr=ictr,
-                                                                    ims=ims,
-                                                                    root=path,
-                                                                    cold=cold,
-                                                                    pipelined=pipelined):
-                                if code == CtrDex.TransIdxSigGroups:
-                                    sadsigs.append(sigs)
-                                else:
-                                    sadcigs.append(sigs)
-
-                    elif ctr.code == CtrDex.SadPathSig:
-                        for code, sigs in self._sadPathSigGroup(ctr=ctr,
-                                                                ims=ims,
-                                                                cold=cold,
-                                                                pipelined=pipelined):
-                            if code == CtrDex.TransIdxSigGroups:
-                                sadsigs.append(sigs)
-                            else:
-                                sadcigs.append(sigs)
-
+                    if pipeline:  # hand whole frame to pipeline stage
+                        self._pipelineParse(ims=ims, cold=cold, atc=atc)
                     else:
-                        raise kering.UnexpectedCountCodeError("Unsupported count"
-                                                              " code={}.".format(ctr.code))
+                        ctr = yield from self._extractor(ims=ims,
+                                                         klas=Counter,
+                                                         cold=cold,
+                                                         abort=pipelined)
+
+                # iteratively process attachment counters unless pipeline stage
+                # already consumed the whole pipelined group frame
+                while not (pipelined and pipeline):  # do while first ctr extracted
+                    yield from self._attachParsator(ctr=ctr,
+                                                    ims=ims,
+                                                    cold=cold,
+                                                    pipelined=pipelined,
+                                                    atc=atc)
 
                     if pipelined:  # process to end of stream (group)
                         if not ims:  # end of pipelined group frame
@@ -929,6 +1147,33 @@ class Parser:
                                              "attachment group of size={}.".format(pags))
             raise  # no pipeline group so can't preflush, must flush stream
 
+        return sadder, atc
+
+    def dispatch(self, sadder, atc, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
+        """
+        Dispatches extracted msg, sadder, with its attachments, atc, to the
+        processor for its message type. Returns True when dispatched.
+
+        Parameters:
+            sadder (Sadder): extracted message
+            atc (Attachments): extracted attachments of message
+            kvy (Kevery) route KERI KEL message types to this instance
+            tvy (Tevery) route TEL message types to this instance
+            exc (Exchanger) route EXN message types to this instance
+            rvy (Revery): reply (RPY) message handler
+            vry (Verifier) ACDC credential processor
+        """
+        sigers = atc.sigers
+        wigers = atc.wigers
+        cigars = atc.cigars
+        trqs = atc.trqs
+        tsgs = atc.tsgs
+        ssgs = atc.ssgs
+        frcs = atc.frcs
+        sscs = atc.sscs
+        sadsigs = atc.sadsigs
+        sadcigs = atc.sadcigs
+
         if sadder.ident == Idents.keri:
             serder = Serder(sad=sadder)
 
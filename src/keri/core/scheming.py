@@ -24,6 +24,15 @@ QualifiedVLEIIssuerVLEICredential = "ESAItgWbOyCvcNAqkJFBZqxG2-h69fOkw7Rzk0gAqkq
 class CacheResolver:
     """ Sample jsonschema resolver for loading schema $ref references from a local hash.
 
+    Parsed schema and compiled validators are memoized by schema SAID so that
+    repeated validation against the same schema does not re-parse, re-verify
+    or re-compile it.
+
+    Attributes:
+        cache (dict): raw schema bytes keyed by URI
+        schemers (dict): parsed Schemer instances keyed by URI
+        validators (dict): compiled jsonschema validators keyed by schema SAID
+
     """
 
     def __init__(self, cache=None):
@@ -33,6 +42,8 @@ class CacheResolver:
             cache (Optional(dict)) is an optional pre-loaded cache of schema
         """
         self.cache = cache if cache is not None else dict()
+        self.schemers = dict()
+        self.validators = dict()
 
     def add(self, key, schema):
         """ Add schema to cache for resolution
@@ -42,6 +53,7 @@ class CacheResolver:
             schema (bytes): is bytes of the schema for the URI
         """
         self.cache[key] = schema
+        self.schemers.pop(key, None)
 
     def resolve(self, uri):
         if uri not in self.cache:
@@ -50,18 +62,37 @@ class CacheResolver:
         ref = self.cache[uri]
         return ref
 
-    def handler(self, uri):
-        """ Handler provided to jsonschema for cache resolution
+    def schemer(self, uri):
+        """ Returns parsed Schemer for uri or None if not in cache
+
+        The Schemer is parsed and its SAID and schema verified only the first
+        time it is resolved, later calls return the memoized instance.
 
         Parameters:
             uri (str): the URI to resolve
         """
+        if uri in self.schemers:
+            return self.schemers[uri]
+
         ref = self.resolve(uri)
         if not ref:
             return None
 
-        schemr = Schemer(raw=ref)
-        return schemr.sed
+        schemer = Schemer(raw=ref)
+        self.schemers[uri] = schemer
+        return schemer
+
+    def handler(self, uri):
+        """ Handler provided to jsonschema for cache resolution
+
+        Parameters:
+            uri (str): the URI to resolve
+        """
+        schemer = self.schemer(uri)
+        if schemer is None:
+            return None
+
+        return schemer.sed
 
     def resolver(self, scer=b''):
         """ Locally cached schema resolver
@@ -321,12 +352,41 @@ class JSONSchema:
 
         return True
 
-    def verify_json(self, schema=b'', raw=b''):
+    def validator(self, schema, said=None):
+        """ Returns compiled validator for schema
+
+        The schema is checked against its metaschema and its validator compiled
+        with a resolver bound to the schema. When said is provided the compiled
+        validator is memoized in the resolver's registry keyed by said so
+        later calls for the same schema skip both steps.
+
+        Parameters:
+            schema (dict): is the JSON schema to compile
+            said (Optional(str)): verified SAID of schema used as registry key
+
+        Raises:
+            jsonschema.exceptions.SchemaError: if schema is not valid JSON Schema
+
+        """
+        validators = self.resolver.validators
+        if said is not None and said in validators:
+            return validators[said]
+
+        cls = jsonschema.validators.validator_for(schema, default=jsonschema.Draft7Validator)
+        cls.check_schema(schema)
+        validator = cls(schema, resolver=self.resolver.resolver(scer=schema))
+        if said is not None:
+            validators[said] = validator
+
+        return validator
+
+    def verify_json(self, schema=b'', raw=b'', said=None):
         """ Verify the raw content against the schema for JSON that conforms to the schema
 
         Parameters:
             schema (bytes): is the schema use for validation
             raw (bytes): is JSON to validate against the Schema
+            said (Optional(str)): verified SAID of schema used to look up compiled validator
 
         Returns:
             boolean: True if the JSON passes validation against the
@@ -336,7 +396,10 @@ class JSONSchema:
         """
         try:
             d = json.loads(raw)
-            jsonschema.validate(instance=d, schema=schema, resolver=self.resolver.resolver(scer=raw))
+            validator = self.validator(schema, said=said)
+            error = jsonschema.exceptions.best_match(validator.iter_errors(d))
+            if error is not None:
+                raise error
         except jsonschema.exceptions.ValidationError as ex:
             print(ex)
             logger.error(f'jsonschema.exceptions.ValidationError {ex}')
@@ -354,6 +417,39 @@ class JSONSchema:
 
         return True
 
+    def verify_sads(self, schema, sads, said=None):
+        """ Verify many already deserialized SADs against one schema
+
+        Compiles the validator once and reuses it for every SAD.
+
+        Parameters:
+            schema (dict): is the schema use for validation
+            sads (iterable): of dict SADs to validate against the schema
+            said (Optional(str)): verified SAID of schema used to look up compiled validator
+
+        Returns:
+            list: of boolean, one per SAD in order, True if that SAD passes validation
+        """
+        sads = list(sads)
+        try:
+            validator = self.validator(schema, said=said)
+        except jsonschema.exceptions.SchemaError as ex:
+            logger.error(f'jsonschema.exceptions.SchemaError {ex}')
+            return [False] * len(sads)
+
+        results = []
+        for sad in sads:
+            try:
+                error = jsonschema.exceptions.best_match(validator.iter_errors(sad))
+            except Exception as ex:
+                logger.error(f'schema validation error {ex}')
+                error = ex
+            if error is not None:
+                logger.error(f'jsonschema.exceptions.ValidationError {error}')
+            results.append(error is None)
+
+        return results
+
 
 class Schemer:
     """ Schemer is KERI schema serializer-deserializer class
@@ -522,7 +618,17 @@ class Schemer:
             raw (bytes): is serialised JSON content to verify against schema
         """
 
-        return self.typ.verify_json(schema=self.sed, raw=raw)
+        return self.typ.verify_json(schema=self.sed, raw=raw, said=self.said)
+
+    def verify_sads(self, sads):
+        """
+        Returns list of booleans, one per SAD, True if that SAD is valid against this schema
+
+        Parameters:
+            sads (iterable): of deserialized dict SADs to verify against schema
+        """
+
+        return self.typ.verify_sads(schema=self.sed, sads=sads, said=self.said)
 
     def _verify_schema(self):
         """
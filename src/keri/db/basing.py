@@ -45,17 +45,36 @@ class dbdict(dict):
     Subclass of dict that has db as attribute and employs read through cash
     from db Baser.stts of kever states to reload kever from state in database
     if not in memory as dict item
+
+    When .capacity is not None the items in memory are bounded by evicting
+    the least recently used (LRU) item. Kevers of local prefixes in
+    .db.prefixes are pinned and never evicted. The key state of an evicted
+    Kever is written back to .db.states when not already there so that it
+    can always be reloaded on next access.
+
+    Attributes:
+        db (Baser): database for read through of key states
+        capacity (int | None): max number of items in memory. None means
+            unbounded. Pinned items are not evicted even when over capacity
+        hits (int): count of lookups found in memory
+        misses (int): count of lookups not found in memory
+        evictions (int): count of evicted items
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'capacity', 'hits', 'misses', 'evictions')  # no .__dict__
 
     def __init__(self, *pa, **kwa):
         super(dbdict, self).__init__(*pa, **kwa)
         self.db = None
+        self.capacity = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def __getitem__(self, k):
         try:
-            return super(dbdict, self).__getitem__(k)
+            item = super(dbdict, self).__getitem__(k)
         except KeyError as ex:
+            self.misses += 1
             if not self.db:
                 raise ex  # reraise KeyError
             if (state := self.db.states.get(keys=k)) is None:
@@ -67,6 +86,19 @@ class dbdict(dict):
             self.__setitem__(k, kever)
             return kever
 
+        self.hits += 1
+        if self.capacity is not None:  # reinsert as most recently used
+            super(dbdict, self).__delitem__(k)
+            super(dbdict, self).__setitem__(k, item)
+        return item
+
+    def __setitem__(self, k, v):
+        if self.capacity is not None and super(dbdict, self).__contains__(k):
+            super(dbdict, self).__delitem__(k)  # reinsert as most recently used
+        super(dbdict, self).__setitem__(k, v)
+        if self.capacity is not None and len(self) > self.capacity:
+            self.evict()
+
     def __contains__(self, k):
         if not super(dbdict, self).__contains__(k):
             try:
@@ -83,6 +115,34 @@ class dbdict(dict):
         else:
             return self.__getitem__(k)
 
+    def evict(self):
+        """
+        Evict least recently used unpinned items until within .capacity
+        Writes back key state of evicted Kever to .db.states if missing.
+        """
+        pins = self.db.prefixes if self.db is not None else ()
+        while len(self) > self.capacity:
+            victim = None
+            skips = []
+            for k in self:  # least recently used first
+                if k in pins:
+                    skips.append(k)
+                    continue
+                victim = k
+                break
+
+            for k in skips:  # move pinned to most recently used so not rescanned
+                super(dbdict, self).__setitem__(k, super(dbdict, self).pop(k))
+
+            if victim is None:  # all pinned
+                break
+
+            item = super(dbdict, self).pop(victim)
+            self.evictions += 1
+            if (self.db is not None and isinstance(item, eventing.Kever)
+                    and self.db.states.get(keys=victim) is None):
+                self.db.states.pin(keys=victim, val=item.state())
+
 
 @dataclass
 class OobiQueryRecord:  # information for responding to OOBI query
@@ -340,8 +400,19 @@ class Baser(dbing.LMDBer):
     Attributes:
         see superclass LMDBer for inherited attributes
 
-        kevers (dict): Kever instances indexed by identifier prefix qb64
+        kevers (dbdict): Kever instances indexed by identifier prefix qb64
+            read through cache of key states optionally bounded by LRU eviction
         prefixes (OrderedSet): local prefixes corresponding to habitats for this db
+        wakes (OrderedSet): identifier prefixes whose escrowed items may have
+            been unblocked since the last escrow processing pass
+        waits (dict): of escrowed items waiting on the KEL of the identifier
+            prefix key e.g. delegator or transferable receipter. Each value is
+            dict mapping escrowed item key to its identifier prefix
+        waited (dict): OrderedSet of identifier prefixes in .waits that each
+            escrowed item key waits on so removal of item prunes .waits
+        wigged (dict): list of OrderedSets, one per watcher, of witness
+            indexed signatures added to .wigs keyed by dgKey of watched event.
+            Only watched keys are tracked, see .watchWigs and .unwatchWigs
 
         .evts is named sub DB whose values are serialized events
             dgKey
@@ -436,6 +507,22 @@ class Baser(dbing.LMDBer):
             DB is keyed by identifer prefix plus sequence number of key event
             More than one value per DB key is allowed
 
+        .ests is named sub DB index of establishment events in key event logs
+            that maps sequence numbers of establishment events only to their
+            serialized event digests.
+            snKey
+            Values are digests used to lookup event in .evts sub DB
+            DB is keyed by identifer prefix plus sequence number of key event
+            Lookup of authoritative establishment event for any sn is a seek
+            to the greatest key at or below snKey(pre, sn) see .getEstLast
+            Only one value per DB key is allowed
+
+        .achs is named sub DB index of anchored event seals. Maps the event
+            seal (i, s, d) anchored in the seal list of an accepted key event,
+            with s as 32 char hex, to the set of triples (Prefixer, Seqner,
+            Saider) of prefix, sn and said of each anchoring key event.
+            Used by .findAnchoringEvent for delegation and issuance lookups.
+
         .pses is named sub DB of partially signed escrowed event tables
             that map sequence numbers to serialized event digests.
             snKey
@@ -581,7 +668,7 @@ class Baser(dbing.LMDBer):
 
     """
 
-    def __init__(self, headDirPath=None, reopen=False, **kwa):
+    def __init__(self, headDirPath=None, reopen=False, keverCapacity=None, **kwa):
         """
         Setup named sub databases.
 
@@ -596,12 +683,20 @@ class Baser(dbing.LMDBer):
                 If not provided use default .HeadDirpath
             mode is int numeric os dir permissions for database directory
             reopen (bool): True means database will be reopened by this init
+            keverCapacity (int | None): max number of Kevers held in memory by
+                .kevers. Least recently used evicted first except local
+                prefixes. None means unbounded
 
 
         """
         self.prefixes = oset()
+        self.wakes = oset()  # prefixes with escrows to reprocess
+        self.waits = dict()  # escrowed items waiting on prefix key
+        self.waited = dict()  # prefixes waited on by escrowed item key
+        self.wigged = dict()  # added wigs of watched events per watcher
         self._kevers = dbdict()
         self._kevers.db = self  # assign db for read thorugh cache of kevers
+        self._kevers.capacity = keverCapacity
 
         super(Baser, self).__init__(headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -645,6 +740,12 @@ class Baser(dbing.LMDBer):
         self.vrcs = self.env.open_db(key=b'vrcs.', dupsort=True)
         self.vres = self.env.open_db(key=b'vres.', dupsort=True)
         self.kels = self.env.open_db(key=b'kels.', dupsort=True)
+        self.ests = self.env.open_db(key=b'ests.')
+        # anchored event seals (i, s, d) to anchoring event (pre, sn, said)
+        self.achs = subing.CatCesrIoSetSuber(db=self, subkey='achs.',
+                                             klas=(coring.Prefixer,
+                                                   coring.Seqner,
+                                                   coring.Saider))
         self.pses = self.env.open_db(key=b'pses.', dupsort=True)
         self.pdes = self.env.open_db(key=b'pdes.')
         self.pwes = self.env.open_db(key=b'pwes.', dupsort=True)
@@ -773,8 +874,16 @@ class Baser(dbing.LMDBer):
     def reload(self):
         """
         Reload stored prefixes and Kevers from .habs
+        Backfills .ests index when database predates it
 
         """
+        if not self.readonly:
+            with self._begin(db=self.ests) as txn:
+                unindexed = not txn.stat(self.ests)["entries"]
+            if unindexed:  # database predates .ests and .achs so backfill
+                self.reindexEsts()
+                self.reindexAnchors()
+
         removes = []
         for keys, data in self.habs.getItemIter():
             if (state := self.states.get(keys=data.prefix)) is not None:
@@ -985,31 +1094,90 @@ class Baser(dbing.LMDBer):
         msg.extend(atc)
         return msg
 
+    @staticmethod
+    def _anchorKeys(seal):
+        """
+        Returns keys tuple (i, s, d) into .achs for event seal dict with s
+        normalized to 32 char hex. Returns None when seal is not an event seal.
+
+        Parameters:
+            seal (dict): event seal with fields i, s, d where s is hex str or int
+        """
+        try:
+            sn = seal["s"] if isinstance(seal["s"], int) else int(seal["s"], 16)
+            return (seal["i"], "%032x" % sn, seal["d"])
+        except (TypeError, KeyError, ValueError):  # not an event seal
+            return None
+
+    def indexAnchors(self, serder):
+        """
+        Adds to .achs each event seal anchored in the seal list of key event
+        serder. Idempotent.
+
+        Parameters:
+            serder (Serder): accepted key event
+        """
+        seals = serder.ked.get("a", [])
+        if not isinstance(seals, list):
+            return
+        for seal in seals:
+            if not isinstance(seal, dict) or (keys := self._anchorKeys(seal)) is None:
+                continue
+            self.achs.add(keys=keys, val=(coring.Prefixer(qb64=serder.pre),
+                                          coring.Seqner(sn=serder.sn),
+                                          serder.saider))
+
+    def reindexAnchors(self):
+        """
+        Backfill .achs index of anchored event seals from the KEL of every
+        prefix with a key state in .states. Idempotent.
+
+        Returns:
+            count (int): number of anchoring events indexed
+        """
+        count = 0
+        for keys, _ in self.states.getItemIter():
+            pre = keys[0]
+            for dig in self.getKelIter(pre):
+                raw = self.getEvt(key=dbing.dgKey(pre, dig))
+                if raw is None:
+                    continue
+                serder = coring.Serder(raw=bytes(raw))
+                if serder.ked.get("a"):
+                    self.indexAnchors(serder)
+                    count += 1
+        return count
+
+    def getAnchorsIter(self, anchor):
+        """
+        Returns iterator of triples (Prefixer, Seqner, Saider) of prefix, sn
+        and said of each accepted key event that anchors event seal anchor.
+        Empty when anchor is not an event seal or is not anchored.
+
+        Parameters:
+            anchor is dict of event seal with fields i, s, d
+        """
+        if (keys := self._anchorKeys(anchor)) is None:
+            return iter(())
+        return self.achs.getIter(keys=keys)
+
     def findAnchoringEvent(self, pre, anchor):
         """
-        Search through a KEL for the event that contains a specific anchor.
+        Find the event in a KEL that anchors a specific event seal.
         Returns the Serder of the first event with the anchor, None if not found
+        Uses .achs index so lookup is a single key read.
 
         Parameters:
             pre is qb64 identifier of the KEL to search
             anchor is dict of anchor to find
 
         """
-        for evt in self.clonePreIter(pre=pre):
-            srdr = coring.Serder(raw=evt)
-            if "a" in srdr.ked:
-                ancs = srdr.ked["a"]
-                if len(ancs) != 1:
-                    continue
-
-                anc = ancs[0]
-                spre = anc["i"]
-                ssn = int(anc["s"])
-                sdig = anc["d"]
-
-                if spre == anchor["i"] and ssn == int(anchor["s"]) \
-                        and anchor["d"] == sdig:
-                    return srdr
+        for prefixer, seqner, saider in self.getAnchorsIter(anchor):
+            if prefixer.qb64 != pre:
+                continue
+            raw = self.getEvt(key=dbing.dgKey(pre, saider.qb64b))
+            if raw is not None:
+                return coring.Serder(raw=bytes(raw))
 
         return None
 
@@ -1285,7 +1453,10 @@ class Baser(dbing.LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.putVals(self.wigs, key, vals)
+        result = self.putVals(self.wigs, key, vals)
+        if self.wigged:
+            self.noteWigs(key, vals)
+        return result
 
     def addWig(self, key, val):
         """
@@ -1295,7 +1466,49 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.addVal(self.wigs, key, val)
+        result = self.addVal(self.wigs, key, val)
+        if result and self.wigged:
+            self.noteWigs(key, [val])
+        return result
+
+    def watchWigs(self, key):
+        """
+        Use dgKey()
+        Returns new OrderedSet to which indexed witness signatures added to .wigs
+        at key are noted until .unwatchWigs. Each watcher gets its own set so
+        may clear it without losing notes of other watchers of the same key.
+        """
+        notes = oset()
+        self.wigged.setdefault(bytes(key), []).append(notes)
+        return notes
+
+    def unwatchWigs(self, key, notes):
+        """
+        Use dgKey()
+        Stop noting indexed witness signatures at key into notes from .watchWigs.
+        Key is no longer watched once its last watcher stops.
+        """
+        key = bytes(key)
+        watchers = self.wigged.get(key)
+        if watchers is not None:
+            watchers[:] = [watcher for watcher in watchers if watcher is not notes]
+            if not watchers:
+                del self.wigged[key]
+
+    def noteWigs(self, key, vals):
+        """
+        Use dgKey()
+        Add indexed witness signatures vals to each watcher in .wigged at key
+        when key is watched so watchers learn of new receipts without reading .wigs
+        """
+        if isinstance(key, str):
+            key = key.encode("utf-8")
+        watchers = self.wigged.get(bytes(key))
+        if watchers:
+            vals = [val.encode("utf-8") if isinstance(val, str) else bytes(val)
+                    for val in vals]
+            for notes in watchers:
+                notes.update(vals)
 
     def cntWigs(self, key):
         """
@@ -1702,6 +1915,76 @@ class Baser(dbing.LMDBer):
         """
         return self.delIoVals(self.kels, key)
 
+    def putEst(self, key, val):
+        """
+        Use snKey()
+        Write establishment event dig val bytes to key
+        Does not overwrite existing val if any
+        Returns True If val successfully written Else False
+        Returns False if key already exists
+        """
+        return self.putVal(self.ests, key, val)
+
+    def setEst(self, key, val):
+        """
+        Use snKey()
+        Write establishment event dig val bytes to key
+        Overwrites existing val if any such as superseding recovery rotation
+        Returns True If val successfully written Else False
+        """
+        return self.setVal(self.ests, key, val)
+
+    def getEst(self, key):
+        """
+        Use snKey()
+        Return establishment event dig at key
+        Returns None if no entry at key
+        """
+        return self.getVal(self.ests, key)
+
+    def delEst(self, key):
+        """
+        Use snKey()
+        Deletes value at key.
+        Returns True If key exists in database Else False
+        """
+        return self.delVal(self.ests, key)
+
+    def getEstLast(self, pre, sn):
+        """
+        Returns duple (sn, dig) of latest establishment event in KEL of pre
+        at or before sequence number sn. This is the establishment event that
+        is authoritative for the event at sn.
+        Returns None if no establishment event at or before sn
+
+        Parameters:
+            pre is bytes or str of identifier prefix
+            sn is int sequence number
+        """
+        return self.getOrdItemPreLast(self.ests, pre, sn)
+
+    def reindexEsts(self):
+        """
+        Backfill .ests index of establishment events from the KEL of every
+        prefix with a key state in .states. Idempotent so may be rerun to
+        repair the index of an existing database.
+
+        Returns:
+            count (int): number of establishment events indexed
+        """
+        count = 0
+        for keys, _ in self.states.getItemIter():
+            pre = keys[0]
+            for dig in self.getKelEstIter(pre):
+                raw = self.getEvt(key=dbing.dgKey(pre, dig))
+                if raw is None:
+                    continue
+                serder = coring.Serder(raw=bytes(raw))
+                if serder.est:
+                    self.setEst(dbing.snKey(pre, serder.sn), serder.saidb)
+                    count += 1
+        return count
+
     def getKelIter(self, pre):
         """
         Returns iterator of all dup vals in insertion order for all entries
@@ -45,6 +45,7 @@ l
 
 """
 
+import functools
 import os
 import shutil
 import stat
@@ -211,6 +212,28 @@ def unsuffix(iokey: Union[bytes, str, memoryview], *, sep: Union[bytes, str]=b'.
     return (key, ion)
 
 
+def growing(f):
+    """
+    Decorator for LMDBer write accessor methods.
+    When the write fails with lmdb.MapFullError and the LMDBer has .mapGrow
+    enabled then grows the map size and retries the write until it fits.
+    Does not retry when joined to an outer transaction from .txn() because
+    the outer transaction must be aborted first. In that case .txn() grows the
+    map and reraises so that .atomic() may retry the whole batch.
+    """
+    @functools.wraps(f)
+    def wrapper(self, *pa, **kwa):
+        while True:
+            try:
+                return f(self, *pa, **kwa)
+            except lmdb.MapFullError:
+                if not self.mapGrow or self._txn is not None:
+                    raise
+                self.growMap()
+
+    return wrapper
+
+
 def clearDatabaserDir(path):
     """
     Remove directory path
@@ -278,6 +301,20 @@ class LMDBer(filing.Filer):
     Attributes:
         env (lmdb.env): LMDB main (super) database environment
         readonly (bool): True means open LMDB env as readonly
+        mapSize (int): maximum size in bytes of LMDB memory map and hence of
+            the database. Grows when .mapGrow and map is full
+        mapGrow (bool): True means grow map size when write fails with
+            lmdb.MapFullError. False means raise lmdb.MapFullError
+        writeMap (bool): True means use writeable memory map
+        sync (bool): True means flush system buffers to disk on commit
+        metaSync (bool): True means flush meta page to disk on commit
+        mapAsync (bool): True means use asynchronous flushes when writeMap
+        readAhead (bool): True means OS read ahead on LMDB file
+        maxReaders (int): maximum number of simultaneous read transactions
+
+    Hidden:
+        _txn (lmdb.Transaction): active outer write transaction opened by .txn()
+            that all accessor methods join. None when no outer transaction
 
     Properties:
 
@@ -305,9 +342,13 @@ class LMDBer(filing.Filer):
     TempSuffix = "_test"
     Perm = stat.S_ISVTX | stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR  # 0o1700==960
     MaxNamedDBs = 64
+    MapSize = 10485760  # 10 MiB default initial map size
+    MaxReaders = 126
 
 
-    def __init__(self, readonly=False, **kwa):
+    def __init__(self, readonly=False, mapSize=None, mapGrow=True,
+                 writeMap=False, sync=True, metaSync=True, mapAsync=False,
+                 readAhead=True, maxReaders=None, **kwa):
         """
         Setup main database directory at .dirpath.
         Create main database environment at .env using .path.
@@ -341,10 +382,33 @@ class LMDBer(filing.Filer):
 
             readonly (bool): True means open database in readonly mode
                                 False means open database in read/write mode
+            mapSize (int): initial maximum size in bytes of LMDB memory map.
+                Default .MapSize. Persisted larger size of existing database
+                is used when larger
+            mapGrow (bool): True means grow map size when full
+                False means raise lmdb.MapFullError when full
+            writeMap (bool): True means use writeable memory map
+            sync (bool): True means flush system buffers to disk on commit
+                False means faster but last commits may be lost on crash
+            metaSync (bool): True means flush meta page to disk on commit
+            mapAsync (bool): True means use asynchronous flushes when writeMap
+            readAhead (bool): True means OS read ahead on LMDB file
+                False may improve random read performance of large databases
+            maxReaders (int): maximum number of simultaneous read transactions.
+                Default .MaxReaders
 
         """
         self.env = None
+        self._txn = None
         self.readonly = True if readonly else False
+        self.mapSize = mapSize if mapSize is not None else self.MapSize
+        self.mapGrow = True if mapGrow else False
+        self.writeMap = True if writeMap else False
+        self.sync = True if sync else False
+        self.metaSync = True if metaSync else False
+        self.mapAsync = True if mapAsync else False
+        self.readAhead = True if readAhead else False
+        self.maxReaders = maxReaders if maxReaders is not None else self.MaxReaders
         super(LMDBer, self).__init__(**kwa)
 
 
@@ -380,11 +444,35 @@ class LMDBer(filing.Filer):
         # open lmdb major database instance
         # creates files data.mdb and lock.mdb in .dbDirPath
         self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs,
-                             mode=self.perm, readonly=self.readonly)
+                             mode=self.perm, readonly=self.readonly,
+                             map_size=self.mapSize, writemap=self.writeMap,
+                             sync=self.sync, metasync=self.metaSync,
+                             map_async=self.mapAsync, readahead=self.readAhead,
+                             max_readers=self.maxReaders)
+        # existing database may have persisted larger map size than requested
+        self.mapSize = self.env.info()["map_size"]
         self.opened = True if opened and self.env else False
         return self.opened
 
 
+    def growMap(self, size=None):
+        """
+        Grow map size of .env to size or else double current map size.
+        Must not be called while any transaction is active in this process.
+
+        Returns:
+            size (int): new map size in bytes
+
+        Parameters:
+            size (int): new map size in bytes. None means double current size
+        """
+        if size is None:
+            size = self.env.info()["map_size"] * 2
+        self.env.set_mapsize(size)
+        self.mapSize = self.env.info()["map_size"]
+        return self.mapSize
+
+
     def close(self, clear=False):
         """
         Close lmdb at .env and if clear or .temp then remove lmdb directory at .path
@@ -398,11 +486,112 @@ class LMDBer(filing.Filer):
                 pass
 
         self.env = None
+        self._txn = None
 
         return(super(LMDBer, self).close(clear=clear))
 
 
+    @contextmanager
+    def txn(self, write=True):
+        """
+        Context manager for a transaction scoped batch of writes.
+        Every accessor method called on this LMDBer, and so on any Suber or
+        Komer built on it, inside the 'with' block joins the same write
+        transaction instead of opening its own. The transaction commits once on
+        exit of the outermost 'with' block or aborts if an exception is raised
+        so the batch is atomic. Nested calls join the outer transaction.
+        When the batch does not fit in the map the map is grown, if .mapGrow,
+        and lmdb.MapFullError is reraised so the caller may retry the batch.
+
+        Usage:
+
+        with baser.txn():
+            baser.putEvt(dgkey, raw)
+            baser.addKe(snKey(pre, sn), said)
+
+        Parameters:
+            write (bool): True means write transaction. False means read only
+                transaction for a consistent snapshot batch of reads. Writes
+                inside a read only transaction raise lmdb.ReadonlyError
+
+        Yields:
+            txn (lmdb.Transaction): the active write transaction
+        """
+        if self._txn is not None:  # nested so join outer transaction
+            yield self._txn
+            return
+
+        try:
+            with self.env.begin(write=write, buffers=True) as txn:
+                self._txn = txn
+                try:
+                    yield txn
+                finally:
+                    self._txn = None
+        except lmdb.MapFullError:
+            if self.mapGrow:  # batch aborted so grow for retry by caller
+                self.growMap()
+            raise
+
+
+    def atomic(self, fn, *pa, **kwa):
+        """
+        Returns result of calling fn(*pa, **kwa) inside one write transaction
+        from .txn() so all writes made by fn commit together or not at all.
+        When the batch does not fit in the map and .mapGrow then .txn() has
+        aborted the batch and grown the map so fn is called again until it fits.
+        Nested calls join the outer transaction and retry happens at the
+        outermost call. fn should only write to the database since it may run
+        more than once.
+
+        Usage:
+
+        def log():
+            baser.putEvt(dgkey, raw)
+            baser.addKe(snKey(pre, sn), said)
+
+        baser.atomic(log)
+
+        Parameters:
+            fn (Callable): function that performs the batch of writes
+            pa (tuple): positional arguments for fn
+            kwa (dict): keyword arguments for fn
+        """
+        if self._txn is not None:  # nested so outermost call retries
+            return fn(*pa, **kwa)
+
+        while True:
+            try:
+                with self.txn():
+                    return fn(*pa, **kwa)
+            except lmdb.MapFullError:
+                if not self.mapGrow:
+                    raise
+                # .txn() aborted batch and grew map so retry whole batch
+
+
+    @contextmanager
+    def _begin(self, db, write=False):
+        """
+        Context manager for the transaction used by a single accessor method.
+        Joins the active outer transaction from .txn() if any otherwise begins
+        and commits its own transaction.
+        Because an outer transaction is not bound to db, accessors must always
+        pass db explicitly to each transaction or cursor operation.
+
+        Parameters:
+            db (lmdb._Database): instance of named sub db
+            write (bool): True means write transaction, False means read only
+        """
+        if self._txn is not None:
+            yield self._txn
+        else:
+            with self.env.begin(db=db, write=write, buffers=True) as txn:
+                yield txn
+
+
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
+    @growing
     def putVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -415,10 +604,11 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.put(key, val, overwrite=False))
+        with self._begin(db=db, write=True) as txn:
+            return (txn.put(key, val, overwrite=False, db=db))
 
 
+    @growing
     def setVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -430,8 +620,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.put(key, val))
+        with self._begin(db=db, write=True) as txn:
+            return (txn.put(key, val, db=db))
 
 
     def getVal(self, db, key):
@@ -444,10 +634,11 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            return( txn.get(key))
+        with self._begin(db=db, write=False) as txn:
+            return( txn.get(key, db=db))
 
 
+    @growing
     def delVal(self, db, key):
         """
         Deletes value at key in db.
@@ -457,8 +648,8 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.delete(key))
+        with self._begin(db=db, write=True) as txn:
+            return (txn.delete(key, db=db))
 
 
     def cnt(self, db):
@@ -468,8 +659,8 @@ class LMDBer(filing.Filer):
         Parameters:
             db is opened named sub db with dupsort=True
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             count = 0
             for _, _ in cursor:
                 count += 1
@@ -494,8 +685,8 @@ class LMDBer(filing.Filer):
             split (bool): True means split key at sep before returning
             sep (bytes): separator char for key
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
 
@@ -508,7 +699,7 @@ class LMDBer(filing.Filer):
                 yield tuple(splits)
 
 
-    def getTopItemIter(self, db, key=b''):
+    def getTopItemIter(self, db, key=b'', start=b''):
         """
         Iterates over branch of db given by key
 
@@ -528,10 +719,13 @@ class LMDBer(filing.Filer):
             key (bytes): truncated top key, a key space prefix to get all the items
                         from multiple branches of the key space. If top key is
                         empty then gets all items in database
+            start (bytes): full or partial key within branch to resume from.
+                        Iteration begins at first key >= start. Empty means
+                        begin at top key
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
-            if cursor.set_range(key):  # move to val at key >= key if any
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
+            if cursor.set_range(max(key, bytes(start))):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
                     ckey = bytes(ckey)
                     if not ckey.startswith(key): #  prev entry if any last in branch
@@ -540,6 +734,7 @@ class LMDBer(filing.Filer):
             return  # done raises StopIteration
 
 
+    @growing
     def delTopVal(self, db, key=b''):
         """
         Deletes all values in branch of db given top key.
@@ -563,9 +758,9 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = False
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(key):  # move to val at key >= key if any
                 ckey, cval = cursor.item()
                 while ckey:  # end of database key == b''
@@ -580,6 +775,7 @@ class LMDBer(filing.Filer):
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
     # and use keys with ordinal as monotonically increasing number part
     # such as sn or fn
+    @growing
     def appendOrdValPre(self, db, pre, val):
         """
         Appends val in order after last previous key with same pre in db.
@@ -598,9 +794,9 @@ class LMDBer(filing.Filer):
         # set key with fn at max and then walk backwards to find last entry at pre
         # if any otherwise zeroth entry at pre
         key = onKey(pre, MaxON)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             on = 0  # unless other cases match then zeroth entry at pre
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if not cursor.set_range(key):  # max is past end of database
                 #  so either empty database or last is earlier pre or
                 #  last is last entry  at same pre
@@ -645,8 +841,8 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix
             on is int ordinal number to resume replay
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             if not cursor.set_range(key):  #  moves to val at key >= key
                 return  # no values end of db
@@ -658,6 +854,36 @@ class LMDBer(filing.Filer):
                 yield (cn, val)  # (on, dig) of event
 
 
+    def getOrdItemPreLast(self, db, pre, on):
+        """
+        Returns duple item, (on, val), of entry with the greatest ordinal
+        number that is less than or equal to on amongst entries with same
+        prefix, pre, in db. Returns None if no such entry.
+        Uses onKey(pre, on) for entries so lookup is a single cursor seek.
+
+        Parameters:
+            db is opened named sub db with dupsort=False
+            pre is bytes of itdentifier prefix
+            on is int ordinal number upper bound of lookup
+        """
+        if hasattr(pre, "encode"):
+            pre = pre.encode("utf-8")  # convert str to bytes
+        key = onKey(pre, on)
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
+            if cursor.set_range(key):  # move to val at key >= key if any
+                if cursor.key() != key:  # later entry so backup one entry
+                    if not cursor.prev():  # no earlier entry
+                        return None
+            elif not cursor.last():  # past end of database so backup to last
+                return None  # empty database
+
+            cpre, cn = splitKeyON(cursor.key())
+            if cpre != pre:  # earlier pre so no entry at pre
+                return None
+            return (cn, cursor.value())
+
+
     def getAllOrdItemAllPreIter(self, db, key=b''):
         """
         Returns iterator of triple item, (pre, on, dig), at each key over all
@@ -673,8 +899,8 @@ class LMDBer(filing.Filer):
             key is key location in db to resume replay,
                    If empty then start at first key in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
 
@@ -691,6 +917,7 @@ class LMDBer(filing.Filer):
     # size limitation of 511 bytes.
 
 
+    @growing
     def putIoSetVals(self, db, key, vals, *, sep=b'.'):
         """
         Add each val in vals to insertion ordered set of values all with the
@@ -710,10 +937,10 @@ class LMDBer(filing.Filer):
         """
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 pvals = oset()  # pre-existing vals at key
                 for iokey, val in cursor.iternext():  # get iokey, val at cursor
@@ -734,6 +961,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @growing
     def addIoSetVal(self, db, key, val, *, sep=b'.'):
         """
         Add val to insertion ordered set of values all with the same apparent
@@ -750,11 +978,11 @@ class LMDBer(filing.Filer):
             val (bytes): serialized value to add
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             vals = oset()
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, cval in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -771,6 +999,7 @@ class LMDBer(filing.Filer):
             return cursor.put(iokey, val, dupdata=False, overwrite=False)
 
 
+    @growing
     def setIoSetVals(self, db, key, vals, *, sep=b'.'):
         """
         Erase all vals at key and then add unique vals as insertion ordered set of
@@ -789,13 +1018,14 @@ class LMDBer(filing.Filer):
         self.delIoSetVals(db=db, key=key, sep=sep)
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             for i, val in enumerate(vals):
                 iokey = suffix(key, i, sep=sep)  # ion is at add on amount
-                result = txn.put(iokey, val, dupdata=False, overwrite=True) or result
+                result = txn.put(iokey, val, dupdata=False, overwrite=True, db=db) or result
             return result
 
 
+    @growing
     def appendIoSetVal(self, db, key, val, *, sep=b'.'):
         """
         Append val to insertion ordered set of values all with the same apparent
@@ -813,8 +1043,8 @@ class LMDBer(filing.Filer):
         """
         ion = 0  # default is zeroth insertion at key
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            cursor = txn.cursor()  # create cursor to walk back
+        with self._begin(db=db, write=True) as txn:
+            cursor = txn.cursor(db=db)  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
                 # 1. last entry in db is for same key
@@ -863,10 +1093,10 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             vals = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -891,9 +1121,9 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get key, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -919,8 +1149,8 @@ class LMDBer(filing.Filer):
         val = None
         ion = None  # no last value
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()  # create cursor to walk back
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
                 # 1. last entry in db is for same key
@@ -970,6 +1200,7 @@ class LMDBer(filing.Filer):
         return len(self.getIoSetVals(db=db, key=key, sep=sep))
 
 
+    @growing
     def delIoSetVals(self, db, key, *, sep=b'.'):
         """
         Deletes all values at apparent effective key.
@@ -985,9 +1216,9 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
         """
         result = False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 iokey, cval = cursor.item()
                 while iokey:  # end of database iokey == b'' cant internext.
@@ -999,6 +1230,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @growing
     def delIoSetVal(self, db, key, val, *, sep=b'.'):
         """
         Deletes val at apparent effective key if exists.
@@ -1028,9 +1260,9 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             val (bytes): value to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, cval in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -1054,10 +1286,10 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             items = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -1082,9 +1314,9 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get key, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -1094,6 +1326,7 @@ class LMDBer(filing.Filer):
             return  # done raises StopIteration
 
 
+    @growing
     def delIoSetIokey(self, db, iokey):
         """
         Deletes val at at actual iokey that includes ordinal key suffix.
@@ -1106,11 +1339,12 @@ class LMDBer(filing.Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             iokey (bytes): actual key with ordinal key suffix
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return txn.delete(iokey)
+        with self._begin(db=db, write=True) as txn:
+            return txn.delete(iokey, db=db)
 
 
     # For subdbs that support duplicates at each key (dupsort==True)
+    @growing
     def putVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db
@@ -1127,13 +1361,14 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = True
             for val in vals:
-                result = result and txn.put(key, val, dupdata=True)
+                result = result and txn.put(key, val, dupdata=True, db=db)
             return result
 
 
+    @growing
     def addVal(self, db, key, val):
         """
         Add val bytes as dup to key in db
@@ -1156,8 +1391,8 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
-                result = txn.put(key, val, dupdata=True)
+            with self._begin(db=db, write=True) as txn:
+                result = txn.put(key, val, dupdata=True, db=db)
         return result
 
 
@@ -1173,8 +1408,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 vals = [val for val in cursor.iternext_dup()]
@@ -1192,8 +1427,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             val = None
             if cursor.set_key(key):  # move to first_dup
                 if cursor.last_dup(): # move to last_dup
@@ -1212,8 +1447,8 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
@@ -1228,8 +1463,8 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             count = 0
             if cursor.set_key(key):  # moves to first_dup
                 count = cursor.count()
@@ -1247,8 +1482,8 @@ class LMDBer(filing.Filer):
             db is opened named sub db
             pre is bytes of key within sub db's keyspace pre.on
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             count = 0
             if not cursor.set_range(key):  #  moves to val at key >= key
@@ -1262,6 +1497,7 @@ class LMDBer(filing.Filer):
 
             return count
 
+    @growing
     def delVals(self, db, key, val=b''):
         """
         Deletes all values at key in db if val=b'' else deletes the dup
@@ -1273,12 +1509,13 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of dup val at key to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.delete(key, val))
+        with self._begin(db=db, write=True) as txn:
+            return (txn.delete(key, val, db=db))
 
 
     # For subdbs that support insertion order preserving duplicates at each key.
     # dupsort==True and prepends and strips io val proem
+    @growing
     def putIoVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db in insertion order
@@ -1305,9 +1542,9 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getIoVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             idx = 0
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_key(key): # move to key if any
                 if cursor.last_dup(): # move to last dup
                     idx = 1 + int(bytes(cursor.value()[:32]), 16)  # get last index as int
@@ -1315,7 +1552,7 @@ class LMDBer(filing.Filer):
             for val in vals:
                 if val not in dups:
                     val = (b'%032x.' % (idx)) +  val  # prepend ordering proem
-                    txn.put(key, val, dupdata=True)
+                    txn.put(key, val, dupdata=True, db=db)
                     idx += 1
                     result = True
         return result
@@ -1349,8 +1586,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 # slice off prepended ordering proem
@@ -1370,8 +1607,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
@@ -1390,8 +1627,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             val = None
             if cursor.set_key(key):  # move to first_dup
                 if cursor.last_dup(): # move to last_dup
@@ -1420,8 +1657,8 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             items = []
             if cursor.set_range(key):  # moves to first_dup at key
                 found = True
@@ -1454,8 +1691,8 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             if cursor.set_range(key):  # moves to first_dup at key
                 found = True
                 if skip and key and cursor.key() == key:  # skip to next key
@@ -1475,14 +1712,15 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             count = 0
             if cursor.set_key(key):  # moves to first_dup
                 count = cursor.count()
             return count
 
 
+    @growing
     def delIoVals(self,db, key):
         """
         Deletes all values at key in db if key present.
@@ -1493,10 +1731,11 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.delete(key))
+        with self._begin(db=db, write=True) as txn:
+            return (txn.delete(key, db=db))
 
 
+    @growing
     def delIoVal(self, db, key, val):
         """
         Deletes dup io val at key in db. Performs strip search to find match.
@@ -1526,8 +1765,8 @@ class LMDBer(filing.Filer):
             val is bytes of value to be deleted without intersion ordering proem
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=True) as txn:
+            cursor = txn.cursor(db=db)
             if cursor.set_key(key):  # move to first_dup
                 for proval in cursor.iternext_dup():  #  value with proem
                     if val == proval[33:]:  #  strip of proem
@@ -1553,8 +1792,8 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
@@ -1580,8 +1819,8 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt := fn)
             while cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
@@ -1609,8 +1848,8 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
                 if cursor.last_dup(): # move to last_dup
@@ -1641,8 +1880,8 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt:=0)
             while cursor.set_range(key):  #  moves to first dup of key >= key
                 key = cursor.key()  # actual key
@@ -153,7 +153,8 @@ class SuberBase():
         return (val.decode("utf-8") if hasattr(val, "decode") else val)
 
 
-    def getItemIter(self, keys: Union[str, Iterable]=b""):
+    def getItemIter(self, keys: Union[str, Iterable]=b"",
+                    start: Union[str, Iterable]=b""):
         """
         Returns:
             items (Iterator): if (key, val) tuples over the all the items in
@@ -166,9 +167,13 @@ class SuberBase():
                 a full keys tuple in  in order to get all the items from
                 multiple branches of the key space. If keys is empty then gets
                 all items in database.
+            start (Iterator): tuple of bytes or strs of full or partial keys
+                within branch given by keys to resume iteration from, starting
+                at first key >= start. If empty then starts at keys.
 
         """
-        for key, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys)):
+        for key, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys),
+                                               start=self._tokey(start)):
             yield (self._tokeys(key), self._des(val))
 
 
@@ -38,6 +38,7 @@ class Exchanger(doing.DoDoer):
         self.hab = hab
         self.controller = controller
         self.kevers = hab.kvy.kevers
+        self.vex = hab.kvy.vex  # share opt in signature verification executor
         self.delta = delta
         self.routes = dict()
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
@@ -96,7 +97,8 @@ class Exchanger(doing.DoDoer):
                              "".format(payload, source.qb64))
 
         #  Verify provided sigers using verfers
-        ssigers, indices = eventing.verifySigs(serder=serder, sigers=sigers, verfers=verfers)
+        ssigers, indices = eventing.verifySigs(serder=serder, sigers=sigers, verfers=verfers,
+                                               vex=self.vex)
         if not tholder.satisfy(indices):  # at least one but not enough
             self.escrowPSEvent(serder=serder, source=source, sigers=sigers)
             self.cues.append(dict(kin="query", q=dict(r="logs", pre=source.qb64)))
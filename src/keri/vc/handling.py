@@ -449,7 +449,7 @@ class RequestHandler(doing.Doer):
                 matches = []
                 for descriptor in descriptors:
                     schema = descriptor["s"]
-                    credentials = self.wallet.getCredentials(schema)
+                    credentials = self.wallet.getCredentials(schema, limit=1)
                     if len(credentials) > 0:
                         matches.append(credentials[0])
 
@@ -66,9 +66,9 @@ def credential(schema,
     _, sad = coring.Saider.saidify(sad=subject, kind=kind, label=coring.Ids.d)
     vc["a"] = sad
 
-    _, vc = coring.Saider.saidify(sad=vc)
+    _, vc, raw = coring.Saider.saidive(sad=vc)
 
-    return Credentialer(ked=vc)
+    return Credentialer(raw=raw, ked=vc)
 
 
 class Credentialer(coring.Sadder):
@@ -124,27 +124,27 @@ class Credentialer(coring.Sadder):
     @property
     def crd(self):
         """ issuer property getter"""
-        return self._ked
+        return self.ked
 
     @property
     def issuer(self):
         """ issuer property getter"""
-        return self._ked["i"]
+        return self.ked["i"]
 
     @property
     def schema(self):
         """ schema property getter"""
-        return self._ked["s"]
+        return self.ked["s"]
 
     @property
     def subject(self):
         """ subject property getter"""
-        return self._ked["a"]
+        return self.ked["a"]
 
     @property
     def status(self):
         """ status property getter"""
-        return self._ked["a"]["ri"]
+        return self.ked["a"]["ri"]
 
 
 class CrederSuber(subing.Suber):
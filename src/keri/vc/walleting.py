@@ -37,24 +37,43 @@ class Wallet:
 
         self.reger = reger if reger is not None else viring.Registry(name=self.name, temp=self.temp)
 
-    def getCredentials(self, schema=None):
+    def getCredentials(self, schema=None, limit=None, cursor=None, **kwa):
         """
-        Return list of (creder, prefixer, seqner, diger, sigers) for each credential
-        that matches schema
+        Return list of (creder, sadsigers, sadcigars) for each credential
+        that matches schema and filters, in issuance date order.
 
         Parameters:
             schema: qb64 SAID of the schema for the credential
+            limit (Optional(int)): max number of credentials to return, None means all
+            cursor (Optional(str)): cursor of last credential of previous page
+            **kwa (dict): additional filters passed to Registry.getCredsIter
 
         """
-        saiders = self.reger.schms.get(keys=schema.encode("utf-8"))
-
         creds = []
-        for saider in saiders:
-            creder, sadsigers, sadcigars = self.reger.cloneCred(said=saider.qb64)
-            creds.append((creder, sadsigers, sadcigars))
+        for _, cred in self.getCredentialsIter(schema=schema, cursor=cursor, **kwa):
+            if limit is not None and len(creds) >= limit:
+                break
+            creds.append(cred)
 
         return creds
 
+    def getCredentialsIter(self, schema=None, cursor=None, **kwa):
+        """
+        Returns iterator of (cursor, (creder, sadsigers, sadcigars)) for each
+        credential that matches schema and filters, in issuance date order.
+        Each credential is loaded only when reached so large wallets can be
+        streamed.  Resume after any credential by passing its cursor.
+
+        Parameters:
+            schema: qb64 SAID of the schema for the credential
+            cursor (Optional(str)): cursor of last credential of previous page
+            **kwa (dict): additional filters passed to Registry.getCredsIter
+                issuer, subject, registry, status, dta, dtb
+
+        """
+        for cursor, saider in self.reger.getCredsIter(schema=schema, cursor=cursor, **kwa):
+            yield cursor, self.reger.cloneCred(said=saider.qb64)
+
 
 class WalletDoer(doing.DoDoer):
     """ DoDoer for process escrows and cues associated with a wallet
@@ -25,7 +25,7 @@ from ..db.dbing import dgKey, snKey
 from ..help import helping
 from ..kering import (MissingWitnessSignatureError, Version,
                       MissingAnchorError, ValidationError, OutOfOrderError, LikelyDuplicitousError)
-from ..vdr.viring import Registry, nsKey
+from ..vdr.viring import Registry, CredStatusRecord, nsKey
 
 logger = help.ogler.getLogger()
 
@@ -219,9 +219,9 @@ def rotate(
                br=cuts,  # list of qb64 may be empty
                ba=adds,  # list of qb64 may be empty
                )
-    _, ked = coring.Saider.saidify(sad=ked)
+    _, ked, raw = coring.Saider.saidive(sad=ked)
 
-    return Serder(ked=ked)  # return serialized ked
+    return Serder(raw=raw, ked=ked)  # return serialized ked
 
 
 def issue(
@@ -1201,6 +1201,7 @@ class Tever:
         """ Calculate state (issued/revoked) of VC from db.
 
         Returns None if never issued from this Registry
+        Reads status record from .reger.vcss so cost does not scale with TEL.
 
         Parameters:
           vcpre (str):  qb64 VC identifier
@@ -1208,6 +1209,59 @@ class Tever:
         Returns:
             status (Serder): transaction event state notification message
         """
+        record = self.reger.vcss.get(keys=(self.prefixer.qb64, vcpre))
+        if record is None:  # not indexed yet so rebuild from TEL
+            if (record := self.vcRecord(vcpre)) is None:
+                return None
+            self.reger.vcss.pin(keys=(self.prefixer.qb64, vcpre), val=record)
+
+        return self._vcstate(vcpre, record)
+
+    def vcStates(self, vcpres):
+        """ Calculate states (issued/revoked) of many VCs from db.
+
+        Reads all status records in one read transaction.
+
+        Parameters:
+          vcpres (Iterable): of qb64 VC identifiers
+
+        Returns:
+            list: of status Serder in order of vcpres, None for each VC never
+                  issued from this Registry
+        """
+        vcpres = list(vcpres)
+        with self.reger.txn(write=False):
+            records = [self.reger.vcss.get(keys=(self.prefixer.qb64, vcpre))
+                       for vcpre in vcpres]
+
+        return [self._vcstate(vcpre, record) if record is not None
+                else self.vcState(vcpre)  # rebuild and index outside of read txn
+                for vcpre, record in zip(vcpres, records)]
+
+    def _vcstate(self, vcpre, record):
+        """ Returns transaction state notification Serder of VC from its
+        CredStatusRecord record
+        """
+        return vcstate(vcpre=vcpre,
+                       said=record.said,
+                       sn=record.sn,
+                       ri=self.prefixer.qb64,
+                       eilk=record.ilk,
+                       ra=record.ra,
+                       a=record.a,
+                       )
+
+    def vcRecord(self, vcpre):
+        """ Rebuild status record of VC by walking its TEL in db.
+
+        Returns None if never issued from this Registry
+
+        Parameters:
+          vcpre (str):  qb64 VC identifier
+
+        Returns:
+            CredStatusRecord: of latest TEL event of VC
+        """
         vci = nsKey([self.prefixer.qb64, vcpre])
         digs = []
         for _, dig in self.reger.getTelItemPreIter(pre=vci):
@@ -1230,21 +1284,16 @@ class Tever:
             vcilk = Ilks.bis if len(digs) == 1 else Ilks.brv
             ra = serder.ked["ra"]
 
-
-        dgkey = dbing.dgKey(vci, vcdig)
         couple = self.reger.getAnc(dgkey)
         ancb = bytearray(couple)
         seqner = coring.Seqner(qb64b=ancb, strip=True)
         saider = coring.Saider(qb64b=ancb, strip=True)
 
-        return vcstate(vcpre=vcpre,
-                       said=vcdig.decode("utf-8"),
-                       sn=vcsn,
-                       ri=self.prefixer.qb64,
-                       eilk=vcilk,
-                       ra=ra,
-                       a=dict(s=seqner.sn, d=saider.qb64),
-                       )
+        return CredStatusRecord(sn=vcsn,
+                                said=vcdig.decode("utf-8"),
+                                ilk=vcilk,
+                                ra=ra,
+                                a=dict(s=seqner.sn, d=saider.qb64))
 
     def vcSn(self, vcpre):
         """ Calculates the current seq no of VC from db.
@@ -1258,6 +1307,9 @@ class Tever:
             int: current TEL sequence number of credential or None if not found
 
         """
+        if (record := self.reger.vcss.get(keys=(self.prefixer.qb64, vcpre))) is not None:
+            return record.sn
+
         vci = nsKey([self.prefixer.qb64, vcpre])
         cnt = self.reger.cntTels(vci)
 
@@ -1285,18 +1337,49 @@ class Tever:
         dig = serder.saider.qb64b
         key = dgKey(pre, dig)
         sealet = seqner.qb64b + saider.qb64b
-        self.reger.putAnc(key, sealet)
-        if bigers:
-            self.reger.putTibs(key, [biger.qb64b for biger in bigers])
-        if baks:
-            self.reger.delBaks(key)
-            self.reger.putBaks(key, [bak.encode("utf-8") for bak in baks])
-        self.reger.tets.pin(keys=(pre.decode("utf-8"), dig.decode("utf-8")), val=coring.Dater())
-        self.reger.putTvt(key, serder.raw)
-        self.reger.putTel(snKey(pre, sn), dig)
+        def log():  # commit all logs at once, rerun if map grown
+            self.reger.putAnc(key, sealet)
+            if bigers:
+                self.reger.putTibs(key, [biger.qb64b for biger in bigers])
+            if baks:
+                self.reger.delBaks(key)
+                self.reger.putBaks(key, [bak.encode("utf-8") for bak in baks])
+            self.reger.tets.pin(keys=(pre.decode("utf-8"), dig.decode("utf-8")), val=coring.Dater())
+            self.reger.putTvt(key, serder.raw)
+            self.reger.putTel(snKey(pre, sn), dig)
+            if serder.ked["t"] in (Ilks.iss, Ilks.rev, Ilks.bis, Ilks.brv):
+                self.logStatus(sn=sn, serder=serder, seqner=seqner, saider=saider)
+
+        self.reger.atomic(log)
         logger.info("Tever state: %s Added to TEL valid event=\n%s\n",
                     pre, json.dumps(serder.ked, indent=1))
 
+    def logStatus(self, sn, serder, seqner, saider):
+        """ Update status record of VC in .reger.vcss and its status index
+        in .reger.cidx to verified TEL event.
+
+        Does not regress status when an earlier event is logged again.
+
+        Parameters:
+            sn (int): is event sequence number
+            serder (Serder): is Serder instance of VC TEL event
+            seqner (Seqner): issuing event sequence number from controlling KEL.
+            saider (Saider): issuing event SAID from controlling KEL.
+        """
+        keys = (self.prefixer.qb64, serder.pre)
+        record = self.reger.vcss.get(keys=keys)
+        if record is not None and record.sn > sn:
+            return
+
+        self.reger.clones.pop(serder.pre, None)  # cloned credential now stale
+        self.reger.vcss.pin(keys=keys, val=CredStatusRecord(sn=sn,
+                                                            said=serder.said,
+                                                            ilk=serder.ked["t"],
+                                                            ra=serder.ked.get("ra", dict()),
+                                                            a=dict(s=seqner.sn, d=saider.qb64)))
+        self.reger.indexStatus(said=serder.pre, ilk=serder.ked["t"],
+                               prior=record.ilk if record is not None else None)
+
     def valAnchorBigs(self, serder, seqner, saider, bigers, toad, baks):
         """ Validate anchor and backer signatures (bigers) when provided.
 
@@ -1371,7 +1454,14 @@ class Tever:
              bool: True is anchoring event exists in database and seal is valid against
                    TEL event.
 
+        Checks the anchored seal index first so anchoring events with more than
+        one seal also verify.
         """
+        seal = dict(i=serder.ked["i"], s=serder.ked["s"], d=serder.said)
+        for prefixer, aseqner, asaider in self.db.getAnchorsIter(seal):
+            if (prefixer.qb64 == self.pre and aseqner.sn == seqner.sn
+                    and asaider.qb64 == saider.qb64):
+                return True
 
         dig = self.db.getKeLast(key=snKey(pre=self.pre, sn=seqner.sn))
         if not dig:
@@ -2042,10 +2132,13 @@ class Tevery:
 
         """
         key = dgKey(serder.preb, serder.saidb)
-        self.reger.putTvt(key, serder.raw)
-        sealet = seqner.qb64b + saider.qb64b
-        self.reger.putAnc(key, sealet)
-        self.reger.putOot(snKey(serder.preb, serder.sn), serder.saidb)
+        def log():  # commit all escrow logs at once, rerun if map grown
+            self.reger.putTvt(key, serder.raw)
+            sealet = seqner.qb64b + saider.qb64b
+            self.reger.putAnc(key, sealet)
+            self.reger.putOot(snKey(serder.preb, serder.sn), serder.saidb)
+
+        self.reger.atomic(log)
         logger.info("Tever state: Escrowed our of order TEL event "
                     "event = %s\n", serder.ked)
 
@@ -34,7 +34,11 @@ class Issuer:
     Backers that can act as witnesses of VC events, and 1 VC TEL for each VC issued that tracks the
     issuance and revocation status of those VCs.
 
+    Class Attributes:
+        BatchSize (int): max number of registry event seals anchored by one key event
+
     """
+    BatchSize = 1000
 
     def __init__(self, hab, name="test", cues=None, reger=None, estOnly=False,
                  temp=False, **kwa):
@@ -193,6 +197,41 @@ class Issuer:
 
         return True
 
+    def issueMany(self, creders, dt=None):
+        """ Create and process iss or bis message events for many credentials
+
+        Registry events of all credentials are anchored in bulk, up to .BatchSize
+        seals per key event, so N credentials need ceil(N / .BatchSize) key
+        events and witness receipt rounds instead of N.
+
+        Parameters:
+            creders (list): Credentialer instances of the credentials to issue
+            dt (str): iso8601 formatted date time string of issuance for
+                credentials whose subject has no dt of its own
+
+        Returns:
+            boolean: True if issuance is successful
+
+        """
+        serders = []
+        craws = bytearray()
+        for creder in creders:
+            vcdig = creder.said
+            craws.extend(self.hab.endorse(creder))
+            cdt = creder.subject["dt"] if "dt" in creder.subject else dt
+
+            if self.noBackers:
+                serder = eventing.issue(vcdig=vcdig, regk=self.regk, dt=cdt)
+            else:
+                serder = eventing.backerIssue(vcdig=vcdig, regk=self.regk, regsn=self.regi,
+                                              regd=self.regser.saider.qb64, dt=cdt)
+            serders.append(serder)
+
+        self.anchorMany(serders=serders, reason=craws.decode("utf-8"),
+                        subjects=[creder.subject for creder in creders])
+
+        return True
+
     def revoke(self, creder, dt=None):
         """ Perform revocation of credential
 
@@ -205,6 +244,42 @@ class Issuer:
         Returns:
             boolean: True if revocation is successful.
 
+        """
+        serder = self.revocation(creder=creder, dt=dt)
+
+        self.anchorMsg(serder, subject=creder.subject)
+
+        return True
+
+    def revokeMany(self, creders, dt=None):
+        """ Perform bulk revocation of credentials
+
+        Create rev or brv message events for all credentials and anchor them in
+        bulk, up to .BatchSize seals per key event.  Once anchored, the updated
+        credential states are published in bulk with a single status cue.
+
+        Parameters:
+            creders (list): Credentialer instances of the credentials to revoke
+            dt (str): iso8601 formatted date time string of revocation
+
+        Returns:
+            boolean: True if revocation is successful.
+
+        """
+        serders = [self.revocation(creder=creder, dt=dt) for creder in creders]  # validate all first
+
+        self.anchorMany(serders=serders)
+        self.publish(serders)
+
+        return True
+
+    def revocation(self, creder, dt=None):
+        """ Returns rev or brv message event Serder revoking credential
+
+        Parameters:
+            creder (Credentialer): instance of the credential to revoke
+            dt (str): iso8601 formatted date time string of revocation
+
         """
         vcdig = creder.said
         vckey = nsKey([self.regk, vcdig])
@@ -221,9 +296,35 @@ class Issuer:
             serder = eventing.backerRevoke(vcdig=vcdig, regk=self.regk, regsn=self.regi, regd=self.regser.saider.qb64,
                                            dig=iserder.said, dt=dt)
 
-        self.anchorMsg(serder, subject=creder.subject)
+        return serder
 
-        return True
+    def publish(self, serders):
+        """ Cue updated credential states of VC registry events for publication
+
+        Reads the states of all VCs in one pass and appends a single status cue
+        with a stream of signed /tsn/credential reply messages, one per VC, to be
+        sent to the registry backers in bulk.  The cue also carries the
+        holders of the VCs.
+
+        Parameters:
+            serders (list): Serder instances of processed VC registry events
+
+        """
+        tever = self.tevers[self.regk]
+        vcpres = [serder.pre for serder in serders]
+        msgs = bytearray()
+        holders = []
+        for vcpre, tsn in zip(vcpres, tever.vcStates(vcpres)):
+            if tsn is None:  # not yet processed
+                continue
+            msgs.extend(self.hab.reply(route=f"/tsn/credential/{self.hab.pre}", data=tsn.ked))
+            creder = self.reger.creds.get(keys=vcpre)
+            if creder is not None and "i" in creder.subject and creder.subject["i"] not in holders:
+                holders.append(creder.subject["i"])
+
+        if msgs:
+            baks = self.hab.kever.wits if tever.noBackers else tever.baks
+            self.cues.append(dict(kin="status", msg=msgs, baks=baks, holders=holders))
 
     @staticmethod
     def attachSeal(serder, seal):
@@ -258,48 +359,76 @@ class Issuer:
             seal (Optional(SealSource)): option seal provided to n > 1 participants of multsig registry
 
         """
+        self.anchorMany(serders=[serder], subject=subject, reason=reason, seal=seal)
 
-        group = self.hab.group()
+    def anchorMany(self, serders, subject=None, reason=None, seal=None, subjects=None):
+        """  Create key events with seals to serders anchored as data.
+
+        Anchors the seals of up to .BatchSize registry events in each rotation or
+        interaction event so a single witness receipt round covers all of them.
+        Each registry event is still processed individually with the source seal
+        of its anchoring key event attached.  Inserts one outbound kevt cue per
+        key event and one send cue per subject holder with that holder's
+        registry events from the chunk.
+
+        Parameters:
+            serders (list): registry event messages
+            subject (dict): credential subject of all serders when any
+            reason (Optional(str)): optional string message for multisig notifications
+            seal (Optional(SealSource)): option seal provided to n > 1 participants of multsig registry
+            subjects (Optional(list)): credential subject of each of serders in
+                order. Overrides subject
+
+        """
 
-        rseal = SealEvent(serder.pre, serder.ked["s"], serder.said)
-        rseal = rseal._asdict()
+        group = self.hab.group()
+        if subjects is None:
+            subjects = [subject] * len(serders)
 
         if group is None:
-            if self.estOnly:
-                kevt = self.hab.rotate(data=[rseal])
-            else:
-                kevt = self.hab.interact(data=[rseal])
-
-            seal = SealSource(s=self.hab.kever.sn, d=self.hab.kever.serder.said)
-            tevt = self.attachSeal(serder=serder, seal=seal)
-
-            self.psr.parseOne(ims=bytearray(tevt))  # make copy as kvr deletes
-            self.cues.extend([
-                dict(
-                    kin="kevt",
-                    msg=kevt,
-                    sub=subject
-                ),
-                dict(
-                    kin="send",
-                    msg=tevt,
-                    sub=subject
-                ),
-            ])
+            for i in range(0, len(serders), self.BatchSize):
+                chunk = serders[i:i + self.BatchSize]
+                rseals = [SealEvent(serder.pre, serder.ked["s"], serder.said)._asdict()
+                          for serder in chunk]
+
+                if self.estOnly:
+                    kevt = self.hab.rotate(data=rseals)
+                else:
+                    kevt = self.hab.interact(data=rseals)
+
+                seal = SealSource(s=self.hab.kever.sn, d=self.hab.kever.serder.said)
+                sends = dict()  # registry events of chunk by subject holder
+                for serder, sub in zip(chunk, subjects[i:i + self.BatchSize]):
+                    tevt = self.attachSeal(serder=serder, seal=seal)
+                    self.psr.parseOne(ims=bytearray(tevt))  # make copy as kvr deletes
+                    holder = sub["i"] if sub is not None else None
+                    if holder not in sends:
+                        sends[holder] = (sub, bytearray())
+                    sends[holder][1].extend(tevt)
+
+                self.cues.append(dict(kin="kevt", msg=kevt, sub=subject))
+                self.cues.extend(dict(kin="send", msg=tevts, sub=sub)
+                                 for sub, tevts in sends.values())
 
         else:
             if seal is None:
                 op = grouping.Ops.rot if self.estOnly else grouping.Ops.ixn
-                mmsg = dict(kin="multisig", op=op, data=[rseal], reason=reason)
-                self.cues.append(mmsg)
-
-                self.escrow(serder)
+                for i in range(0, len(serders), self.BatchSize):
+                    chunk = serders[i:i + self.BatchSize]
+                    rseals = [SealEvent(serder.pre, serder.ked["s"], serder.said)._asdict()
+                              for serder in chunk]
+                    mmsg = dict(kin="multisig", op=op, data=rseals, reason=reason)
+                    self.cues.append(mmsg)
+
+                for serder in serders:
+                    self.escrow(serder)
                 raise kering.MissingAnchorError("anchor not provided for multisig")
             else:
-                tevt = self.attachSeal(serder=serder, seal=seal)
-                self.psr.parseOne(ims=bytearray(tevt))  # make copy as kvr deletes
+                for serder in serders:
+                    tevt = self.attachSeal(serder=serder, seal=seal)
+                    self.psr.parseOne(ims=bytearray(tevt))  # make copy as kvr deletes
 
-                self.cues.append(dict(kin="logEvent", msg=tevt))
+                    self.cues.append(dict(kin="logEvent", msg=tevt))
 
     def escrow(self, serder):
         """ Save Issuer event for future process when anchor becomes available
@@ -314,54 +443,54 @@ class Issuer:
         """
         Process credential registry missing anchor escrow:
 
+        Escrowed events anchored by the same key event are processed together
+        and the updated states of any revoked credentials published in bulk.
+
         """
+        anchored = dict()  # escrowed events grouped by seal of their anchoring event
         for (regk,), raw in self.reger.mase.getItemIter():
             serder = coring.Serder(raw=raw.encode("utf-8"))
 
-            if "ri" in serder.ked:
-                tev = self.tevers[serder.ked["ri"]]
-                pre = tev.pre
-            else:
+            if serder.ked["t"] == coring.Ilks.vcp:
                 pre = serder.ked["ii"]
+            elif regk in self.tevers:  # VC and rotation events have no issuer field
+                pre = self.tevers[regk].pre
+            else:
+                continue
 
-            sn = serder.sn
-            dig = serder.said
-
-            seal = None
-            for evts in self.hab.db.clonePreIter(pre=pre):
-                eserder = coring.Serder(raw=evts)
-                if "a" in eserder.ked:
-                    ancs = eserder.ked["a"]
-                    if len(ancs) != 1:
-                        continue
-
-                    anc = ancs[0]
-                    spre = anc["i"]
-                    ssn = int(anc["s"])
-                    sdig = anc["d"]
-
-                    if spre == serder.ked["i"] and ssn == sn \
-                            and dig == sdig:
-                        seal = SealSource(s=eserder.sn, d=eserder.said)
-                        break
-
-            if not seal:
+            anchor = dict(i=serder.ked["i"], s=serder.ked["s"], d=serder.said)
+            # anchoring event may anchor it alone or among a batch of seals
+            eserder = self.hab.db.findAnchoringEvent(pre=pre, anchor=anchor)
+            if eserder is None:
                 continue
 
+            seal = SealSource(s=eserder.sn, d=eserder.said)
+            anchored.setdefault(seal, []).append((regk, raw, serder))
+
+        for seal, escrows in anchored.items():
+            serders = [serder for (_, _, serder) in escrows]
             try:
-                self.anchorMsg(serder, seal=seal, reason=None)
+                self.anchorMany(serders, seal=seal, reason=None)
             except kering.MissingAnchorError as ex:
                 logger.exception("Issuer unescrow failed event from escrow = {}", ex.args[0])
+                continue
             except Exception as ex:
                 logger.exception("Issuer unescrow failed event from escrow = {}", ex.args[0])
-                self.reger.mase.rem(regk, raw)
-            else:  # unescrow succeeded, remove from escrow
+            else:  # unescrow succeeded
                 # We don't remove all escrows at pre,sn because some might be
                 # duplicitous so we process remaining escrows in spite of found
                 # valid event escrow.
+                for serder in serders:
+                    logger.info("Issuer unescrow succeeded in valid event: "
+                                "event=\n%s\n", json.dumps(serder.ked, indent=1))
+
+                revs = [serder for (regk, _, serder) in escrows if regk == self.regk
+                        and serder.ked["t"] in (coring.Ilks.rev, coring.Ilks.brv)]
+                if revs:
+                    self.publish(revs)
+
+            for (regk, raw, _) in escrows:  # remove from escrow
                 self.reger.mase.rem(regk, raw)
-                logger.info("Issuer unescrow succeeded in valid event: "
-                            "event=\n%s\n", json.dumps(serder.ked, indent=1))
 
 
 class IssuerDoer(doing.DoDoer):
@@ -454,7 +583,9 @@ class IssuerDoer(doing.DoDoer):
 
 
         Creating issuance events and anchoring them to key state.
-        Propagates all events to witnesses or backers
+        Propagates all events to witnesses or backers.  When msg data is a list
+        one credential is issued per element and their issuance events are
+        anchored in bulk.
 
         Parameters:
             tymth (function): injected function wrapper closure returned by .tymen() of
@@ -478,17 +609,6 @@ class IssuerDoer(doing.DoDoer):
                 recipient = msg["recipient"]
                 data = msg["data"]
 
-                dt = data["dt"] if "dt" in data else helping.nowIso8601()
-
-
-                d = dict(
-                    d="",
-                    i=recipient,
-                    dt=dt,
-                )
-
-                d |= data
-
                 group = self.hab.group()
                 if group is None:
                     pre = self.hab.pre
@@ -496,19 +616,37 @@ class IssuerDoer(doing.DoDoer):
                     name, group = group
                     pre = group.gid
 
-                creder = proving.credential(issuer=pre,
-                                            schema=schema,
-                                            subject=d,
-                                            source=source,
-                                            status=self.issuer.regk)
+                batch = isinstance(data, list)  # list of credential data to issue in bulk
+                now = helping.nowIso8601()
+                creders = []
+                for datum in (data if batch else [data]):
+                    dt = datum["dt"] if "dt" in datum else now
+
+                    d = dict(
+                        d="",
+                        i=recipient,
+                        dt=dt,
+                    )
+
+                    d |= datum
+
+                    creders.append(proving.credential(issuer=pre,
+                                                      schema=schema,
+                                                      subject=d,
+                                                      source=source,
+                                                      status=self.issuer.regk))
 
                 try:
-                    self.issuer.issue(creder=creder, dt=dt)
+                    if batch:
+                        self.issuer.issueMany(creders=creders, dt=now)
+                    else:
+                        self.issuer.issue(creder=creders[0], dt=dt)
                 except kering.MissingAnchorError:
                     logger.info("Missing anchor from credential issuance due to multisig identifier")
 
-                craw = self.hab.endorse(creder)
-                parsing.Parser().parse(ims=craw, vry=self.verifier)
+                for creder in creders:
+                    craw = self.hab.endorse(creder)
+                    parsing.Parser().parse(ims=craw, vry=self.verifier)
 
                 yield self.tock
 
@@ -543,14 +681,23 @@ class IssuerDoer(doing.DoDoer):
                     self.cues.append(dict(kin="published", regk=self.issuer.regk))
                 elif cueKin == "kevt":
                     kevt = cue["msg"]
-                    witDoer = agenting.WitnessReceiptor(hab=self.hab, msg=kevt)
+                    witDoer = agenting.WitnessReceiptor(hab=self.hab, msg=kevt, parent=self)
                     self.extend([witDoer])
 
-                    while not witDoer.done:
+                    while witDoer.complete is None:
                         yield self.tock
 
-                    self.remove([witDoer])
-                    self.cues.append(dict(kin="witnessed", regk=self.issuer.regk))
+                    kin = "witnessed" if witDoer.complete else "unwitnessed"
+                    self.cues.append(dict(kin=kin, regk=self.issuer.regk))
+                elif cueKin == "status":
+                    witSender = agenting.WitnessPublisher(hab=self.hab, msg=cue["msg"], wits=cue["baks"])
+                    self.extend([witSender])
+
+                    while not witSender.done:
+                        _ = yield self.tock
+
+                    self.remove([witSender])
+                    self.cues.append(dict(kin="statused", regk=self.issuer.regk, holders=cue["holders"]))
                 elif cueKin == "multisig":
                     msg = dict(
                         op=cue["op"],
@@ -122,13 +122,14 @@ class RegistryInceptDoer(doing.DoDoer):
 
                 elif cueKin == "kevt":
                     kevt = cue["msg"]
-                    witDoer = agenting.WitnessReceiptor(hab=self.hab, msg=kevt)
+                    witDoer = agenting.WitnessReceiptor(hab=self.hab, msg=kevt, parent=self)
                     self.extend([witDoer])
 
-                    while not witDoer.done:
+                    while witDoer.complete is None:
                         yield self.tock
 
-                    self.remove([witDoer])
+                    if not witDoer.complete:
+                        self.cues.append(dict(kin="unwitnessed", regk=self.issuer.regk))
 
                 elif cueKin == "multisig":
                     msg = dict(
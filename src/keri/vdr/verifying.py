@@ -135,14 +135,12 @@ class Verifier:
             # raise kering.InvalidCredentialStateError("..."))
 
         # Verify the credential against the schema
-        scraw = scheming.jsonSchemaCache.resolve(schema)
-        if not scraw:
+        schemer = scheming.jsonSchemaCache.schemer(schema)
+        if schemer is None:
             if self.escrowMSE(creder, sadsigers, sadcigars):
                 self.cues.append(dict(kin="query", q=dict(r="schema", said=schema)))
             raise kering.MissingSchemaError("schema {} not in cache".format(schema))
 
-
-        schemer = scheming.Schemer(raw=scraw)
         if not schemer.verify(creder.raw):
             raise kering.FailedSchemaValidationError("Credential {} is not valid against schema {}"
                                                      .format(creder.said, schema))
@@ -8,7 +8,10 @@ Provides public simple Verifiable Credential Issuance/Revocation Registry
 A special purpose Verifiable Data Registry (VDR)
 """
 
-from dataclasses import dataclass
+import copy
+import datetime
+from collections import OrderedDict
+from dataclasses import dataclass, field
 
 from keri.db import koming, subing, escrowing
 
@@ -16,9 +19,12 @@ from .. import kering
 from ..app import signing
 from ..core import coring
 from ..db import dbing
+from .. import help
 from ..help import helping
 from ..vc import proving
 
+logger = help.ogler.getLogger()
+
 
 class RegerDict(dict):
     """ Reger backed read through cache for registry state
@@ -93,6 +99,27 @@ class RegistryRecord:
     registryKey: str
 
 
+@dataclass
+class CredStatusRecord:
+    """ Latest TEL state of credential keyed by (registry key, credential SAID)
+    """
+    sn: int  # sequence number of latest TEL event of credential
+    said: str  # qb64 SAID of latest TEL event of credential
+    ilk: str  # ilk of latest TEL event, iss or bis issued, rev or brv revoked
+    ra: dict = field(default_factory=dict)  # registry seal when registry has backers
+    a: dict = field(default_factory=dict)  # seal s and d of anchoring KEL event
+
+
+# credential status value in .cidx by ilk of latest TEL event of credential
+CredStatus = {coring.Ilks.iss: "issued",
+              coring.Ilks.bis: "issued",
+              coring.Ilks.rev: "revoked",
+              coring.Ilks.brv: "revoked"}
+
+# credential query filters indexed in .cidx, "date" has empty value so it indexes all
+CredIndexFields = ("issuer", "subject", "schema", "registry", "status", "date")
+
+
 def openReg(name="test", **kwa):
     """ Returns contextmanager generated by openLMDB but with Baser instance
 
@@ -166,11 +193,27 @@ class Registry(dbing.LMDBer):
             key is habitat name str
             value is serialized RegistryRecord dataclass
 
+        .vcss is named subDB instance of Komer that maps credential status
+            key is (registry key, credential SAID)
+            value is serialized CredStatusRecord dataclass of latest TEL event
+            maintained by Tever.logEvent
+
+        .cidx is named subDB instance of CesrSuber of compound credential indexes
+            key is (field, value, issuance Dater qb64, credential SAID) where field
+            is one of CredIndexFields, so each index is ordered by issuance date
+            value is Saider of credential
+            maintained by .logCred and Tever.logEvent
+
+        .clones is in memory LRU cache of cloned credential nodes used by
+            .cloneCreds keyed by credential SAID. Bounded by .CloneCacheSize.
+            A node is stale once the TEL of its credential is updated
+
 
     """
     TailDirPath = "keri/reg"
     AltTailDirPath = ".keri/reg"
     TempPrefix = "keri_reg_"
+    CloneCacheSize = 4096  # max credential nodes held by .clones
 
     def __init__(self, headDirPath=None, reopen=True, **kwa):
         """
@@ -228,6 +271,8 @@ class Registry(dbing.LMDBer):
         """
         super(Registry, self).reopen(**kwa)
 
+        self.clones = OrderedDict()  # LRU cache of cloned credential nodes
+
         # Create by opening first time named sub DBs within main DB instance
         # Names end with "." as sub DB name must include a non Base64 character
         # to avoid namespace collisions with Base64 identifier prefixes.
@@ -290,48 +335,117 @@ class Registry(dbing.LMDBer):
                                  subkey='regs.',
                                  schema=RegistryRecord, )
 
+        # latest credential status keyed by (registry key, credential SAID)
+        self.vcss = koming.Komer(db=self,
+                                 subkey='vcss.',
+                                 schema=CredStatusRecord, )
+
+        # compound credential indexes keyed by (field, value, issuance date, credential SAID)
+        self.cidx = subing.CesrSuber(db=self, subkey='cidx.', klas=coring.Saider)
+
+        if not self.readonly:
+            with self._begin(db=self.cidx.sdb) as txn:
+                unindexed = not txn.stat(self.cidx.sdb)["entries"]
+            if unindexed:  # database predates .cidx so backfill
+                self.reindexCreds()
+
         return self.env
 
 
-    def cloneCreds(self, saids):
+    def cloneCreds(self, saids, depth=None):
         """ Returns fully expanded credential with chained credentials attached.
 
+        Chains are expanded as a DAG so a credential shared by many branches
+        is cloned once per call and reused across calls from .clones until its
+        TEL is updated. Returned credentials are copies of cached nodes so are
+        safe to change. Cycles in chains are cut.
+
         Parameters:
            saids (list): of Saider objects:
+           depth (int | None): max depth of chains to expand below each
+               credential in saids. None means unlimited
 
         Returns:
             list: fully hydrated credentials with full chains provided
 
         """
-        creds = []
-        for saider in saids:
-            key = saider.qb64b
-            creder, sadsigers, sadcigars = self.cloneCred(said=key)
-
-            chainSaids = []
-            for p in creder.crd["p"]:
-                v = list(p.values()).pop()
-                chainSaids.append(coring.Saider(qb64=v["d"]))
-            chains = self.cloneCreds(chainSaids)
-
-            regk = creder.status
-            status = self.tevers[regk].vcState(saider.qb64)
-            cred = dict(
-                sad=creder.crd,
-                pre=creder.issuer,
-                sadsigers=[dict(
-                    path=pather.text,
-                    pre=prefixer.qb64,
-                    sn=seqner.sn,
-                    d=saider.qb64
-                ) for (pather, prefixer, seqner, saider) in sadsigers],
-                sadcigars=[dict(path=pather.text, cigar=cigar.qb64) for (pather, cigar) in sadcigars],
-                chains=chains,
-                status=status.ked,
-            )
-
-            creds.append(cred)
-        return creds
+        memo = dict()
+        return [self._expandCred(saider.qb64, depth, memo, set()) for saider in saids]
+
+    def _expandCred(self, said, depth, memo, ancestors):
+        """ Returns credential dict of said with chains expanded to depth
+
+        Parameters:
+            said (str): qb64 SAID of credential
+            depth (int | None): max depth of chains to expand. None is unlimited
+            memo (dict): expanded credentials of this call keyed by (said, depth)
+            ancestors (set): SAIDs of credentials on path from root to said
+        """
+        if (said, depth) in memo:
+            return memo[(said, depth)]
+
+        node = self.cloneNode(said)
+        chains = []
+        if depth is None or depth > 0:
+            ancestors.add(said)
+            for edge in node["edges"]:
+                if edge in ancestors:
+                    logger.error("Registry cloneCreds: cut cyclic chain from %s to %s",
+                                 said, edge)
+                    continue
+                chains.append(self._expandCred(edge, None if depth is None else depth - 1,
+                                               memo, ancestors))
+            ancestors.discard(said)
+
+        cred = dict(  # copy so callers can not change node cached in .clones
+            sad=copy.deepcopy(node["sad"]),
+            pre=node["pre"],
+            sadsigers=copy.deepcopy(node["sadsigers"]),
+            sadcigars=copy.deepcopy(node["sadcigars"]),
+            chains=chains,
+            status=copy.deepcopy(node["status"]),
+        )
+        memo[(said, depth)] = cred
+        return cred
+
+    def cloneNode(self, said):
+        """ Returns dict node of cloned credential said without its chains
+        expanded, with SAIDs of chained credentials as edges.
+        Reuses node from .clones while TEL of credential is unchanged.
+
+        Parameters:
+            said (str): qb64 SAID of credential
+        """
+        if (node := self.clones.get(said)) is not None:
+            record = self.vcss.get(keys=(node["regk"], said))
+            if record is not None and record.said == node["tel"]:
+                self.clones.move_to_end(said)
+                return node
+            del self.clones[said]  # stale so reclone
+
+        creder, sadsigers, sadcigars = self.cloneCred(said=said)
+        regk = creder.status
+        status = self.tevers[regk].vcState(said)
+        node = dict(
+            regk=regk,
+            tel=status.ked["d"],  # said of latest TEL event of credential
+            edges=[list(p.values()).pop()["d"] for p in creder.crd["p"]],
+            sad=creder.crd,
+            pre=creder.issuer,
+            sadsigers=[dict(
+                path=pather.text,
+                pre=prefixer.qb64,
+                sn=seqner.sn,
+                d=saider.qb64
+            ) for (pather, prefixer, seqner, saider, _) in sadsigers],
+            sadcigars=[dict(path=pather.text, cigar=cigar.qb64) for (pather, cigar) in sadcigars],
+            status=status.ked,
+        )
+
+        self.clones[said] = node
+        while len(self.clones) > self.CloneCacheSize:
+            self.clones.popitem(last=False)  # evict least recently used
+        return node
 
 
     def logCred(self, creder, sadsigers=None, sadcigars=None):
@@ -345,6 +459,8 @@ class Registry(dbing.LMDBer):
         """
         key = creder.saider.qb64b
         self.creds.put(keys=key, val=creder)
+        self.clones.pop(creder.said, None)  # signatures may have changed
+        self.indexCred(creder)
 
         if sadcigars:
             for (pather, cigar) in sadcigars:
@@ -357,6 +473,112 @@ class Registry(dbing.LMDBer):
                     self.spsgs.add(keys=quinkeys, val=siger)
 
 
+    @staticmethod
+    def credDate(dts):
+        """ Returns qb64 of Dater of iso8601 dts normalized to UTC so that it sorts
+        lexicographically in date order. Empty when missing or invalid.
+
+        Parameters:
+            dts (str): iso8601 date time such as issuance date of credential
+        """
+        try:
+            dt = helping.fromIso8601(dts).astimezone(datetime.timezone.utc)
+            return coring.Dater(dts=helping.toIso8601(dt)).qb64
+        except (AttributeError, TypeError, ValueError):
+            return ""
+
+    def indexCred(self, creder):
+        """ Add entries of creder to .cidx compound indexes.  Idempotent.
+
+        Status is taken from .vcss when its TEL has been processed already,
+        otherwise it is indexed by Tever.logEvent once it is.
+
+        Parameters:
+            creder (Credentialer): credential to index
+        """
+        dt = self.credDate(creder.subject.get("dt"))
+        values = dict(issuer=creder.issuer, subject=creder.subject.get("i"), schema=creder.schema,
+                      registry=creder.status, status=None, date="")
+        if creder.status and (record := self.vcss.get(keys=(creder.status, creder.said))) is not None:
+            values["status"] = CredStatus.get(record.ilk)
+
+        for label, value in values.items():
+            if value is not None:
+                self.cidx.pin(keys=(label, value, dt, creder.said), val=creder.saider)
+
+    def indexStatus(self, said, ilk, prior=None):
+        """ Update status entry of credential said in .cidx to ilk of its latest TEL event
+
+        Parameters:
+            said (str): qb64 SAID of credential
+            ilk (str): ilk of latest TEL event of credential
+            prior (Optional(str)): ilk of previous latest TEL event if any
+        """
+        creder = self.creds.get(keys=said)
+        if creder is None:  # not yet saved so indexed by .logCred
+            return
+
+        dt = self.credDate(creder.subject.get("dt"))
+        if prior is not None and CredStatus.get(prior) != CredStatus.get(ilk):
+            self.cidx.rem(keys=("status", CredStatus.get(prior), dt, said))
+        if ilk in CredStatus:
+            self.cidx.pin(keys=("status", CredStatus[ilk], dt, said), val=creder.saider)
+
+    def reindexCreds(self):
+        """ Rebuild .cidx from all credentials in .creds
+        """
+        for _, creder in self.creds.getItemIter():
+            self.indexCred(creder)
+
+    def getCredsIter(self, issuer=None, subject=None, schema=None, registry=None,
+                     status=None, dta=None, dtb=None, cursor=None):
+        """ Returns iterator of (cursor, saider) of credentials matching all filters
+        in issuance date order.  Streams from .cidx without loading credentials.
+
+        The first given filter in the fixed order subject, issuer, registry,
+        schema, status drives iteration over its index and each remaining filter
+        is a single key read per credential.  The order is by typical not
+        actual selectivity so a query with a broad subject and a narrow schema
+        still scans all credentials of the subject.  Resume a query after the
+        last returned item by passing its cursor.
+
+        Parameters:
+            issuer (Optional(str)): qb64 issuer identifier prefix
+            subject (Optional(str)): qb64 subject identifier prefix
+            schema (Optional(str)): qb64 schema SAID
+            registry (Optional(str)): qb64 registry identifier
+            status (Optional(str)): issued or revoked
+            dta (Optional(str)): iso8601 issued at or after date time
+            dtb (Optional(str)): iso8601 issued at or before date time
+            cursor (Optional(str)): opaque cursor of last item of previous page
+
+        """
+        filters = [(label, value) for label, value in (("subject", subject),
+                                                      ("issuer", issuer),
+                                                      ("registry", registry),
+                                                      ("schema", schema),
+                                                      ("status", status))
+                   if value is not None]
+        label, value = filters.pop(0) if filters else ("date", "")
+
+        start = ()
+        if dta is not None:
+            start = (label, value, self.credDate(dta))
+        last = None
+        if cursor is not None:
+            last = (label, value, *cursor.split(self.cidx.sep))
+            start = max(start, last)
+        end = self.credDate(dtb) if dtb is not None else None
+
+        for keys, saider in self.cidx.getItemIter(keys=(label, value, ""), start=start):
+            if keys == last:  # resume after cursor
+                continue
+            _, _, dt, said = keys
+            if end is not None and dt > end:
+                break
+            if all(self.cidx.get(keys=(f, v, dt, said)) is not None for f, v in filters):
+                yield self.cidx.sep.join((dt, said)), saider
+
     def cloneCred(self, said, root=None):
         """ Load base credential and CESR proof signatures from database.
 
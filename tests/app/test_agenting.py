@@ -4,11 +4,15 @@ tests.app.agenting module
 
 """
 
-from hio.base import doing
+import time
+
+import falcon
+from hio.base import doing, tyming
+from hio.core import http
 
 from keri.core import coring
 from keri.help import nowIso8601
-from keri.app import habbing, indirecting, agenting
+from keri.app import habbing, indirecting, agenting, httping, obtaining
 from keri.core.eventing import SealSource
 from keri.db import dbing
 from keri.vdr import eventing, viring, issuing
@@ -44,6 +48,123 @@ def test_withness_receiptor(mockGetWitnessByPrefix):
         assert len(wigs) == 3
 
 
+def test_witness_receiptor_toad(mockGetWitnessByPrefix):
+    """
+    Test WitnessReceiptor completes at toad receipts with one witness down
+    """
+    with habbing.openHab(name="wan", salt=b'wann-the-witness', transferable=False) as wanHab, \
+            habbing.openHab(name="wil", salt=b'will-the-witness', transferable=False) as wilHab, \
+            habbing.openHab(name="wes", salt=b'wess-the-witness', transferable=False) as wesHab, \
+            habbing.openHab(name="pal", salt=b'0123456789abcdef', transferable=True,
+                            wits=[wanHab.pre, wilHab.pre, wesHab.pre], toad=2) as palHab:
+        wanDoers = indirecting.setupWitness(name="wan", hab=wanHab, temp=True, tcpPort=5632, httpPort=5642)
+        wilDoers = indirecting.setupWitness(name="wil", hab=wilHab, temp=True, tcpPort=5633, httpPort=5643)
+        # wes is not running
+
+        assert palHab.kever.toad == 2
+        witDoer = agenting.WitnessReceiptor(hab=palHab, klas=agenting.TCPWitnesser,
+                                            timeout=0.25, retries=1)
+
+        limit = 2.0
+        tock = 0.03125
+        doist = doing.Doist(limit=limit, tock=tock, doers=wanDoers + wilDoers + [witDoer])
+        doist.enter()
+        tymer = tyming.Tymer(tymth=doist.tymen(), duration=doist.limit)
+        while witDoer.complete is None and not tymer.expired:
+            doist.recur()
+            time.sleep(doist.tock)
+
+        assert witDoer.complete is True
+        assert not witDoer.done  # still resending to wes in background
+        assert palHab.db.wigged
+
+        while not tymer.expired:  # let witnesses drop closed connections
+            doist.recur()
+            time.sleep(doist.tock)
+        doist.exit()
+
+        assert witDoer.done is True
+        assert witDoer.complete is True
+        assert not palHab.db.wigged  # no longer watched
+
+        kev = palHab.kever
+        ser = kev.serder
+        dgkey = dbing.dgKey(ser.preb, ser.saidb)
+
+        assert len(palHab.db.getWigs(dgkey)) == 2
+        # each receipt propagated to the other running witness
+        assert len(wanHab.db.getWigs(dgkey)) == 2
+        assert len(wilHab.db.getWigs(dgkey)) == 2
+
+        # threshold of all three can not be met once retries are spent
+        # finished receiptor removes itself from the parent it runs in
+        parent = doing.DoDoer(doers=[], always=True)
+        witDoer = agenting.WitnessReceiptor(hab=palHab, klas=agenting.TCPWitnesser,
+                                            timeout=0.25, retries=1, parent=parent)
+        parent.doers.append(witDoer)
+        palHab.kever.toad = 3
+        doist = doing.Doist(limit=limit, tock=tock)
+        doist.do(doers=wanDoers + wilDoers + [parent])
+        assert witDoer.done is True
+        assert witDoer.complete is False
+        assert witDoer not in parent.doers
+        assert not palHab.db.wigged
+
+
+def test_http_witnesser_stream_fallback(monkeypatch):
+    """
+    Test HttpWitnesser resends batch per message to witness without CESR stream route
+    """
+
+    class KelEnd:
+        def __init__(self):
+            self.posts = []
+
+        def on_post(self, req, rep):
+            self.posts.append(req.bounded_stream.read())
+            rep.status = falcon.HTTP_204
+
+    kelEnd = KelEnd()
+    app = falcon.App()
+    app.add_route("/kel", kelEnd)  # no /cesr route
+    server = http.Server(port=5957, app=app)
+    assert server.reopen()
+
+    monkeypatch.setattr(obtaining, "getwitnessbyprefix",
+                        lambda qb64: obtaining.Location(ip4="127.0.0.1", tcp=5947, http=5957))
+
+    with habbing.openHab(name="pal", salt=b'0123456789abcdef', transferable=True) as palHab:
+        witer = agenting.HttpWitnesser(hab=palHab, wit=palHab.pre)
+        assert witer.batch
+        witer.msgs.append(palHab.makeOwnEvent(sn=0))
+        for i in range(2):
+            witer.msgs.append(palHab.interact())
+
+        key = ("127.0.0.1", 5957, "http")
+        limit = 1.0
+        tock = 0.03125
+        doist = doing.Doist(limit=limit, tock=tock)
+        doist.do(doers=[http.ServerDoer(server=server), witer])
+
+        assert key in palHab.clienter.streamless  # remembered per endpoint
+        assert len(kelEnd.posts) == 3  # one request per message after rejection
+        assert len(witer.sent) == 3  # rejected stream response not reported
+        assert all(rep.status == 204 for rep in witer.sent)
+
+        # later batches to same endpoint go straight to per message requests
+        witer = agenting.HttpWitnesser(hab=palHab, wit=palHab.pre)
+        for i in range(2):
+            witer.msgs.append(palHab.interact())
+        doist = doing.Doist(limit=limit, tock=tock)
+        doist.do(doers=[http.ServerDoer(server=server), witer])
+
+        assert len(kelEnd.posts) == 5
+        assert len(witer.sent) == 2
+        assert all(rep.request["path"] == "/kel" for rep in witer.sent)
+
+    server.close()
+
+
 def test_witness_sender(mockGetWitnessByPrefix):
     with habbing.openHab(name="wan", salt=b'wann-the-witness', transferable=False) as wanHab, \
             habbing.openHab(name="wil", salt=b'will-the-witness', transferable=False) as wilHab, \
@@ -70,6 +70,60 @@ def test_postman(mockGetWitnessByPrefixOneWitness):
         assert serder.ked["a"] == dict(msg="test")
 
 
+def test_postman_batches(mockGetWitnessByPrefixOneWitness):
+    """
+    Test Postman releases its leased clients so more than Clienter.Size
+    batches to one witness are all delivered
+    """
+    with habbing.openHab(name="test", transferable=True, temp=True) as hab, \
+            habbing.openHab(name="wes", transferable=False, temp=True) as wesHab, \
+            habbing.openHab(name="repTest", transferable=True, temp=True, wits=[wesHab.pre]) as recpHab:
+
+        recpIcp = recpHab.makeOwnEvent(sn=0)
+        wesKvy = eventing.Kevery(db=wesHab.db, lax=False, local=False)
+        parsing.Parser().parse(ims=bytearray(recpIcp), kvy=wesKvy)
+
+        serder = coring.Serder(raw=recpIcp)
+        rct = wesHab.receipt(serder)
+
+        kvy = eventing.Kevery(db=hab.db)
+        parsing.Parser().parseOne(bytearray(recpIcp), kvy=kvy)
+        parsing.Parser().parseOne(bytearray(rct), kvy=kvy)
+        kvy.processEscrows()
+        assert recpHab.pre in kvy.kevers
+
+        mbx = storing.Mailboxer(name="wes", temp=True)
+        wesDoers = indirecting.setupWitness(name="wes", hab=wesHab, mbx=mbx, temp=True, tcpPort=5634, httpPort=5644)
+        pman = forwarding.Postman(hab=hab)
+
+        doist = doing.Doist(tock=0.03125, limit=10.0, doers=wesDoers + [pman])
+        doist.enter()
+
+        def count():
+            return len(list(mbx.cloneTopicIter(topic=recpHab.pre + "/echo", fn=0)))
+
+        batches = hab.clienter.Size + 2
+        for i in range(batches):  # each send is its own batch
+            exn = exchanging.exchange(route="/echo", payload=dict(msg="test", i=i))
+            msg = bytearray(exn.raw)
+            msg.extend(hab.endorse(exn, last=True))
+            pman.send(recipient=recpHab.pre, topic="echo", msg=msg)
+
+            for j in range(100):
+                doist.recur()
+                if count() == i + 1:
+                    break
+                time.sleep(0.01)
+            assert count() == i + 1
+
+        doist.recur()
+        key = ("127.0.0.1", 5644, "http")
+        assert hab.clienter.leases[key] == 0  # all leases released
+        assert len(pman.doers) == 1  # only deliverDo left
+
+        doist.exit()
+
+
 def test_forward():
     recp = "E55b5PtyJY2UWHnTx7ruRdi60i7WovIa7vocO9REpVZA"
     exn = exchanging.exchange(route="/echo", payload=dict(msg="test"))
@@ -236,6 +236,9 @@ def test_multisig_interact():
         sigs.extend(hab2.db.getSigs(dgkey))
         sigs.extend(hab3.db.getSigs(dgkey))
 
+        for groupy in groupies:  # partially signed tally kept for escrow
+            assert len(groupy.tallies[mssrdr.said].indices) == 1
+
         sigers = [coring.Siger(qb64b=bytes(sig)) for sig in sigs]
 
         evt = bytearray(eraw)
@@ -257,6 +260,9 @@ def test_multisig_interact():
         g2.processEscrows()
         g3.processEscrows()
 
+        for groupy in groupies:  # satisfied so tally dropped
+            assert mssrdr.said not in groupy.tallies
+
         kever = hab1.kevers[gid]
         assert kever.sn == 1
         assert kever.ilk == coring.Ilks.ixn
@@ -3,12 +3,16 @@
 tests.peer.httping module
 
 """
+import time
 
 import falcon
 import pytest
 from falcon.testing import helpers
+from hio.base import tyming
+from hio.core import http
 
-from keri.app import habbing, httping
+from keri.app import forwarding, habbing, httping, indirecting
+from keri.core import eventing
 from keri.vdr import issuing, verifying
 
 
@@ -55,6 +59,49 @@ def test_parse_cesr_request():
     assert cr.date == "2021-06-27T21:26:21.233257+00:00"
     assert cr.payload == dict(i=1234)
     assert cr.attachments == "-H000000000"
+    assert cr.raw == b''
+
+    # not a framed message so decoded even when raw requested
+    req = helpers.create_req(
+        path="/credential/issue",
+        headers=dict(
+            Content_Type=httping.CESR_CONTENT_TYPE,
+            CESR_DATE="2021-06-27T21:26:21.233257+00:00",
+            CESR_ATTACHMENT="-H000000000"
+        ),
+        body='{"i": 1234}',
+    )
+    cr = httping.parseCesrHttpRequest(req=req, raw=True)
+    assert cr.payload == dict(i=1234)
+    assert cr.raw == b''
+
+    # framed message passed through without decoding
+    serder = eventing.interact(pre="DWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc",
+                               dig="EWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc", sn=1)
+    assert httping.framed(serder.raw)
+    assert not httping.framed(serder.raw + b' ')
+    assert not httping.framed(b'{"i": 1234}')
+    req = helpers.create_req(
+        path="/kel",
+        headers=dict(
+            Content_Type=httping.CESR_CONTENT_TYPE,
+            CESR_DATE="2021-06-27T21:26:21.233257+00:00",
+            CESR_ATTACHMENT="-AAB"
+        ),
+        body=serder.raw,
+    )
+    cr = httping.parseCesrHttpRequest(req=req, raw=True)
+    assert cr.payload is None
+    assert cr.raw == serder.raw
+    assert cr.attachments == "-AAB"
+    assert indirecting.HttpMessageHandler.message(cr) == serder.raw + b'-AAB'
+
+    # forwarded message body is same bytes as forwarded message
+    msg = bytearray(forwarding.forward(pre="DWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc",
+                                       topic="delegate", serder=serder).raw)
+    client = MockClient()
+    httping.createCESRRequest(msg, client, date="2021-02-13T19:16:50.750302+00:00")
+    assert client.args["body"] == serder.raw
 
 
 class MockClient:
@@ -117,5 +164,152 @@ def test_create_cesr_request(mockHelpingNowUTC):
                                               b'wK_i8NA-cxdg45Bg')
 
 
+def test_create_cesr_stream_request():
+    with habbing.openHab(name="test", transferable=True, temp=True) as hab:
+        icp = hab.makeOwnEvent(sn=0)
+        ixn = hab.interact()
+        qry = hab.query(pre=hab.pre, route="mbx", query=dict(s=0))
+
+        assert httping.streamable(icp)
+        assert httping.streamable(ixn)
+        assert not httping.streamable(qry)
+        assert not httping.streamable(b'-AAB')
+
+        client = MockClient()
+        httping.createCESRStreamRequest([icp, ixn], client)
+
+        assert client.args["method"] == "POST"
+        assert client.args["path"] == httping.CESR_STREAM_PATH
+        assert client.args["body"] == bytes(icp) + bytes(ixn)
+        headers = client.args["headers"]
+        assert headers["Content-Type"] == httping.CESR_STREAM_CONTENT_TYPE
+        assert headers["Content-Length"] == len(icp) + len(ixn)
+
+
+def test_clienter():
+    """
+    Test Clienter pool reuses keep-alive clients per endpoint and tracks health
+    """
+
+    class PingEnd:
+        def on_get(self, req, rep):
+            rep.status = falcon.HTTP_200
+            rep.text = "pong"
+
+    app = falcon.App()
+    app.add_route("/ping", PingEnd())
+    server = http.Server(port=5955, app=app)
+    assert server.reopen()
+
+    def ping(leaser):
+        leaser.client.request(method="GET", path="/ping")
+        for i in range(100):
+            server.service()
+            leaser.recur(tyme=0.0)
+            if leaser.client.responses:
+                return leaser.client.respond()
+            time.sleep(0.01)
+        return None
+
+    key = ("127.0.0.1", 5955, "http")
+    clienter = httping.Clienter(size=1)
+    leaser = clienter.lease(hostname="127.0.0.1", port=5955)
+    assert leaser.key == key
+    assert leaser.client is None
+    leaser.enter()
+    client = leaser.client
+    assert client is not None
+    assert clienter.leases[key] == 1
+    assert clienter.acquire(key) is None  # at size limit
+    overflow = clienter.acquire(key, force=True)  # soft cap
+    assert overflow is not None and overflow is not client
+    assert clienter.leases[key] == 2
+    clienter.release(key, overflow)
+    assert clienter.leases[key] == 1
+    assert not clienter.idles[key]  # over limit so closed not pooled
+    held = clienter.lease(hostname="127.0.0.1", port=5955, held=True)
+    held.enter()
+    assert held.client is not None  # not counted against limit
+    assert clienter.leases[key] == 1
+    held.exit()
+    assert not clienter.idles[key]  # held clients are never pooled
+
+    rep = ping(leaser)
+    assert rep.status == 200
+    assert bytes(rep.body) == b"pong"
+    leaser.exit()
+    assert leaser.client is None
+    assert clienter.leases[key] == 0
+    assert len(clienter.idles[key]) == 1
+    assert clienter.healthy(hostname="127.0.0.1", port=5955)
+
+    leaser = clienter.lease(hostname="127.0.0.1", port=5955)
+    leaser.enter()
+    assert leaser.client is client  # same connection reused
+    rep = ping(leaser)
+    assert rep.status == 200
+    leaser.exit()
+    assert len(clienter.idles[key]) == 1
+
+    clienter.idle = 0.0
+    clienter.evict()
+    assert len(clienter.idles[key]) == 0
+    assert client.connector.cs is None  # closed
+
+    # overflow and eviction follow tyme of the Doist not wall clock time
+    tymist = tyming.Tymist(tock=0.5)
+    clienter = httping.Clienter(size=1, wait=1.0, idle=1.0)
+    leaser = clienter.lease(hostname="127.0.0.1", port=5955)
+    leaser.wind(tymist.tymen())
+    assert clienter.tymth is not None  # wound by first lease
+    leaser.enter()
+    waiter = clienter.lease(hostname="127.0.0.1", port=5955)
+    waiter.wind(tymist.tymen())
+    waiter.enter()
+    assert waiter.client is None  # at size limit
+    assert waiter.asked == 0.0
+    time.sleep(0.01)
+    tymist.tick()
+    waiter.recur(tyme=tymist.tyme)
+    assert waiter.client is None  # still waiting
+    tymist.tick()
+    waiter.recur(tyme=tymist.tyme)
+    assert waiter.client is not None  # overflow after waiting .wait of tyme
+    waiter.exit()
+
+    rep = ping(leaser)
+    assert rep.status == 200
+    leaser.exit()
+    assert len(clienter.idles[key]) == 1
+    time.sleep(0.01)
+    clienter.evict()
+    assert len(clienter.idles[key]) == 1  # no tyme passed
+    tymist.tick()
+    tymist.tick()
+    clienter.evict()
+    assert len(clienter.idles[key]) == 0
+
+    # nothing listening so each abandoned request is a fault
+    clienter = httping.Clienter(faults=2)
+    for i in range(2):
+        assert clienter.healthy(hostname="127.0.0.1", port=5956)
+        leaser = clienter.lease(hostname="127.0.0.1", port=5956)
+        leaser.enter()
+        leaser.client.request(method="GET", path="/ping")
+        for j in range(3):
+            leaser.recur(tyme=0.0)
+        leaser.exit()
+    assert not clienter.healthy(hostname="127.0.0.1", port=5956)
+    assert len(clienter.idles[("127.0.0.1", 5956, "http")]) == 0
+
+    clienter.close()
+    server.close()
+
+    hby = habbing.Habery(name="test", temp=True)
+    hab = hby.makeHab(name="test")
+    assert hab.clienter is hby.clienter
+    hby.close()
+
+
 if __name__ == '__main__':
     test_parse_cesr_request()
@@ -1,10 +1,43 @@
 # -*- encoding: utf-8 -*-
 """
-tests.app.apping module
+tests.app.indirecting module
 
 """
+import falcon
+from falcon import testing
+
+from keri.app import habbing, httping, indirecting
+
+
 def test_dummy():
     assert True
 
+
+def test_http_message_handler_stream():
+    with habbing.openHab(name="wit", transferable=False, temp=True) as wit, \
+            habbing.openHab(name="test", transferable=True, temp=True) as hab:
+        app = falcon.App()
+        handler = indirecting.HttpMessageHandler(hab=wit, rep=None, app=app)
+        client = testing.TestClient(app)
+
+        icp = hab.makeOwnEvent(sn=0)
+        ixn = hab.interact()
+        body = bytes(icp) + bytes(ixn)
+
+        rep = client.simulate_post(path=httping.CESR_STREAM_PATH, body=body,
+                                   headers={"Content-Type": httping.CESR_CONTENT_TYPE})
+        assert rep.status == falcon.HTTP_406
+        assert not handler.rxbs
+
+        rep = client.simulate_post(path=httping.CESR_STREAM_PATH, body=body,
+                                   headers={"Content-Type": httping.CESR_STREAM_CONTENT_TYPE})
+        assert rep.status == falcon.HTTP_202
+        assert handler.rxbs == body
+
+        handler.parser.parse(ims=handler.rxbs, kvy=handler.kevery)
+        assert hab.pre in wit.kevers
+        assert wit.kevers[hab.pre].sn == 1
+
+
 if __name__ == '__main__':
     pass
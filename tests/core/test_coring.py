@@ -20,7 +20,8 @@ from fractions import Fraction
 
 from keri.kering import Version, Versionage
 from keri.kering import (EmptyMaterialError, RawMaterialError, DerivationError,
-                         ShortageError, InvalidCodeSizeError)
+                         ShortageError, InvalidCodeSizeError, VersionError,
+                         DeserializationError)
 
 from keri.help import helping
 
@@ -28,7 +29,7 @@ from keri.core import coring
 from keri.core.coring import Ilkage, Ilks, Ids, Idents, Sadder
 from keri.core.coring import (Sizage, MtrDex, Matter,
                               IdrDex, Indexer, CtrDex, Counter, sniff)
-from keri.core.coring import (Verfer, Cigar, Signer, Salter, Saider, DigDex,
+from keri.core.coring import (Verfer, Vercache, Cigar, Signer, Salter, Saider, DigDex,
                               Diger, Nexter, Prefixer, Cipher, Encrypter, Decrypter)
 from keri.core.coring import generateSigners, generateSecrets
 from keri.core.coring import (intToB64, intToB64b, b64ToInt, b64ToB2, b2ToB64,
@@ -36,7 +37,7 @@ from keri.core.coring import (intToB64, intToB64b, b64ToInt, b64ToB2, b2ToB64,
 from keri.core.coring import Seqner, Siger, Dater, Texter
 from keri.core.coring import Serialage, Serials, Vstrings
 from keri.core.coring import Versify, Deversify, Rever, VERFULLSIZE, MINSNIFFSIZE
-from keri.core.coring import Serder, Tholder
+from keri.core.coring import Serder, Tholder, Tallier
 
 from keri.core import eventing
 
@@ -1336,6 +1337,15 @@ def test_matter():
     assert matter.transferable == True
     assert matter.digestive == False
 
+    # encodings are memoized on first access and shared afterwards
+    matter = Matter(qb2=qb2)
+    assert matter._qb64b is None and matter._qb64 is None and matter._qb2 is None
+    assert matter.qb64b is matter.qb64b
+    assert matter.qb64 is matter.qb64
+    assert matter.qb2 is matter.qb2
+    assert (matter.qb64b, matter.qb64, matter.qb2) == (qb64b, qb64, qb2)
+    assert Matter._qb64b is None  # class default untouched
+
     """ Done Test """
 
 
@@ -1627,6 +1637,15 @@ def test_indexer():
     assert indexer.qb64b == qsig64b
     assert indexer.qb2 == qsig2b
     assert ims == extra
+
+    # encodings are memoized on first access and shared afterwards
+    indexer = Indexer(qb64b=qsig64b)
+    assert indexer._qb64b is None and indexer._qb2 is None
+    assert indexer.qb64b is indexer.qb64b
+    assert indexer.qb64 is indexer.qb64
+    assert indexer.qb2 is indexer.qb2
+    assert (indexer.qb64b, indexer.qb64, indexer.qb2) == (qsig64b, qsig64, qsig2b)
+
     """ Done Test """
 
 
@@ -1967,6 +1986,14 @@ def test_counter():
     assert counter.qb2 == qscb2
     assert not ims
 
+    # encodings are memoized on first access and shared afterwards
+    counter = Counter(qb2=qscb2)
+    assert counter._qb64b is None and counter._qb2 is None
+    assert counter.qb64b is counter.qb64b
+    assert counter.qb64 is counter.qb64
+    assert counter.qb2 is counter.qb2
+    assert (counter.qb64b, counter.qb64, counter.qb2) == (qscb, qsc, qscb2)
+
     """ Done Test """
 
 
@@ -2421,6 +2448,60 @@ def test_verfer():
     """ Done Test """
 
 
+def test_vercache():
+    """
+    Test Vercache memo of successful verifications used by Verfer.verify
+    """
+    cache = Vercache(size=2)
+    assert cache.size == 2
+    assert cache.hits == cache.misses == len(cache) == 0
+    assert Vercache().size == Vercache.Size
+
+    seed = pysodium.randombytes(pysodium.crypto_sign_SEEDBYTES)
+    verkey, sigkey = pysodium.crypto_sign_seed_keypair(seed)
+    verfer = Verfer(raw=verkey, code=MtrDex.Ed25519)
+    sers = [b'abc', b'def', b'ghi']
+    sigs = [pysodium.crypto_sign_detached(ser, sigkey) for ser in sers]
+
+    original = Verfer.Cache
+    Verfer.Cache = cache
+    try:
+        assert verfer.verify(sigs[0], sers[0])  # miss then cached
+        assert (cache.hits, cache.misses, len(cache)) == (0, 1, 1)
+        assert verfer.verify(sigs[0], sers[0])  # hit
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+        assert not verfer.verify(sigs[0], sers[1])  # failures are not cached
+        assert not verfer.verify(sigs[0], sers[1])
+        assert (cache.hits, cache.misses, len(cache)) == (1, 3, 1)
+
+        # same key and sig but other code is a different entry
+        nverfer = Verfer(raw=verkey, code=MtrDex.Ed25519N)
+        assert nverfer.verify(sigs[0], sers[0])
+        assert (cache.hits, cache.misses, len(cache)) == (1, 4, 2)
+
+        # least recently used evicted when full
+        assert verfer.verify(sigs[0], sers[0])  # refresh so nverfer entry is lru
+        assert verfer.verify(sigs[2], sers[2])
+        assert len(cache) == 2
+        assert cache.get(cache.key(verfer, sigs[0], sers[0]))
+        assert not cache.get(cache.key(nverfer, sigs[0], sers[0]))
+
+        assert verfer.verify(sigs[1], sers[1], cached=False)  # bypass
+        assert not cache.get(cache.key(verfer, sigs[1], sers[1]))
+
+        cache.clear()
+        assert cache.hits == cache.misses == len(cache) == 0
+
+        Verfer.Cache = Vercache(size=0)  # disabled
+        assert verfer.verify(sigs[0], sers[0])
+        assert len(Verfer.Cache) == 0
+        assert Verfer.Cache.misses == 0
+    finally:
+        Verfer.Cache = original
+    """ Done Test """
+
+
 def test_cigar():
     """
     Test Cigar subclass of CryMat
@@ -3573,6 +3654,28 @@ def test_saider():
     assert saider.qb64 == said9
     assert saider.verify(sad10, prefixed=True)
 
+    # saidive returns serialization with said patched over dummy
+    for kind in Serials:
+        sad11 = dict(sad4)
+        sad11['v'] = Versify(version=Version, kind=kind, size=0)
+        saider, sad12, ser = Saider.saidive(sad=sad11)
+        assert saider.qb64 == Saider.saidify(sad=sad11)[0].qb64
+        assert saider.verify(sad12, prefixed=True)
+        serder = Sadder(ked=sad12)
+        assert ser == serder.raw
+        assert Sadder(raw=ser, ked=sad12).ked is sad12  # not deserialized again
+
+    # dummy chars elsewhere in sad so serialized again instead of patched
+    sad13 = dict(sad4)
+    sad13['v'] = Versify(version=Version, kind=Serials.json, size=0)
+    sad13['x'] = Saider.Dummy * Matter.Sizes[code].fs
+    saider, sad14, ser = Saider.saidive(sad=sad13)
+    assert ser == Sadder(ked=sad14).raw
+    assert sad14['x'] == Saider.Dummy * Matter.Sizes[code].fs
+
+    saider, sad15, ser = Saider.saidive(sad=dict(d="", a="b"))  # not versioned
+    assert ser == json.dumps(sad15, separators=(",", ":")).encode("utf-8")
+
     """Done Test"""
 
 
@@ -3817,6 +3920,12 @@ def test_serder():
     assert ident1 == Idents.keri
     assert kind1 == Serials.json
     assert size1 == 111
+
+    # only searches front of stream so later version strings are not found
+    with pytest.raises(VersionError):
+        sniff(bytearray(b'x' * MINSNIFFSIZE + e1s * 100))
+    ident1, kind1, vers1, size1 = sniff(bytearray(e1s * 100))
+    assert size1 == 111
     e1ss = e1s + b'extra attached at the end.'
     ked1, idnt1, knd1, vrs1, siz1 = serder._inhale(e1ss)
     assert ked1 == e1
@@ -4182,6 +4291,66 @@ def test_serder():
     with pytest.raises(ValueError):
         sn = srdr.sn
 
+    # test lazy deserialization of body and memoized derived properties
+    signers = generateSigners(salt=b'0123456789abcdef', count=2)
+    keys = [signer.verfer.qb64 for signer in signers]
+    serder = eventing.incept(keys=keys, sith="2", nxt=Nexter(keys=keys).qb64,
+                             code=MtrDex.Blake3_256)
+    srdr = Serder(raw=bytearray(serder.raw) + b'extra')
+    assert srdr._ked is None  # only version string parsed
+    assert srdr.size == serder.size
+    assert srdr.raw == serder.raw
+    assert srdr.kind == Serials.json
+    assert srdr._ked is None
+    assert srdr.said == serder.said  # leading fields do not deserialize body
+    assert srdr.pre == serder.pre
+    assert srdr.preb == serder.preb
+    assert srdr.sn == 0
+    assert srdr._ked is None
+    assert srdr.ked == serder.ked  # deserializes body
+
+    verfers = srdr.verfers
+    assert [verfer.qb64 for verfer in verfers] == keys
+    verfers.append(verfers[0])  # returned list is a copy
+    assert len(srdr.verfers) == 2
+    assert srdr.verfers[0] is verfers[0]  # primitives are shared
+    assert srdr.tholder is srdr.tholder
+    assert srdr.tholder.sith == "2"
+    assert srdr.sn == 0
+
+    clone = Serder(sad=Sadder(raw=serder.raw))
+    assert clone._ked is None
+    assert clone.ked == serder.ked
+
+    # other kinds read fields from deserialized body
+    cbrdr = Serder(raw=Serder(ked=dict(serder.ked), kind=Serials.cbor).raw)
+    assert cbrdr.pre == serder.pre
+    assert cbrdr._ked is not None
+
+    # later duplicate of leading field label is ambiguous so fails on body
+    def resize(raw):  # fix size in version string
+        vs = Versify(kind=Serials.json, size=len(raw)).encode("utf-8")
+        return raw.replace(serder.ked["v"].encode("utf-8"), vs, 1)
+
+    raw = resize(serder.raw[:-1] + b',"i":"' + b'E' * 43 + b'"}')
+    srdr = Serder(raw=raw)
+    assert srdr.pre == serder.pre
+    with pytest.raises(DeserializationError):
+        ked = srdr.ked
+
+    # duplicate within leading fields defers to body
+    raw = resize(serder.raw.replace(b'"s":"0"', b'"i":"' + b'E' * 43 + b'"', 1))
+    srdr = Serder(raw=raw)
+    assert srdr.pre == "E" * 43
+    assert srdr._ked is not None
+
+    # malformed body only fails once deserialized
+    raw = serder.raw.replace(b'"t":"icp"', b'"t":"icp" ')
+    raw = raw[:-1]  # keep size consistent with version string
+    srdr = Serder(raw=raw)
+    with pytest.raises(DeserializationError):
+        ked = srdr.ked
+
     """Done Test """
 
 
@@ -4310,6 +4479,38 @@ def test_tholder():
     assert not tholder.satisfy(indices=[5, 6])
     assert not tholder.satisfy(indices=[2, 3, 4])
     assert not tholder.satisfy(indices=[])
+    assert not tholder.satisfy(indices=[0, 1, 5, 7])  # index beyond keys
+    assert tholder.clauses == [((2, 2, 1, 1, 1), 4), ((1, 1), 1)]
+    assert tholder.keyed == ((0, 2), (0, 2), (0, 1), (0, 1), (0, 1), (1, 1), (1, 1))
+
+    # incremental satisfaction accumulator
+    tallier = tholder.tally()
+    assert isinstance(tallier, Tallier)
+    assert not tallier.satisfied
+    assert not tallier.add(2)
+    assert not tallier.add(3)
+    assert not tallier.add(3)  # duplicate ignored
+    assert not tallier.add(5)  # second clause met
+    assert tallier.add(0)  # first clause met
+    assert tallier.add(6)
+    assert tallier.indices == {0, 2, 3, 5, 6}
+    assert tholder.tally([0, 1, 6]).satisfied
+    assert not tholder.tally([0, 1, 6, 9]).satisfied
+
+    tholder = Tholder(sith=["1/3", "1/3", "1/3", "1/2", "1/2"])
+    assert tholder.clauses == [((2, 2, 2, 3, 3), 6)]
+    assert tholder.satisfy(indices=[0, 1, 2])
+    assert tholder.satisfy(indices=[3, 4])
+    assert tholder.satisfy(indices=[0, 1, 3])
+    assert not tholder.satisfy(indices=[0, 3])
+
+    tholder = Tholder(sith="3")
+    assert tholder.clauses == []
+    tallier = tholder.tally([0, 1])
+    assert not tallier.satisfied
+    assert not tallier.add(1)
+    assert tallier.add(2)
+    assert not Tholder(sith=0).tally([0]).satisfied
 
     """ Done Test """
 
@@ -177,6 +177,7 @@ def test_partial_signed_escrow():
         assert len(sigs) == 2
 
         # Process partials but stale escrow  despite two sigs set Timeout to 0
+        assert srdr.said in kvy.tallies  # tally kept while escrowed
         kvy.TimeoutPSE = 0  # forces all escrows to be stale
         time.sleep(0.001)
         kvy.processEscrowPartialSigs()
@@ -184,6 +185,7 @@ def test_partial_signed_escrow():
         # escrows now empty
         escrows = kvy.db.getPses(dbing.snKey(pre, int(srdr.ked["s"], 16)))
         assert len(escrows) == 0
+        assert not kvy.tallies  # stale escrow removal drops its tally
 
         # Now reset timeout so not zero
         kvy.TimeoutPSE = 3600
@@ -1425,6 +1427,110 @@ def test_unverified_trans_receipt_escrow():
     """End Test"""
 
 
+def test_escrow_wakes():
+    """
+    Test event driven escrow processing with wakes and waits
+    """
+    signers = coring.generateSigners(salt=b'0123456789abcdef', count=4)
+
+    def kel(icpr, nxtr):
+        """ Returns (pre, icpmsg, ixnmsg) for signer icpr with next signer nxtr """
+        msgs = []
+        srdr = eventing.incept(keys=[icpr.verfer.qb64],
+                               nxt=coring.Nexter(keys=[nxtr.verfer.qb64]).qb64)
+        pre = srdr.pre
+        for srdr in (srdr, eventing.interact(pre=pre, dig=srdr.said, sn=1)):
+            msg = bytearray(srdr.raw)
+            msg.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs).qb64b)
+            msg.extend(icpr.sign(srdr.raw, index=0).qb64b)
+            msgs.append(msg)
+        return (pre, msgs[0], msgs[1])
+
+    apre, aicp, aixn = kel(signers[0], signers[1])
+    bpre, bicp, bixn = kel(signers[2], signers[3])
+
+    with basing.openDB(name="wakes") as db:
+        kvy = eventing.Kevery(db=db, sweep=3600.0)
+        assert kvy.sweep == 3600.0
+        assert kvy.swept is None
+        assert not kvy.escrowing
+        psr = parsing.Parser(kvy=kvy)
+
+        processed = []  # prefixes of events processed from escrow
+        processEvent = kvy.processEvent
+
+        def spy(serder, *args, **kwa):
+            if kvy.escrowing:
+                processed.append(serder.pre)
+            return processEvent(serder, *args, **kwa)
+
+        kvy.processEvent = spy
+
+        kvy.processEscrows()  # first pass is full sweep
+        assert kvy.swept is not None
+
+        psr.parse(ims=bytearray(aixn))  # out of order so escrowed
+        psr.parse(ims=bytearray(bixn))
+        assert len(db.getOoes(dbing.snKey(apre, 1))) == 1
+        assert len(db.getOoes(dbing.snKey(bpre, 1))) == 1
+        assert list(db.wakes) == [apre, bpre]  # arrivals wake
+
+        kvy.processEscrows()  # only woken prefixes
+        assert processed == [apre, bpre]
+        assert not db.wakes  # reprocessing does not rewake
+
+        processed.clear()
+        kvy.processEscrows()  # idle so no escrow is processed
+        assert processed == []
+
+        psr.parse(ims=bytearray(aicp))  # accepted so wakes apre only
+        assert apre in kvy.kevers
+        assert list(db.wakes) == [apre]
+        kvy.processEscrows()
+        assert processed == [apre]
+        assert kvy.kevers[apre].sn == 1
+        assert not db.getOoes(dbing.snKey(apre, 1))
+        assert len(db.getOoes(dbing.snKey(bpre, 1))) == 1
+
+        # dependency wakes waiter
+        kvy.wait(dep=apre, pre=bpre, item=b"item")
+        assert db.waits == {apre: {b"item": bpre}}
+        assert db.waited == {b"item": eventing.oset([apre])}
+        db.wakes.clear()
+        kvy.wake(apre)
+        assert list(db.wakes) == [apre, bpre]
+        assert not db.waits
+        kvy.unwait(item=b"item")  # woken item removed from escrow
+        assert not db.waited
+
+        # removal of escrowed item prunes its waits
+        kvy.wait(dep=apre, pre=bpre, item=b"item")
+        kvy.wait(dep=bpre, pre=bpre, item=b"item")
+        kvy.wait(dep=apre, pre=bpre, item=b"other")
+        kvy.unwait(item=b"item")
+        assert db.waits == {apre: {b"other": bpre}}
+        assert db.waited == {b"other": eventing.oset([apre])}
+        kvy.unwait(item=b"other")
+        assert not db.waits
+        assert not db.waited
+
+        # full sweep processes all escrows regardless of wakes
+        db.wakes.clear()
+        processed.clear()
+        kvy.swept -= kvy.sweep
+        kvy.processEscrows()
+        assert processed == [bpre]
+
+        # polling mode processes all escrows every pass
+        kvy.sweep = None
+        processed.clear()
+        kvy.processEscrows()
+        kvy.processEscrows()
+        assert processed == [bpre, bpre]
+
+    """ Done Test """
+
+
 if __name__ == "__main__":
     test_out_of_order_escrow()
 
@@ -17,7 +17,7 @@ from keri.core.coring import Ilks
 from keri.core.coring import MtrDex, Matter, IdrDex, Indexer, CtrDex, Counter
 from keri.core.coring import Salter, Serder, Siger, Cigar
 from keri.core.coring import Seqner, Verfer, Signer, Nexter, Prefixer
-from keri.core.eventing import Kever, Kevery
+from keri.core.eventing import Kever, Kevery, Verexer, verifySigs
 from keri.core.eventing import (SealDigest, SealRoot, SealBacker,
                                 SealEvent, SealLast, SealLocation,
                                 StateEvent, StateEstEvent)
@@ -4228,6 +4228,169 @@ def test_reload_kever(mockHelpingNowUTC):
     """End Test"""
 
 
+def test_verexer():
+    """
+    Test Verexer parallel signature verification executor
+    """
+    signers = coring.generateSigners(salt=b'0123456789abcdef', count=12)
+    keys = [signer.verfer.qb64 for signer in signers]
+    serder = incept(keys=keys, sith="7", nxt=Nexter(keys=keys).qb64,
+                    code=MtrDex.Blake3_256)
+    sigers = [signer.sign(serder.raw, index=i) for i, signer in enumerate(signers)]
+    bad = signers[3].sign(b"bad", index=3)  # sig on wrong serialization
+    verfers = serder.verfers
+
+    # inline reference result
+    vsigers, vindices = verifySigs(serder=serder, sigers=sigers + [bad], verfers=verfers)
+    assert vindices == list(range(12))
+
+    with Verexer(workers=4, chunk=2) as vex:
+        assert vex.workers == 4
+        assert vex.chunk == 2
+        assert not vex.process
+        assert vex.verify([]) == []
+        results = vex.verify([(verfers[siger.index], siger.raw, serder.raw)
+                              for siger in sigers + [bad]])
+        assert results == [True] * 12 + [False]
+
+        psigers, pindices = verifySigs(serder=serder, sigers=sigers + [bad],
+                                       verfers=verfers, vex=vex)
+        assert pindices == vindices
+        assert [siger.qb64 for siger in psigers] == [siger.qb64 for siger in vsigers]
+
+        # opt in per Kevery and shared with its kevers
+        with openDB(name="vexer") as db:
+            kvy = Kevery(db=db, vex=vex)
+            msg = bytearray(serder.raw)
+            msg.extend(Counter(CtrDex.ControllerIdxSigs, count=len(sigers)).qb64b)
+            for siger in sigers:
+                msg.extend(siger.qb64b)
+            parsing.Parser().parse(ims=msg, kvy=kvy)
+            assert serder.pre in kvy.kevers
+            assert kvy.kevers[serder.pre].vex is vex
+            assert len(db.getSigs(dgKey(serder.pre, serder.said))) == 12
+
+    with Verexer(workers=2, process=True) as vex:
+        assert vex.process
+        results = vex.verify([(verfers[siger.index], siger.raw, serder.raw)
+                              for siger in sigers[:4] + [bad]])
+        assert results == [True] * 4 + [False]
+
+    """End Test"""
+
+
+def test_escrow_tallies(monkeypatch):
+    """
+    Test partially signed escrow keeps a Tallier per escrowed event so each pass
+    only tallies newly attached signatures
+    """
+    monkeypatch.setattr(Verfer, "Cache", coring.Vercache())
+
+    signers = coring.generateSigners(salt=b'0123456789abcdef', count=6)
+    keys = [signer.verfer.qb64 for signer in signers]
+    serder = incept(keys=keys, sith="6", nxt=Nexter(keys=keys).qb64,
+                    code=MtrDex.Blake3_256)
+    sigers = [signer.sign(serder.raw, index=i) for i, signer in enumerate(signers)]
+
+    with openDB(name="tallies") as db:
+        kvy = Kevery(db=db)
+        for i, siger in enumerate(sigers):
+            msg = bytearray(serder.raw)
+            msg.extend(Counter(CtrDex.ControllerIdxSigs, count=1).qb64b)
+            msg.extend(siger.qb64b)
+            parsing.Parser().parse(ims=msg, kvy=kvy)
+            if i < len(sigers) - 1:  # new arrival only tallies its own sigs
+                assert serder.pre not in kvy.kevers
+                tallier = kvy.tallies[serder.said]
+                assert tallier.indices == {i}
+            kvy.processEscrowPartialSigs()
+            if i < len(sigers) - 1:  # still escrowed
+                assert serder.pre not in kvy.kevers
+                assert kvy.tallies[serder.said] is tallier  # escrow pass extends tally
+                assert tallier.indices == set(range(i + 1))
+                assert tallier.keys == keys
+
+        assert serder.pre in kvy.kevers
+        assert kvy.kevers[serder.pre].tallies is kvy.tallies
+        assert len(db.getSigs(dgKey(serder.pre, serder.said))) == 6
+        assert Verfer.Cache.misses == 6  # each signature verified once
+        assert serder.said not in kvy.tallies  # accepted so removed
+
+    # tally is not reused for other keys or threshold
+    kever = Kever.__new__(Kever)
+    kever.tallies = dict()
+    tholder = coring.Tholder(sith="6")
+    tallier = kever.tally(serder=serder, verfers=serder.verfers, tholder=tholder,
+                          indices=[0, 1])
+    tallier.extend([0, 1])
+    kever.tallies[serder.said] = tallier
+    assert kever.tally(serder=serder, verfers=serder.verfers, tholder=tholder,
+                       indices=[0, 1, 2]) is tallier
+    assert kever.tally(serder=serder, verfers=serder.verfers[::-1], tholder=tholder,
+                       indices=[0, 1, 2]) is not tallier
+    assert kever.tally(serder=serder, verfers=serder.verfers,
+                       tholder=coring.Tholder(sith="5"), indices=[0, 1, 2]) is not tallier
+    # nor when presented sigs lack tallied ones so acceptance needs presented sigs
+    assert kever.tally(serder=serder, verfers=serder.verfers, tholder=tholder,
+                       indices=[2]) is not tallier
+
+    """End Test"""
+
+
+def test_log_event_map_grow():
+    """
+    Test events logged inside a transaction still accepted when the map fills
+    """
+    with habbing.openHab(name="big") as hab, basing.openDB(name="tiny", mapSize=1 << 20) as db:
+        msgs = bytearray(hab.makeOwnEvent(sn=0))
+        for i in range(100):
+            msgs.extend(hab.interact(data=[dict(i=i, x="x" * 8000)]))
+
+        kvy = Kevery(db=db, lax=True, local=False)
+        parsing.Parser().parse(ims=msgs, kvy=kvy)
+        assert db.mapSize > 1 << 20  # grew
+        assert kvy.kevers[hab.pre].sn == 100  # none dropped
+        assert not list(db.getOoeItemsNextIter())  # none escrowed
+
+
+def test_log_event_state_atomic(monkeypatch):
+    """
+    Test event logs and saved key state commit in one transaction
+    """
+    with habbing.openHab(name="own") as hab, basing.openDB(name="other") as db:
+        icp = hab.makeOwnEvent(sn=0)
+        kvy = Kevery(db=db, lax=True, local=False)
+
+        def pin(*pa, **kwa):
+            raise ValueError("state write failed")
+
+        monkeypatch.setattr(db.states, "pin", pin)
+        parsing.Parser().parse(ims=bytearray(icp), kvy=kvy)
+        assert hab.pre not in kvy.kevers
+        assert db.getKeLast(snKey(hab.pre, 0)) is None  # logs rolled back too
+        assert db.states.get(keys=hab.pre) is None
+
+        monkeypatch.undo()
+        parsing.Parser().parse(ims=bytearray(icp), kvy=kvy)
+        assert kvy.kevers[hab.pre].sn == 0
+        assert db.getKeLast(snKey(hab.pre, 0)) is not None
+        assert db.states.get(keys=hab.pre).ked["d"] == hab.kever.serder.said
+
+        kever = kvy.kevers[hab.pre]
+        ixn = hab.interact()
+        monkeypatch.setattr(db.states, "pin", pin)
+        parsing.Parser().parse(ims=bytearray(ixn), kvy=kvy)
+        assert kever.sn == 0  # in memory state untouched by aborted update
+        assert kever.serder.said == db.states.get(keys=hab.pre).ked["d"]
+        assert db.getKeLast(snKey(hab.pre, 1)) is None
+
+        monkeypatch.undo()
+        parsing.Parser().parse(ims=bytearray(ixn), kvy=kvy)
+        assert kever.sn == 1
+        assert kever.serder.said == hab.kever.serder.said
+        assert db.states.get(keys=hab.pre).ked["d"] == kever.serder.said
+
+
 if __name__ == "__main__":
     # pytest.main(['-vv', 'test_eventing.py::test_keyeventfuncs'])
     test_messagize()
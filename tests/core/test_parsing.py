@@ -9,8 +9,9 @@ import pytest
 
 from keri.kering import ValidationError
 from keri.core import parsing
-from keri.core.coring import (CtrDex, Counter, Signer, Nexter)
-from keri.core.eventing import (Kever, Kevery, incept, rotate, interact)
+from keri.core.coring import (CtrDex, Counter, Signer, Nexter, Verfer, Vercache)
+from keri.core.eventing import (Kever, Kevery, Verexer, incept, rotate, interact)
+from keri.app import habbing
 from keri.db.basing import openDB
 
 from keri import help
@@ -254,5 +255,88 @@ def test_parser():
     """ Done Test """
 
 
+def test_parser_pipeline():
+    """
+    Test Parser pipeline mode processes pipelined attachment groups
+    """
+    with habbing.openHby(name="pipe", base="test") as hby, \
+            openDB(name="pipeval") as valDB:
+        hab = hby.makeHab(name="pipe", isith='1', icount=1)
+        for i in range(3):
+            hab.interact()
+
+        msgs = bytearray()
+        for msg in hby.db.clonePreIter(pre=hab.pre):
+            msgs.extend(msg)
+
+        # cloned messages use pipelined attachment groups
+        assert CtrDex.AttachedMaterialQuadlets.encode() in msgs
+
+        kevery = Kevery(db=valDB, lax=True, local=False)
+        parser = parsing.Parser(kvy=kevery, pipeline=True)
+        parser.parse(ims=bytearray(msgs))
+        assert parser.ims == bytearray(b'')
+        assert hab.pre in kevery.kevers
+        assert kevery.kevers[hab.pre].sn == 3
+        assert kevery.kevers[hab.pre].serder.said == hab.kever.serder.said
+
+        # pipelined frame truncated inside its group is flushed as a unit
+        ims = bytearray(msgs)
+        idx = ims.index(CtrDex.AttachedMaterialQuadlets.encode())  # first group
+        ctr = Counter(qb64b=ims[idx:])
+        ims[idx:idx + len(ctr.qb64b)] = Counter(code=CtrDex.AttachedMaterialQuadlets,
+                                                count=ctr.count - 1).qb64b
+        with openDB(name="pipebad") as badDB:
+            kevery = Kevery(db=badDB, lax=True, local=False)
+            parser = parsing.Parser(kvy=kevery, pipeline=True)
+            parser.parse(ims=ims)
+            assert hab.pre not in kevery.kevers
+
+    """ Done Test """
+
+
+def test_parser_pipeline_batch():
+    """
+    Test Parser pipeline mode verifies batches of messages together on Verexer
+    """
+    cache = Verfer.Cache
+    with habbing.openHby(name="pipe", base="test") as hby, \
+            openDB(name="pipeval") as valDB, Verexer(workers=2) as vex:
+        hab = hby.makeHab(name="pipe", isith='1', icount=1)
+        msgs = bytearray(hab.makeOwnEvent(sn=0))
+        for i in range(20):
+            msgs.extend(hab.interact())
+
+        try:
+            Verfer.Cache = Vercache()  # fresh stats
+            kevery = Kevery(db=valDB, lax=True, local=False, vex=vex)
+            parser = parsing.Parser(kvy=kevery, pipeline=True, depth=8)
+            assert parser.depth == 8
+            parser.parse(ims=bytearray(msgs))
+            assert kevery.kevers[hab.pre].sn == 20
+            # ixn of later batches preverified together so found in cache
+            assert Verfer.Cache.hits == 13
+
+        finally:
+            Verfer.Cache = cache
+
+        # messages already received are dispatched before waiting for rest
+        with openDB(name="pipepart") as partDB:
+            kevery = Kevery(db=partDB, lax=True, local=False)
+            parser = parsing.Parser(kvy=kevery, pipeline=True)
+            ims = bytearray(msgs[:-10])  # last message is partial
+            parsator = parser.parsator(ims=ims)
+            next(parsator)
+            assert kevery.kevers[hab.pre].sn == 19
+            ims.extend(msgs[-10:])
+            while ims:
+                next(parsator)
+            assert kevery.kevers[hab.pre].sn == 20
+
+    """ Done Test """
+
+
 if __name__ == "__main__":
     test_parser()
+    test_parser_pipeline()
+    test_parser_pipeline_batch()
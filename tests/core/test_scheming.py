@@ -201,8 +201,55 @@ def test_resolution():
     v = schemer.verify(badload)
     assert v is False
 
+    # ref parsed once and memoized by uri
+    assert "did:keri:EQtF_DhWj-uCPTsq4BONO0yR0PWLpUITkSqHoW0JjndZ" in cache.schemers
+    assert cache.schemer("did:keri:EQtF_DhWj-uCPTsq4BONO0yR0PWLpUITkSqHoW0JjndZ").sed["properties"]["z"] == \
+           {"type": "number"}
+    assert cache.schemer("did:keri:unknown") is None
+
+
+def test_validator_registry():
+    scer = (
+        b'{"$id": "ExG9LuUbFzV4OV5cGS9IeQWzy9SuyVFyVrpRc4l1xzPA", "$schema": '
+        b'"http://json-schema.org/draft-07/schema#", "type": "object", "properties": {"a": {"type": "string"}, '
+        b'"b": {"type": "number"}, "c": {"type": "string", "format": "date-time"}}}')
+
+    said = "ExG9LuUbFzV4OV5cGS9IeQWzy9SuyVFyVrpRc4l1xzPA"
+    cache = CacheResolver()
+    cache.add(said, scer)
+    schemer = cache.schemer(said)
+    assert schemer.said == said
+    assert cache.schemer(said) is schemer  # memoized
+    schemer.typ = JSONSchema(resolver=cache)
+
+    assert cache.validators == {}
+    assert schemer.verify(b'{"a": "test", "b": 123}') is True
+    validator = cache.validators[said]
+    assert schemer.verify(b'{"a": "test", "b": "123"}') is False
+    assert cache.validators[said] is validator  # compiled once
+    assert schemer.typ.validator(schemer.sed, said=said) is validator
+
+    # batch validation of deserialized sads against one compiled validator
+    sads = [dict(a="test", b=123), dict(a="test", b="123"), dict(a=1), dict()]
+    assert schemer.verify_sads(sads) == [True, False, False, True]
+    assert schemer.verify_sads(iter([])) == []
+    assert cache.validators[said] is validator
+
+    # no said means no registry entry
+    typ = JSONSchema(resolver=CacheResolver())
+    assert typ.verify_json(schema=schemer.sed, raw=b'{"a": "test"}') is True
+    assert typ.resolver.validators == {}
+
+    # invalid schema fails every sad
+    assert typ.verify_sads(schema=dict(type="foo"), sads=[dict(), dict()]) == [False, False]
+
+    # replacing a cached raw schema drops its parsed schemer
+    cache.add(said, scer)
+    assert said not in cache.schemers
+
 
 if __name__ == '__main__':
     test_json_schema()
     test_json_schema_dict()
     test_resolution()
+    test_validator_registry()
@@ -389,6 +389,24 @@ def test_baser():
         assert db.delWigs(key) == True
         assert db.getWigs(key) == []
 
+        # each watcher of key notes added wigs in its own set
+        first = db.watchWigs(key)
+        second = db.watchWigs(key)
+        assert db.putWigs(key, vals=[sig0b]) == True
+        assert list(first) == list(second) == [sig0b]
+        first.clear()  # one watcher consuming notes does not eat the other's
+        assert db.addWig(key, sig1b) == True
+        assert list(first) == [sig1b]
+        assert list(second) == [sig0b, sig1b]
+        db.unwatchWigs(key, first)
+        assert db.wigged  # still watched by second
+        assert db.delWigs(key) == True
+        assert db.putWigs(key, vals=[sig0b]) == True
+        assert list(first) == [sig1b]
+        db.unwatchWigs(key, second)
+        assert not db.wigged
+        assert db.delWigs(key) == True
+
         # test .rcts sub db methods dgkey
         assert db.getRcts(key) == []
         assert db.cntRcts(key) == 0
@@ -1723,7 +1741,7 @@ def test_clean_baser():
         state = natHab.db.states.get(keys=natHab.pre)  # Serder instance
         assert state.sn == 6
         assert state.ked["f"] == '6'
-        assert natHab.db.env.stat()['entries'] == 43
+        assert natHab.db.env.stat()['entries'] == 45
 
         # test reopenDB with reuse  (because temp)
         with basing.reopenDB(db=natHab.db, reuse=True):
@@ -1732,7 +1750,7 @@ def test_clean_baser():
             assert ldig == natHab.kever.serder.saidb
             serder = coring.Serder(raw=bytes(natHab.db.getEvt(dbing.dgKey(natHab.pre,ldig))))
             assert serder.said == natHab.kever.serder.said
-            assert natHab.db.env.stat()['entries'] == 43
+            assert natHab.db.env.stat()['entries'] == 45
 
             # verify name pre kom in db
             data = natHab.db.habs.get(keys=natHab.name)
@@ -1982,6 +2000,78 @@ def test_usebaser():
     """ End Test """
 
 
+def test_ests():
+    """
+    Test .ests index of establishment events and its backfill
+    """
+    with habbing.openHby(name="ests", base="test") as hby:
+        hab = hby.makeHab(name="ests", isith="1", icount=1)
+        for _ in range(3):
+            hab.interact()
+        hab.rotate()  # sn 4
+        for _ in range(2):
+            hab.interact()  # sn 5, 6
+
+        db = hby.db
+        sn, dig = db.getEstLast(hab.pre, 3)
+        assert sn == 0
+        assert bytes(db.getKeLast(snKey(hab.pre, 0))) == bytes(dig)
+        sn, dig = db.getEstLast(hab.pre, 6)
+        assert sn == 4
+        assert bytes(dig) == hab.kever.lastEst.d.encode("utf-8")
+        assert db.getEstLast(hab.pre, 4)[0] == 4
+        assert db.getEstLast("EnotInDatabase", 4) is None
+
+        kvy = eventing.Kevery(db=db, lax=True)
+        assert kvy.fetchEstEvent(hab.pre, 5).said == hab.kever.lastEst.d
+        assert kvy.fetchEstEvent(hab.pre, 2).sn == 0
+        assert kvy.fetchEstEvent(hab.pre, 7) is None  # not yet in KEL
+
+        # existing database without index is backfilled
+        for sn in (0, 4):
+            assert db.delEst(snKey(hab.pre, sn))
+        assert db.getEstLast(hab.pre, 6) is None
+        assert kvy.fetchEstEvent(hab.pre, 6).sn == 4  # falls back to walking back
+        assert db.reindexEsts() == 2
+        assert db.getEstLast(hab.pre, 6)[0] == 4
+        assert db.reindexEsts() == 2  # idempotent
+
+    """ End Test """
+
+
+def test_anchors():
+    """
+    Test .achs index of anchored event seals and findAnchoringEvent
+    """
+    with habbing.openHby(name="anchors", base="test") as hby:
+        hab = hby.makeHab(name="anchors", isith="1", icount=1)
+        pre = "EABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789abcdefg"
+        seal0 = eventing.SealEvent(i=pre, s="a", d="EsaidOfTheTenthEvent")._asdict()
+        seal1 = eventing.SealEvent(i=pre, s="b", d="EsaidOfTheEleventhEvent")._asdict()
+        hab.interact(data=[dict(x="not a seal"), seal0, seal1])  # sn 1
+        hab.interact()  # sn 2
+
+        db = hby.db
+        srdr = db.findAnchoringEvent(pre=hab.pre, anchor=seal1)
+        assert srdr.sn == 1
+        assert srdr.said == bytes(db.getKeLast(snKey(hab.pre, 1))).decode("utf-8")
+        assert db.findAnchoringEvent(pre=hab.pre, anchor=dict(i=pre, s=10, d=seal0["d"])).sn == 1
+        assert db.findAnchoringEvent(pre=pre, anchor=seal0) is None  # other KEL
+        assert db.findAnchoringEvent(pre=hab.pre, anchor=dict(i=pre, s="c", d=seal0["d"])) is None
+        assert db.findAnchoringEvent(pre=hab.pre, anchor=dict(x="not a seal")) is None
+
+        [(prefixer, seqner, saider)] = list(db.getAnchorsIter(seal0))
+        assert (prefixer.qb64, seqner.sn, saider.qb64) == (hab.pre, 1, srdr.said)
+
+        # backfill existing database
+        db.achs.trim()
+        assert db.findAnchoringEvent(pre=hab.pre, anchor=seal0) is None
+        assert db.reindexAnchors() == 1
+        assert db.findAnchoringEvent(pre=hab.pre, anchor=seal0).sn == 1
+
+    """ End Test """
+
+
 def test_dbdict():
     """
     Test custom dbdict subclass of dict
@@ -2067,6 +2157,41 @@ def test_dbdict():
         del dbd[pre]
         assert pre not in dbd  # not in memory or db so read through cache misses
 
+        # bounded LRU with pinning of local prefixes
+        dbd.clear()
+        dbd.capacity = 2
+        dbd.hits = dbd.misses = dbd.evictions = 0
+        db.prefixes.add('a')  # pinned
+        dbd['a'] = 1
+        dbd['b'] = 2
+        dbd['c'] = 3  # evicts b as least recently used unpinned
+        assert set(dict.keys(dbd)) == {'a', 'c'}
+        assert dbd.evictions == 1
+        assert dbd['c'] == 3  # hit
+        dbd['d'] = 4  # a pinned so evicts c
+        assert 'a' in dbd
+        assert 'c' not in dbd  # miss
+        assert set(dict.keys(dbd)) == {'a', 'd'}
+        assert dbd.evictions == 2
+        assert dbd.hits == 1
+        assert dbd.misses == 1
+        db.prefixes.remove('a')
+
+        # evicted kever reloads from key state written back on eviction
+        dbd.clear()
+        dbd.capacity = 1
+        dbd[pre] = kever
+        assert db.states.get(keys=pre) is None
+        dbd['x'] = 5  # evicts kever and writes back its key state
+        assert db.states.get(keys=pre).ked == state.ked
+        assert pre in dbd  # reloaded from state
+        assert dbd[pre] is not kever
+        assert dbd[pre].state().ked == state.ked
+        assert 'x' not in dict.keys(dbd)
+
+        with basing.openDB(name="cap", keverCapacity=3) as cdb:
+            assert cdb.kevers.capacity == 3
+
 
     assert not os.path.exists(db.path)
 
@@ -279,6 +279,13 @@ def test_lmdber():
                                                         (b'a', b'2', b'wee'),
                                                         (b'b', b'1', b'woo')]
 
+        # resume within branch from start
+        items = [(key, bytes(val)) for key, val in dber.getTopItemIter(db=db, key=b"a.", start=b"a.2")]
+        assert items == [(b'a.2', b'wee')]
+        items = [(key, bytes(val)) for key, val in dber.getTopItemIter(db=db, key=b"b.", start=b"a.2")]
+        assert items == [(b'b.1', b'woo')]
+        assert list(dber.getTopItemIter(db=db, key=b"a.", start=b"a.3")) == []
+
         assert dber.delTopVal(db, key=b"a.")
         items = [ (key, bytes(val)) for key, val in dber.getTopItemIter(db=db )]
         assert items == [(b'b.1', b'woo')]
@@ -411,6 +418,19 @@ def test_lmdber():
         items = [item for item in dber.getAllOrdItemAllPreIter(db, key=onKey(preC, 1))]
         assert items == []
 
+        # latest entry at or before on for pre
+        assert dber.getOrdItemPreLast(db, preB, 2) == (2, digW)
+        assert dber.getOrdItemPreLast(db, preB, 100) == (4, digY)
+        assert dber.getOrdItemPreLast(db, preB.decode("utf-8"), 100) == (4, digY)
+        assert dber.getOrdItemPreLast(db, preC, 7) == (0, digC)  # past end of db
+        assert dber.delVal(db, keyB1) == True
+        assert dber.delVal(db, keyB2) == True
+        assert dber.getOrdItemPreLast(db, preB, 2) == (0, digU)  # sparse
+        assert dber.delVal(db, keyB0) == True
+        assert dber.getOrdItemPreLast(db, preB, 2) is None  # earlier pre only
+        assert dber.delVal(db, keyA0) == True
+        assert dber.getOrdItemPreLast(db, preB, 2) is None  # start of db
+
 
         # test Vals dup methods.  dup vals are lexocographic
         key = b'A'
@@ -794,5 +814,125 @@ def test_lmdber():
     """ End Test """
 
 
+def test_lmdber_txn():
+    """
+    Test LMDBer .txn transaction scoped batch of writes
+    """
+    with openLMDB() as dber:
+        assert dber._txn is None
+        db = dber.env.open_db(key=b'beep.')
+        dupdb = dber.env.open_db(key=b'boop.', dupsort=True)
+        ordb = dber.env.open_db(key=b'bump.')
+        key = b'A'
+        val = b'whatever'
+
+        with dber.txn() as txn:
+            assert dber._txn is txn
+            assert dber.putVal(db, key, val)
+            assert dber.putIoVals(dupdb, key, [b'z', b'm'])
+            # reads within transaction see uncommitted writes
+            assert bytes(dber.getVal(db, key)) == val
+            assert dber.getIoVals(dupdb, key) == [b'z', b'm']
+            assert dber.appendOrdValPre(ordb, b'B', b'x') == 0
+            assert dber.appendOrdValPre(ordb, b'B', b'y') == 1
+
+            with dber.txn() as inner:  # nested joins outer
+                assert inner is txn
+                assert dber.setVal(db, key, b'changed')
+
+            assert dber._txn is txn
+
+        assert dber._txn is None
+        assert bytes(dber.getVal(db, key)) == b'changed'
+        assert [bytes(val) for val in dber.getIoVals(dupdb, key)] == [b'z', b'm']
+        assert [(on, bytes(val)) for on, val in
+                dber.getAllOrdItemPreIter(ordb, b'B')] == [(0, b'x'), (1, b'y')]
+
+        # exception aborts all writes in the batch
+        with pytest.raises(ValueError):
+            with dber.txn():
+                assert dber.delVal(db, key)
+                assert dber.putIoVals(dupdb, key, [b'a'])
+                raise ValueError("abort")
+
+        assert dber._txn is None
+        assert bytes(dber.getVal(db, key)) == b'changed'
+        assert [bytes(val) for val in dber.getIoVals(dupdb, key)] == [b'z', b'm']
+
+    assert not os.path.exists(dber.path)
+    """ End Test """
+
+
+def test_lmdber_map():
+    """
+    Test LMDBer environment settings and map growth
+    """
+    with openLMDB() as dber:  # defaults
+        assert dber.mapSize == LMDBer.MapSize
+        assert dber.env.info()["map_size"] == LMDBer.MapSize
+        assert dber.mapGrow
+        assert dber.sync and dber.metaSync and dber.readAhead
+        assert not dber.writeMap and not dber.mapAsync
+        assert dber.maxReaders == LMDBer.MaxReaders
+
+    size = 65536
+    with openLMDB(mapSize=size, sync=False, metaSync=False, maxReaders=16) as dber:
+        assert dber.mapSize == size
+        assert not dber.sync and not dber.metaSync
+        assert dber.env.max_readers() == 16
+        db = dber.env.open_db(key=b'beep.')
+        val = b'x' * 4096
+        for i in range(64):  # well past initial map size
+            assert dber.putVal(db, b'%03d' % i, val)
+        assert dber.mapSize > size
+        assert dber.mapSize == dber.env.info()["map_size"]
+        assert dber.cnt(db) == 64
+
+        # outer transaction is aborted then map grown for retry by caller
+        grown = dber.mapSize
+        with pytest.raises(lmdb.MapFullError):
+            with dber.txn():
+                for i in range(64, 64 + 4 * grown // 4096):
+                    dber.putVal(db, b'%06d' % i, val)
+        assert dber._txn is None
+        assert dber.mapSize == 2 * grown
+        assert dber.cnt(db) == 64
+
+        # atomic retries whole batch after growth until it fits
+        tries = []
+
+        def batch(count):
+            tries.append(count)
+            for i in range(64, 64 + count):
+                dber.putVal(db, b'%06d' % i, val)
+            return count
+
+        count = 4 * dber.mapSize // 4096
+        assert dber.atomic(batch, count) == count
+        assert len(tries) > 1
+        assert dber._txn is None
+        assert dber.cnt(db) == 64 + count
+
+        # nested atomic joins outer transaction
+        with dber.txn():
+            assert dber.atomic(dber.putVal, db, b'nest', val)
+            assert dber.getVal(db, b'nest') == val
+        assert dber.getVal(db, b'nest') == val
+
+    with openLMDB(mapSize=size, mapGrow=False) as dber:
+        db = dber.env.open_db(key=b'beep.')
+        with pytest.raises(lmdb.MapFullError):
+            for i in range(64):
+                dber.putVal(db, b'%03d' % i, b'x' * 4096)
+        assert dber.mapSize == size
+
+        with pytest.raises(lmdb.MapFullError):
+            dber.atomic(batch, 64)
+        assert dber._txn is None
+        assert dber.mapSize == size
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_lmdber()
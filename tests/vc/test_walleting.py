@@ -7,6 +7,7 @@ tests.vc.walleting module
 from keri.app import keeping, habbing, signing
 from keri.core import coring, scheming, parsing
 from keri.db import basing
+from keri.vc import walleting
 from keri.vc.proving import credential
 from keri.vdr import verifying, issuing
 
@@ -76,5 +77,77 @@ def test_wallet():
         assert len(schema) == 1
         assert schema[0].qb64 == creder.said
 
-        if __name__ == '__main__':
-            test_wallet()
+
+
+def test_wallet_indexes():
+    sidSalt = coring.Salter(raw=b'0123456789abcdef').qb64
+
+    with habbing.openHby(name="sid", base="test", salt=sidSalt) as sidHby:
+        sidHab = sidHby.makeHab(name="test")
+        schema = "EIZPo6FxMZvZkX-463o9Og3a2NEKEJa-E9J5BXOsdpVg"
+
+        verifier = verifying.Verifier(hab=sidHab)
+        issuer = issuing.Issuer(hab=sidHab, reger=verifier.reger)
+        wallet = walleting.Wallet(reger=verifier.reger)
+
+        creders = []
+        for day in (3, 1, 2):
+            credSubject = dict(
+                d="",
+                i=sidHab.pre,
+                dt="2021-06-0{}T21:26:21.233257+00:00".format(day),
+                LEI="254900OPPU84GM83MG3{}".format(day),
+            )
+            _, d = scheming.Saider.saidify(sad=credSubject, code=coring.MtrDex.Blake3_256, label=scheming.Ids.d)
+            creder = credential(issuer=sidHab.pre,
+                                schema=schema,
+                                subject=d,
+                                status=issuer.regk)
+            issuer.issue(creder=creder)
+            parsing.Parser().parse(ims=signing.ratify(sidHab, serder=creder), vry=verifier)
+            creders.append(creder)
+
+        bydate = [creders[1].said, creders[2].said, creders[0].said]
+        saids = [saider.qb64 for _, saider in verifier.reger.getCredsIter()]
+        assert saids == bydate
+        saids = [saider.qb64 for _, saider in verifier.reger.getCredsIter(issuer=sidHab.pre, subject=sidHab.pre,
+                                                                          registry=issuer.regk, schema=schema,
+                                                                          status="issued")]
+        assert saids == bydate
+        assert list(verifier.reger.getCredsIter(schema="EQ7QPgGGZOKQHYCGp9Phm_EQzKHK1xMv_T9UwPhRwMBE")) == []
+        assert list(verifier.reger.getCredsIter(status="revoked")) == []
+
+        # issuance date range
+        saids = [saider.qb64 for _, saider in verifier.reger.getCredsIter(dta="2021-06-02T00:00:00.000000+00:00",
+                                                                          dtb="2021-06-02T23:00:00.000000+00:00")]
+        assert saids == [creders[2].said]
+
+        # cursor paginated
+        page = wallet.getCredentials(schema=schema, limit=2)
+        assert [creder.said for creder, _, _ in page] == bydate[:2]
+        cursor, (creder, sadsigers, _) = next(wallet.getCredentialsIter(schema=schema))
+        assert creder.said == bydate[0]
+        assert len(sadsigers) == 1
+        cursors = [cursor for cursor, _ in wallet.getCredentialsIter(schema=schema)]
+        page = wallet.getCredentials(schema=schema, limit=2, cursor=cursors[1])
+        assert [creder.said for creder, _, _ in page] == bydate[2:]
+        assert wallet.getCredentials(schema=schema, cursor=cursors[2]) == []
+
+        # status index follows TEL
+        issuer.revoke(creder=creders[2])
+        saids = [saider.qb64 for _, saider in verifier.reger.getCredsIter(status="revoked")]
+        assert saids == [creders[2].said]
+        saids = [saider.qb64 for _, saider in verifier.reger.getCredsIter(schema=schema, status="issued")]
+        assert saids == [creders[1].said, creders[0].said]
+
+        # rebuilt index is the same
+        items = [(keys, saider.qb64) for keys, saider in verifier.reger.cidx.getItemIter()]
+        assert len(items) == 3 * 6
+        verifier.reger.cidx.trim()
+        verifier.reger.reindexCreds()
+        assert [(keys, saider.qb64) for keys, saider in verifier.reger.cidx.getItemIter()] == items
+
+
+if __name__ == '__main__':
+    test_wallet()
+    test_wallet_indexes()
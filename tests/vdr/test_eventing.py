@@ -742,6 +742,30 @@ def test_tevery():
         assert status.ked["et"] == Ilks.rev
         assert status.sn == 1
 
+        # status record maintained by logEvent
+        record = reg.vcss.get(keys=(regk, vcdig.decode("utf-8")))
+        assert (record.sn, record.said, record.ilk) == (1, rev.said, Ilks.rev)
+        assert record.a == dict(s=seqner.sn, d=diger.qb64)
+        assert tev.vcSn(vcdig.decode("utf-8")) == 1
+        assert tev.vcRecord(vcdig.decode("utf-8")) == record
+
+        # relogging earlier event does not regress status
+        tev.logStatus(sn=0, serder=iss, seqner=seqner, saider=diger)
+        assert reg.vcss.get(keys=(regk, vcdig.decode("utf-8"))).sn == 1
+
+        # batch of states in one read transaction
+        other = "EAnotIssuedFromThisRegistryXXXXXXXXXXXXXXXXX"
+        states = tev.vcStates([vcdig.decode("utf-8"), other])
+        assert states[0].ked["et"] == Ilks.rev
+        assert states[0].said == status.said
+        assert states[1] is None
+
+        # missing status record rebuilt from TEL
+        reg.vcss.rem(keys=(regk, vcdig.decode("utf-8")))
+        [status] = tev.vcStates([vcdig.decode("utf-8")])
+        assert status.ked["et"] == Ilks.rev
+        assert reg.vcss.get(keys=(regk, vcdig.decode("utf-8"))) == record
+
 
 def test_tevery_process_escrow():
     with basing.openDB() as db, keeping.openKS() as kpr, viring.openReg() as reg:
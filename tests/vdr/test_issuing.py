@@ -5,8 +5,9 @@ tests.vdr.issuing module
 """
 import pytest
 
+from keri import kering
 from keri.app import habbing, keeping
-from keri.core.coring import Serder
+from keri.core.coring import Serder, Counter, CtrDex, Seqner, Saider
 from keri.db import basing
 from keri.vc import proving
 from keri.vdr import viring
@@ -352,6 +353,126 @@ def test_issuer(mockHelpingNowUTC):
     """ End Test """
 
 
+def test_issuer_batch(mockHelpingNowUTC):
+    with basing.openDB(name="bob") as db, keeping.openKS(name="bob") as kpr, viring.openReg() as reg:
+        hby, hab = buildHab(db, kpr)
+        issuer = Issuer(hab=hab, name="bob", reger=reg, noBackers=True, temp=True)
+        events(issuer)
+        issuer.BatchSize = 2
+
+        creders = []
+        for i in range(5):
+            creders.append(proving.credential(issuer=hab.pre,
+                                              schema="E7brwlefuH-F_KU_FPWAZR78A3pmSVDlnfJUqnm8Lhr4",
+                                              subject=dict(d="", i="EJJR2nmwyYAfSVPzhzS6b5CMZAoTNZH3ULvaU6Z-i0d8",
+                                                           LEI="254900OPPU84GM83MG3{}".format(i)),
+                                              status=issuer.regk))
+        assert len({creder.said for creder in creders}) == 5
+
+        sn = hab.kever.sn
+        assert issuer.issueMany(creders=creders) is True
+        assert hab.kever.sn == sn + 3  # one anchoring event per chunk of BatchSize seals
+
+        # each chunk has one kevt and one send with all of its registry events
+        assert [cue["kin"] for cue in issuer.cues] == ["kevt", "send"] * 3
+        chunks = []
+        while issuer.cues:
+            chunks.append((issuer.cues.popleft()["msg"], issuer.cues.popleft()["msg"]))
+
+        issued = []
+        for (kevt, tevts), size in zip(chunks, (2, 2, 1)):
+            kser = Serder(raw=kevt)
+            assert kser.ked["t"] == "ixn"
+            assert len(kser.ked["a"]) == size
+            for seal in kser.ked["a"]:
+                tser = Serder(raw=tevts)
+                assert tser.ked["t"] == "iss"
+                assert seal == dict(i=tser.pre, s="0", d=tser.said)
+                del tevts[:tser.size]
+                # each registry event has source seal of its anchoring key event attached
+                assert Counter(qb64b=tevts, strip=True).code == CtrDex.SealSourceCouples
+                assert Seqner(qb64b=tevts, strip=True).sn == kser.sn
+                assert Saider(qb64b=tevts, strip=True).qb64 == kser.said
+                assert hab.db.findAnchoringEvent(hab.pre, seal).said == kser.said
+                issued.append(tser.pre)
+            assert not tevts
+
+        # per credential state is the same as issuing one at a time
+        assert issued == [creder.said for creder in creders]
+        tever = issuer.tevers[issuer.regk]
+        for state in tever.vcStates(issued):
+            assert state.ked["et"] == "iss"
+
+        # revoke all in bulk
+        with pytest.raises(kering.ValidationError):  # nothing anchored when any is not issued
+            issuer.revokeMany(creders=creders + [credential(hab=hab, regk=issuer.regk)])
+        assert hab.kever.sn == sn + 3
+        assert not issuer.cues
+
+        issuer.BatchSize = 3
+        assert issuer.revokeMany(creders=creders) is True
+        assert hab.kever.sn == sn + 5
+        assert [cue["kin"] for cue in issuer.cues] == ["kevt", "send"] * 2 + ["status"]
+        for state in tever.vcStates(issued):
+            assert state.ked["et"] == "rev"
+
+        # updated states published as one stream of signed replies
+        cue = issuer.cues[-1]
+        assert cue["baks"] == hab.kever.wits
+        msgs = cue["msg"]
+        states = []
+        while msgs:
+            rpy = Serder(raw=msgs)
+            assert rpy.ked["t"] == "rpy"
+            assert rpy.ked["r"] == "/tsn/credential/{}".format(hab.pre)
+            states.append(rpy.ked["a"])
+            del msgs[:rpy.size]
+            del msgs[:msgs.find(b'{"v"') if b'{"v"' in msgs else len(msgs)]  # strip attachments
+        assert [state["i"] for state in states] == issued
+        assert all(state["et"] == "rev" for state in states)
+
+    """ End Test """
+
+
+def test_issuer_batch_subjects(mockHelpingNowUTC):
+    with basing.openDB(name="bob") as db, keeping.openKS(name="bob") as kpr, viring.openReg() as reg:
+        hby, hab = buildHab(db, kpr)
+        issuer = Issuer(hab=hab, name="bob", reger=reg, noBackers=True, temp=True)
+        events(issuer)
+
+        holders = ["EJJR2nmwyYAfSVPzhzS6b5CMZAoTNZH3ULvaU6Z-i0d8",
+                   "EpDA1n-WiBA0A8YOqnKrB-wWQYYC49i5zY_qrIZIicQg"]
+        dts = ["2021-06-27T21:26:21.233257+00:00", "2021-07-01T12:00:00.000000+00:00"]
+        creders = []
+        for i, holder in enumerate(holders * 2):
+            creders.append(proving.credential(issuer=hab.pre,
+                                              schema="E7brwlefuH-F_KU_FPWAZR78A3pmSVDlnfJUqnm8Lhr4",
+                                              subject=dict(d="", i=holder, dt=dts[i % 2],
+                                                           LEI="254900OPPU84GM83MG3{}".format(i)),
+                                              status=issuer.regk))
+
+        assert issuer.issueMany(creders=creders, dt="2022-01-01T00:00:00.000000+00:00") is True
+
+        # one kevt for the chunk then one send per holder with only its events
+        assert [cue["kin"] for cue in issuer.cues] == ["kevt", "send", "send"]
+        issuer.cues.popleft()
+        for holder, dt in zip(holders, dts):
+            cue = issuer.cues.popleft()
+            assert cue["sub"]["i"] == holder
+            tevts = cue["msg"]
+            tsers = []
+            while tevts:
+                tser = Serder(raw=tevts)
+                del tevts[:tser.size]
+                del tevts[:tevts.find(b'{"v"') if b'{"v"' in tevts else len(tevts)]  # strip attachments
+                tsers.append(tser)
+            assert [tser.ked["i"] for tser in tsers] == [creder.said for creder in creders
+                                                          if creder.subject["i"] == holder]
+            assert all(tser.ked["dt"] == dt for tser in tsers)  # each credential's own dt
+
+    """ End Test """
+
+
 def buildHab(db, ks, name="test"):
     """Utility to setup Habery and Hab for testing purposes
     Returns:
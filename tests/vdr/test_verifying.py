@@ -457,6 +457,42 @@ def test_verifier_chained_credential():
         saider = ianreg.schms.get(vLeiSchema)
         assert saider[0].qb64 == vLeiCreder.said
 
+        # chains expanded as a DAG with cloned nodes cached across calls
+        creds = ianreg.cloneCreds([vLeiCreder.saider, vLeiCreder.saider])
+        assert creds[0] is creds[1]  # each credential cloned once per call
+        assert creds[0]["sad"]["d"] == vLeiCreder.said
+        [qvi] = creds[0]["chains"]
+        assert qvi["sad"]["d"] == creder.said
+        assert qvi["chains"] == []
+        assert qvi["status"]["et"] == coring.Ilks.iss
+        assert set(ianreg.clones) == {vLeiCreder.said, creder.said}
+        node = ianreg.clones[creder.said]
+        cred = ianreg.cloneCreds([creder.saider])[0]
+        assert cred["sad"] == node["sad"] and cred["sad"] is not node["sad"]
+        cred["sad"]["d"] = "changed"  # returned copies do not touch cache
+        cred["status"]["et"] = "changed"
+        cred["sadsigers"].clear()
+        assert node["sad"]["d"] == creder.said
+        cred = ianreg.cloneCreds([creder.saider])[0]
+        assert cred["sad"]["d"] == creder.said
+        assert cred["status"]["et"] == coring.Ilks.iss
+        assert cred["sadsigers"] == node["sadsigers"] != []
+        assert ianreg.cloneCreds([vLeiCreder.saider], depth=0)[0]["chains"] == []
+
+        # TEL update makes cached node stale
+        record = ianreg.vcss.get(keys=(roniss.regk, creder.said))
+        ianreg.vcss.pin(keys=(roniss.regk, creder.said),
+                        val=viring.CredStatusRecord(sn=1, said=record.a["d"], ilk=coring.Ilks.rev,
+                                                    a=record.a))
+        assert ianreg.cloneNode(creder.said) is not node
+        assert ianreg.clones[creder.said]["status"]["et"] == coring.Ilks.rev
+        ianreg.vcss.pin(keys=(roniss.regk, creder.said), val=record)
+
+        # cache is bounded
+        ianreg.CloneCacheSize = 1
+        ianreg.cloneCreds([vLeiCreder.saider])
+        assert list(ianreg.clones) == [creder.said]  # chained node cloned last
+
         # Now lets get Ron's crecential into Vic's Tevers and Database
         vickvy = ceventing.Kevery(db=vic.db, lax=False, local=False)
         victvy = eventing.Tevery(reger=vicreg, db=vic.db, local=False)